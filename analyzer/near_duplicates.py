@@ -0,0 +1,121 @@
+import hashlib
+import threading
+from array import array
+from analyzer.text_analysis import ngrams, tokenize
+
+# Bits in a SimHash fingerprint
+FINGERPRINT_BITS = 64
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """
+    Computes a 64-bit SimHash of a text from its word shingles.
+
+    Texts that share most of their shingles get fingerprints that differ in
+    only a few bits, so near-duplicates are found by Hamming distance.
+    """
+    weights = [0] * FINGERPRINT_BITS
+    tokens = list(tokenize(text))
+    features = ngrams(iter(tokens), min(shingle_size, len(tokens))) if tokens else ()
+    for feature in features:
+        h = _feature_hash(feature)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def article_fingerprint(article: dict) -> int:
+    """
+    Fingerprints the title and content of an extract_article_details result.
+    """
+    return simhash(f"{article.get('title') or ''} {article.get('content') or ''}")
+
+
+class NearDuplicateIndex:
+    """
+    SimHash index with LSH banding for sub-linear near-duplicate lookups.
+
+    Fingerprints are split into bands; two fingerprints within max_distance
+    bits of each other are guaranteed to share at least one band when
+    max_distance < bands, so only items sharing a band are compared.
+    Fingerprints live in one array of unsigned 64-bit integers and each band
+    bucket is an array of 32-bit positions, keeping per-item overhead small.
+
+    Args:
+        bands (int): Number of bands the 64 bits are split into
+        max_distance (int): Largest Hamming distance counted as a duplicate
+    """
+
+    def __init__(self, bands: int = 4, max_distance: int = 3):
+        if FINGERPRINT_BITS % bands:
+            raise ValueError(f"bands must divide {FINGERPRINT_BITS}, got {bands}.")
+        if max_distance >= bands:
+            raise ValueError("max_distance must be smaller than bands to guarantee a shared band.")
+        self.bands = bands
+        self.max_distance = max_distance
+        self._band_bits = FINGERPRINT_BITS // bands
+        self._band_mask = (1 << self._band_bits) - 1
+        self.fingerprints = array("Q")
+        self.keys = []
+        self._buckets = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def _band_values(self, fingerprint: int):
+        for band in range(self.bands):
+            yield band, fingerprint >> (band * self._band_bits) & self._band_mask
+
+    def _add(self, key, fingerprint: int) -> int:
+        position = len(self.fingerprints)
+        self.fingerprints.append(fingerprint)
+        self.keys.append(key)
+        for band, value in self._band_values(fingerprint):
+            self._buckets[band].setdefault(value, array("I")).append(position)
+        return position
+
+    def _query(self, fingerprint: int) -> list:
+        candidates = set()
+        for band, value in self._band_values(fingerprint):
+            candidates.update(self._buckets[band].get(value, ()))
+        matches = []
+        for position in candidates:
+            distance = (self.fingerprints[position] ^ fingerprint).bit_count()
+            if distance <= self.max_distance:
+                matches.append((self.keys[position], distance))
+        return sorted(matches, key=lambda match: match[1])
+
+    def add(self, key, fingerprint: int) -> int:
+        """
+        Adds a fingerprint under key (e.g. the article URL) and returns its position.
+        """
+        with self._lock:
+            return self._add(key, fingerprint)
+
+    def query(self, fingerprint: int) -> list:
+        """
+        Returns (key, distance) pairs of indexed near-duplicates, closest first.
+        """
+        with self._lock:
+            return self._query(fingerprint)
+
+    def find_or_add(self, key, fingerprint: int):
+        """
+        Returns the key of the closest near-duplicate, or adds the fingerprint
+        and returns None when there is none.
+        """
+        with self._lock:
+            matches = self._query(fingerprint)
+            if matches:
+                return matches[0][0]
+            self._add(key, fingerprint)
+            return None
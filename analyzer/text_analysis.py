@@ -1,35 +1,188 @@
 import string
+import heapq
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
+# Strips ASCII punctuation plus the Spanish and typographic marks found in headlines
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation + "¿¡«»“”‘’—–…")
 
-def print_repeated_words(headers, logger, min_repeats=2 ):
+STOPWORDS = {
+    "en": frozenset("""
+        a about after all also an and any are as at be been but by can could did do does for
+        from had has have he her his how i if in into is it its just more most my new no not
+        of on one or our out over she so than that the their them there these they this to
+        up us was we were what when which who why will with would you your
+    """.split()),
+    "es": frozenset("""
+        a al algo ante antes como con contra cual cuando de del desde donde durante e el ella
+        ellos en entre era es esa ese eso esta este esto están fue ha hace han hasta hay la las
+        le les lo los más me mi muy ni no nos o os para pero por porque que quien se ser si
+        sin sobre son su sus también tras un una uno unos y ya
+    """.split()),
+}
+
+
+def tokenize(text: str, stopwords=frozenset()):
     """
-    Prints words that occur more than 'min_repeats' times across the list of headers.
+    Yields lowercase words of a text with punctuation removed, skipping stopwords.
+    """
+    for word in text.lower().translate(PUNCTUATION_TABLE).split():
+        if word not in stopwords:
+            yield word
+
+
+def ngrams(tokens, n: int = 1):
+    """
+    Yields space-joined n-grams from a token iterator without materializing it.
+    """
+    if n == 1:
+        yield from tokens
+        return
+    window = deque(maxlen=n)
+    for token in tokens:
+        window.append(token)
+        if len(window) == n:
+            yield " ".join(window)
+
+
+class TermCounter:
     """
-    # We'll convert to lowercase and remove punctuation manually, then count words
-    
-    all_words = []
+    Streaming term counter for n-grams over many texts.
+
+    Tokens are counted as they are produced, without building a word list.
+    Counters from parallel workers can be combined with merge. With max_terms
+    set, the rarest terms are pruned whenever the vocabulary grows past twice
+    that size, which keeps memory bounded at the cost of approximate counts
+    for infrequent terms.
+
+    Args:
+        n (int): N-gram size (1 counts single words)
+        language (str): 'en' or 'es' to drop that language's stopwords, None to keep all words
+        max_terms (int): Optional bound on the number of distinct terms kept
+    """
+
+    def __init__(self, n: int = 1, language: str = None, max_terms: int = None):
+        self.n = n
+        self.language = language
+        self.max_terms = max_terms
+        self.counts = Counter()
+        self.texts = 0
+
+    @property
+    def stopwords(self):
+        return STOPWORDS.get(self.language, frozenset())
+
+    def add(self, text: str):
+        """
+        Counts the n-grams of one text.
+        """
+        self.counts.update(ngrams(tokenize(text, self.stopwords), self.n))
+        self.texts += 1
+        self._prune()
+
+    def update(self, texts):
+        """
+        Counts the n-grams of every text in an iterable.
+        """
+        stopwords = self.stopwords
+        for text in texts:
+            self.counts.update(ngrams(tokenize(text, stopwords), self.n))
+            self.texts += 1
+            self._prune()
+        return self
+
+    def merge(self, other: "TermCounter"):
+        """
+        Adds the counts of another counter, e.g. one produced by a worker process.
+        """
+        self.counts.update(other.counts)
+        self.texts += other.texts
+        self._prune()
+        return self
+
+    def _prune(self):
+        if self.max_terms and len(self.counts) > 2 * self.max_terms:
+            self.counts = Counter(dict(heapq.nlargest(self.max_terms, self.counts.items(), key=lambda kv: kv[1])))
 
-    # Prepare a translation table for stripping punctuation
-    table = str.maketrans('', '', string.punctuation)
+    def top_k(self, k: int = 10) -> list:
+        """
+        Returns the k most frequent terms as (term, count) pairs using a heap.
+        """
+        return heapq.nlargest(k, self.counts.items(), key=lambda kv: kv[1])
 
-    for header in headers:
-        header_lower = header.lower()
-        header_clean = header_lower.translate(table)
-        words = header_clean.split()
-        all_words.extend(words)
+    def repeated(self, min_repeats: int = 2) -> list:
+        """
+        Returns (term, count) pairs occurring more than min_repeats times, in first-seen order.
+        """
+        return [(term, count) for term, count in self.counts.items() if count > min_repeats]
 
-    word_counts = {}
-    for word in all_words:
-        if word in word_counts:
-            word_counts[word] += 1
-        else:
-            word_counts[word] = 1
+    def to_dict(self, k: int = 10, min_repeats: int = 2) -> dict:
+        """
+        Returns a structured summary of the counts.
+        """
+        return {
+            "n": self.n,
+            "language": self.language,
+            "texts": self.texts,
+            "distinct_terms": len(self.counts),
+            "total_terms": sum(self.counts.values()),
+            "top": self.top_k(k),
+            "repeated": self.repeated(min_repeats),
+        }
+
+
+def _count_chunk(texts: list, n: int, language: str, max_terms: int) -> TermCounter:
+    return TermCounter(n, language, max_terms).update(texts)
+
+
+def count_terms_parallel(texts, n: int = 1, language: str = None, max_terms: int = None,
+                         workers: int = 4, chunk_size: int = 10_000) -> TermCounter:
+    """
+    Counts n-grams over an iterable of texts in worker processes.
+
+    Texts are read in chunks, at most two chunks per worker are in flight,
+    and partial counters are merged as they finish, so memory stays bounded
+    however long the iterable is.
+
+    Returns:
+        TermCounter: The merged counts.
+    """
+    total = TermCounter(n, language, max_terms)
+    texts = iter(texts)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(texts, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_count_chunk, chunk, n, language, max_terms))
+            if not pending:
+                break
+            total.merge(pending.popleft().result())
+    return total
+
+
+def analyze_texts(texts, n: int = 1, language: str = None, k: int = 10, min_repeats: int = 2, max_terms: int = None) -> dict:
+    """
+    Counts the n-grams of texts and returns the to_dict summary.
+    """
+    return TermCounter(n, language, max_terms).update(texts).to_dict(k, min_repeats)
+
+
+def print_repeated_words(headers, logger, min_repeats=2 ):
+    """
+    Prints words that occur more than 'min_repeats' times across the list of headers.
+
+    Returns:
+        list: (word, count) pairs that were printed.
+    """
+    repeated = TermCounter().update(headers).repeated(min_repeats)
 
     # Print words that appear more than 'min_repeats' times
-    found = False
-    for word, count in word_counts.items():
-        if count > min_repeats:
-            logger.info(f"'{word}' occurs {count} times.")
-            found = True
-    if not found:
+    for word, count in repeated:
+        logger.info("'%s' occurs %d times.", word, count)
+    if not repeated:
         logger.info("No words repeated more than twice.")
+    return repeated
@@ -0,0 +1,285 @@
+import os
+import time
+import threading
+import numpy as np
+from analyzer.text_analysis import TermCounter
+
+# Default directory of the trend store
+TRENDS_DIR = "output/trends"
+
+SECONDS_PER_DAY = 86400
+
+# Files of the store and the dtype of their elements; all are append-only.
+# Runs are stored like the rows of a CSR matrix: the counts of run i are
+# term_ids/counts[run_ptr[i]:run_ptr[i + 1]].
+STORE_FILES = {
+    "vocab": ("vocab.bin", np.uint8),  # UTF-8 terms, concatenated
+    "vocab_offsets": ("vocab_offsets.i64", np.dtype("<i8")),  # end offset of each term in vocab.bin
+    "term_ids": ("term_ids.i32", np.dtype("<i4")),
+    "counts": ("counts.i32", np.dtype("<i4")),
+    "run_ptr": ("run_ptr.i64", np.dtype("<i8")),
+    "run_totals": ("run_totals.i64", np.dtype("<i8")),  # terms counted in each run
+    "run_times": ("run_times.f64", np.dtype("<f8")),  # written last: a run exists once its time does
+}
+
+
+class TrendStore:
+    """
+    On-disk store of per-run term counts for finding rising terms over time.
+
+    The vocabulary is a byte array of UTF-8 terms plus an array of their end
+    offsets, and the counts form a sparse run x term matrix in CSR layout.
+    Every array lives in its own append-only file that queries read through
+    a memory map, so opening the store and querying a window touch only the
+    runs and terms involved. Appending a run writes a few small arrays;
+    the term -> id dictionary is only built when the first run is added.
+
+    Runs must be added in time order. A run is committed by writing its
+    time last, so a partially written run is discarded on the next open.
+    One process may write to a store at a time.
+
+    Args:
+        root (str): Directory of the store (default 'output/trends')
+    """
+
+    def __init__(self, root: str = TRENDS_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._term_ids = None
+        self._repair()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.root, STORE_FILES[name][0])
+
+    def _length(self, name: str) -> int:
+        path = self._path(name)
+        return os.path.getsize(path) // np.dtype(STORE_FILES[name][1]).itemsize if os.path.exists(path) else 0
+
+    def _array(self, name: str, length: int = None) -> np.ndarray:
+        dtype = np.dtype(STORE_FILES[name][1])
+        length = self._length(name) if length is None else length
+        if not length:
+            return np.empty(0, dtype)
+        return np.memmap(self._path(name), dtype=dtype, mode="r", shape=(length,))
+
+    def _truncate(self, name: str, length: int):
+        path = self._path(name)
+        size = length * np.dtype(STORE_FILES[name][1]).itemsize
+        if not os.path.exists(path) or os.path.getsize(path) != size:
+            with open(path, "ab") as f:
+                f.truncate(size)
+
+    def _repair(self):
+        # Cuts every file back to the last committed run and term, dropping
+        # the partial element a torn append may have left at the end
+        runs = self._length("run_times")
+        self._truncate("run_times", runs)
+        if not self._length("run_ptr"):
+            with open(self._path("run_ptr"), "wb") as f:
+                f.write(np.zeros(1, STORE_FILES["run_ptr"][1]).tobytes())
+        self._truncate("run_ptr", runs + 1)
+        self._truncate("run_totals", runs)
+        nnz = int(self._array("run_ptr")[-1])
+        self._truncate("term_ids", nnz)
+        self._truncate("counts", nnz)
+        terms = self._length("vocab_offsets")
+        self._truncate("vocab_offsets", terms)
+        self._truncate("vocab", int(self._array("vocab_offsets")[-1]) if terms else 0)
+        self.runs = runs
+        self.terms = terms
+
+    def __len__(self) -> int:
+        return self.runs
+
+    def term(self, term_id: int) -> str:
+        """
+        Returns the term with the given id.
+        """
+        offsets = self._array("vocab_offsets", self.terms)
+        start = int(offsets[term_id - 1]) if term_id else 0
+        return bytes(self._array("vocab")[start:int(offsets[term_id])]).decode("utf-8")
+
+    def term_id(self, term: str) -> int:
+        """
+        Returns the id of a term, or None when it was never counted.
+        """
+        return self._vocabulary().get(term)
+
+    def _vocabulary(self) -> dict:
+        if self._term_ids is None:
+            offsets = self._array("vocab_offsets", self.terms)
+            blob = bytes(self._array("vocab")[:int(offsets[-1])]) if self.terms else b""
+            starts = [0] + offsets[:-1].tolist()
+            self._term_ids = {blob[start:end].decode("utf-8"): idx for idx, (start, end) in enumerate(zip(starts, offsets.tolist()))}
+        return self._term_ids
+
+    def add_run(self, counts: dict, timestamp: float = None) -> int:
+        """
+        Appends the term counts of one run.
+
+        Args:
+            counts (dict): {term: count}, e.g. TermCounter.counts
+            timestamp (float): Time of the run in epoch seconds (default: now);
+                must not be earlier than the last run
+
+        Returns:
+            int: Index of the new run.
+        """
+        timestamp = time.time() if timestamp is None else float(timestamp)
+        with self._lock:
+            if self.runs and timestamp < float(self._array("run_times", self.runs)[-1]):
+                raise ValueError("Runs must be added in time order.")
+            vocabulary = self._vocabulary()
+            new_terms = [term for term in counts if term not in vocabulary]
+            if new_terms:
+                encoded = [term.encode("utf-8") for term in new_terms]
+                end = int(self._array("vocab_offsets", self.terms)[-1]) if self.terms else 0
+                offsets = end + np.cumsum([len(term) for term in encoded], dtype=np.int64)
+                with open(self._path("vocab"), "ab") as f:
+                    f.write(b"".join(encoded))
+                with open(self._path("vocab_offsets"), "ab") as f:
+                    f.write(offsets.astype(STORE_FILES["vocab_offsets"][1]).tobytes())
+                for term in new_terms:
+                    vocabulary[term] = self.terms
+                    self.terms += 1
+
+            items = [(vocabulary[term], count) for term, count in counts.items() if count > 0]
+            term_ids = np.fromiter((term_id for term_id, _ in items), STORE_FILES["term_ids"][1], len(items))
+            values = np.fromiter((count for _, count in items), STORE_FILES["counts"][1], len(items))
+            order = np.argsort(term_ids, kind="stable")
+            nnz = int(self._array("run_ptr", self.runs + 1)[-1]) + len(items)
+            self._append("term_ids", term_ids[order])
+            self._append("counts", values[order])
+            self._append("run_totals", np.array([values.sum()]))
+            self._append("run_ptr", np.array([nnz]))
+            self._append("run_times", np.array([timestamp]))
+            self.runs += 1
+            return self.runs - 1
+
+    def _append(self, name: str, values: np.ndarray):
+        with open(self._path(name), "ab") as f:
+            f.write(values.astype(STORE_FILES[name][1]).tobytes())
+
+    def add_texts(self, texts, timestamp: float = None, n: int = 1, language: str = "en") -> int:
+        """
+        Counts the n-grams of texts with TermCounter and appends them as one run.
+        """
+        return self.add_run(TermCounter(n, language).update(texts).counts, timestamp)
+
+    def _run_range(self, start: float, end: float) -> tuple:
+        times = self._array("run_times", self.runs)
+        return int(np.searchsorted(times, start, "left")), int(np.searchsorted(times, end, "right"))
+
+    def window_counts(self, start: float, end: float) -> tuple:
+        """
+        Sums the counts of the runs with start <= time <= end.
+
+        Returns:
+            (np.ndarray, int, int): Count per term id, terms counted in total,
+            and the number of runs in the window.
+        """
+        first, last = self._run_range(start, end)
+        ptr = self._array("run_ptr", self.runs + 1)
+        lo, hi = int(ptr[first]), int(ptr[last])
+        term_ids = self._array("term_ids", hi)[lo:hi]
+        counts = self._array("counts", hi)[lo:hi]
+        totals = np.bincount(term_ids, weights=counts, minlength=self.terms) if hi > lo else np.zeros(self.terms)
+        return totals, int(self._array("run_totals", self.runs)[first:last].sum()), last - first
+
+    def top_rising(self, window_days: float = 7, baseline_days: float = 28, k: int = 20, now: float = None,
+                   min_count: int = 3, smoothing: float = 1.0) -> list[dict]:
+        """
+        Finds the terms that rose the most in the last window_days compared
+        to the baseline_days before them.
+
+        Each term's baseline count is scaled to the size of the window to get
+        its expected window count. Terms are ranked by how far their window
+        count exceeds that, in Poisson standard deviations, so a common term
+        that doubled outranks a rare term seen three times instead of never.
+        Terms without a baseline rank by how often they occur.
+
+        Args:
+            window_days (float): Length of the recent window
+            baseline_days (float): Length of the baseline period before it
+            k (int): Number of terms to return
+            now (float): End of the window in epoch seconds (default: now)
+            min_count (int): Smallest window count of a returned term
+            smoothing (float): Pseudo-count added to every expected count
+
+        Returns:
+            List[dict]: { 'term', 'window_count', 'baseline_count', 'expected',
+            'ratio', 'score' } by descending score, where ratio is the log2 of
+            the smoothed window count over the expected count.
+        """
+        now = time.time() if now is None else now
+        window_start = now - window_days * SECONDS_PER_DAY
+        window, window_total, _ = self.window_counts(window_start, now)
+        baseline, baseline_total, _ = self.window_counts(window_start - baseline_days * SECONDS_PER_DAY,
+                                                         np.nextafter(window_start, -np.inf))
+        if not window_total:
+            return []
+        expected = baseline * (window_total / baseline_total) if baseline_total else np.zeros_like(window)
+        scores = (window - expected) / np.sqrt(expected + smoothing)
+        scores[window < min_count] = -np.inf
+        k = min(k, int(np.count_nonzero(np.isfinite(scores))))
+        if not k:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            {
+                "term": self.term(int(term_id)),
+                "window_count": int(window[term_id]),
+                "baseline_count": int(baseline[term_id]),
+                "expected": round(float(expected[term_id]), 2),
+                "ratio": round(float(np.log2((window[term_id] + smoothing) / (expected[term_id] + smoothing))), 3),
+                "score": round(float(scores[term_id]), 3),
+            }
+            for term_id in top
+        ]
+
+    def series(self, term: str, start: float = None, end: float = None) -> tuple:
+        """
+        Returns (run times, counts) of one term over the runs in [start, end].
+        """
+        first, last = self._run_range(-np.inf if start is None else start, np.inf if end is None else end)
+        term_id = self.term_id(term)
+        times = np.array(self._array("run_times", self.runs)[first:last])
+        counts = np.zeros(last - first, dtype=np.int64)
+        if term_id is None or first == last:
+            return times, counts
+        ptr = np.asarray(self._array("run_ptr", self.runs + 1)[first:last + 1])
+        lo, hi = int(ptr[0]), int(ptr[-1])
+        positions = lo + np.flatnonzero(self._array("term_ids", hi)[lo:hi] == term_id)
+        # A term occurs at most once per run, so each position maps to its own row
+        rows = np.searchsorted(ptr, positions, "right") - 1
+        counts[rows] = self._array("counts", hi)[positions]
+        return times, counts
+
+    def to_dict(self) -> dict:
+        """
+        Summary of the store for reporting.
+        """
+        times = self._array("run_times", self.runs)
+        return {
+            "root": self.root,
+            "runs": self.runs,
+            "terms": self.terms,
+            "entries": int(self._array("run_ptr", self.runs + 1)[-1]),
+            "first_run": float(times[0]) if self.runs else None,
+            "last_run": float(times[-1]) if self.runs else None,
+        }
+
+
+def log_rising_terms(store: TrendStore, logger, window_days: float = 7, baseline_days: float = 28, k: int = 10) -> list:
+    """
+    Logs the top rising terms of a store and returns them.
+    """
+    rising = store.top_rising(window_days, baseline_days, k)
+    for entry in rising:
+        logger.info("Rising term '%s': %d in the last %g days, %.1f expected from the %g days before (score %.1f).",
+                    entry["term"], entry["window_count"], window_days, entry["expected"], baseline_days, entry["score"])
+    if not rising:
+        logger.info("No rising terms in the last %g days.", window_days)
+    return rising
@@ -0,0 +1,102 @@
+"""
+Cold-start regression benchmark of the cli.py subcommands.
+
+Starts a fresh interpreter per run and reports the median wall time of each
+command, plus the modules it imported (from python -X importtime). Fails
+when a command that must stay light imports Selenium or pyarrow, or when a
+median exceeds --max-ms.
+
+Usage:
+    python -m benchmarks.bench_cold_start [--runs 7] [--max-ms 400] [--output benchmarks/cold_start.jsonl]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CLI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cli.py")
+
+# Heavy modules that only the scrape command (and Arrow output) may load
+HEAVY_MODULES = ("selenium", "pyarrow")
+
+
+def commands(tmp: str) -> dict:
+    return {
+        "help": ["--help"],
+        "scrape --help": ["scrape", "--help"],
+        "download --help": ["download", "--help"],
+        "translate --help": ["translate", "--help"],
+        "analyze --help": ["analyze", "--help"],
+        "replay --help": ["replay", "--help"],
+        "trends --help": ["trends", "--help"],
+        "analyze": ["analyze", "la subida de la vivienda", "la vivienda y el alquiler"],
+        "replay": ["replay", "--archive", os.path.join(tmp, "snapshots")],
+    }
+
+
+def imported_modules(args: list) -> set:
+    """
+    Top-level packages imported by a command, from python -X importtime.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", CLI, *args],
+                            capture_output=True, text=True, cwd=os.path.dirname(CLI))
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            modules.add(name.split(".")[0])
+    return modules
+
+
+def time_command(args: list, runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, CLI, *args], capture_output=True, cwd=os.path.dirname(CLI))
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail when a median exceeds this")
+    parser.add_argument("--output", help="Append the report as one JSON line to this file")
+    args = parser.parse_args()
+
+    interpreter = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"])
+        interpreter.append(time.perf_counter() - start)
+
+    report = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "python": sys.version.split()[0],
+              "interpreter_ms": round(1000 * statistics.median(interpreter), 1), "commands": {}}
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, command in commands(tmp).items():
+            samples = time_command(command, args.runs)
+            heavy = sorted(set(HEAVY_MODULES) & imported_modules(command))
+            median_ms = 1000 * statistics.median(samples)
+            report["commands"][name] = {"median_ms": round(median_ms, 1), "max_ms": round(1000 * max(samples), 1),
+                                        "heavy_imports": heavy}
+            if heavy:
+                failures.append(f"{name} imports {', '.join(heavy)}")
+            if args.max_ms is not None and median_ms > args.max_ms:
+                failures.append(f"{name} took {median_ms:.0f} ms (limit {args.max_ms:.0f} ms)")
+    report["failures"] = failures
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report) + "\n")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
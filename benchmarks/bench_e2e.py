@@ -0,0 +1,180 @@
+"""
+End-to-end offline benchmark of the scraper against the local fixture site.
+
+Runs is_spanish_website, go_to_opinion_section, get_first_n_opinion_articles,
+extract_article_details, download_image and translate_text (against the
+stand-in translation API) and reports per-stage p50/p95 latency, article
+throughput and peak RSS as JSON. With --output, the report is appended as
+one line to a JSON Lines file so runs can be compared over time.
+
+Usage:
+    python -m benchmarks.bench_e2e --browser chrome --runs 3 --articles 10 --latency 0.02
+    python -m benchmarks.bench_e2e --http-only --output benchmarks/results.jsonl
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from benchmarks.fixture_server import start_fixture_server
+from translator.api import translate_text
+from utils.image_downloader import download_image
+
+
+def percentile(samples: list, pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of samples.
+    """
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct * len(ordered) / 100) - 1))
+    return ordered[rank]
+
+
+def peak_rss_bytes() -> dict:
+    """
+    Peak resident set size of this process and of its waited-for children
+    (the browser driver processes once they have exited).
+    """
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale,
+    }
+
+
+class StageTimer:
+    """
+    Collects latency samples per stage.
+    """
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    def time(self, stage, fn, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.samples[stage].append(time.perf_counter() - start)
+
+    def summary(self) -> dict:
+        return {
+            stage: {
+                "count": len(samples),
+                "p50_ms": round(percentile(samples, 50) * 1000, 2),
+                "p95_ms": round(percentile(samples, 95) * 1000, 2),
+                "total_s": round(sum(samples), 4),
+            }
+            for stage, samples in self.samples.items()
+        }
+
+
+def run_browser(timer, base_url, args, logger, image_dir):
+    from scraper.browser import get_webdriver
+    from scraper.elpais import (
+        extract_article_details,
+        get_first_n_opinion_articles,
+        go_to_opinion_section,
+        is_spanish_website,
+    )
+
+    driver = timer.time("get_webdriver", get_webdriver, args.browser, fast_load=args.fast_load)
+    try:
+        for _ in range(args.runs):
+            driver.get(f"{base_url}/")
+            timer.time("is_spanish_website", is_spanish_website, driver, logger)
+            timer.time("go_to_opinion_section", go_to_opinion_section, driver, logger, opinion_url=f"{base_url}/opinion/")
+            links = timer.time("get_first_n_opinion_articles", get_first_n_opinion_articles, driver, logger,
+                               n=args.articles, batched=args.batched)
+            articles = [
+                timer.time("extract_article_details", extract_article_details, driver, link["url"], logger,
+                           batched=args.batched)
+                for link in links
+            ]
+            run_downloads_and_translation(timer, articles, base_url, logger, image_dir)
+    finally:
+        driver.quit()
+    return args.runs * args.articles
+
+
+def run_http(timer, base_url, args, logger, image_dir):
+    from scraper.static import create_http_session, fetch_article_static
+
+    session = create_http_session()
+    for _ in range(args.runs):
+        urls = [f"{base_url}/articles/{idx}.html" for idx in range(1, args.articles + 1)]
+        articles = [timer.time("fetch_article_static", fetch_article_static, session, url, logger) for url in urls]
+        run_downloads_and_translation(timer, articles, base_url, logger, image_dir)
+    return args.runs * args.articles
+
+
+def run_downloads_and_translation(timer, articles, base_url, logger, image_dir):
+    for idx, article in enumerate(articles):
+        if article["cover_image_url"]:
+            timer.time("download_image", download_image, article["cover_image_url"],
+                       os.path.join(image_dir, f"article_{idx + 1}_cover.jpg"), logger)
+    titles = [article["title"] for article in articles]
+    timer.time("translate_text", translate_text, titles, logger, "es", "en", url=f"{base_url}/t")
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--http-only", action="store_true", help="Skip the browser stages and use the HTTP extractor")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--articles", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Injected server latency in seconds")
+    parser.add_argument("--batched", action="store_true", help="Use the single-round-trip extraction mode")
+    parser.add_argument("--fast-load", action="store_true", help="Use the fast-load browser profile")
+    parser.add_argument("--fixtures", help="Directory of recorded pages")
+    parser.add_argument("--output", help="Append the report to this JSON Lines file")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("bench")
+    os.environ.setdefault("RAPIDAPI_KEY", "benchmark")
+    server_kwargs = {"fixtures_dir": args.fixtures} if args.fixtures else {}
+    server, base_url = start_fixture_server(latency=args.latency, **server_kwargs)
+    timer = StageTimer()
+    try:
+        with tempfile.TemporaryDirectory() as image_dir:
+            start = time.perf_counter()
+            runner = run_http if args.http_only else run_browser
+            articles = runner(timer, base_url, args, logger, image_dir)
+            elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "mode": "http" if args.http_only else args.browser,
+        "options": {key: value for key, value in vars(args).items() if key != "output"},
+        "articles": articles,
+        "seconds": round(elapsed, 4),
+        "articles_per_second": round(articles / elapsed, 2),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "stages": timer.summary(),
+    }
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report) + "\n")
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares Selenium extraction with the HTTP-first extractor against a local fixture server.
+With --browser, the Selenium path is timed both per-field and batched, and
+the WebDriver commands sent per article are reported for each mode.
+
+Usage:
+    python -m benchmarks.bench_extraction --articles 50 --latency 0.05 [--browser chrome]
+"""
+import argparse
+import json
+import logging
+import time
+from benchmarks.fixture_server import start_fixture_server
+from scraper.static import create_http_session, extract_articles_http
+
+
+def run_http(urls, logger, workers):
+    session = create_http_session(pool_size=workers)
+    start = time.perf_counter()
+    results = extract_articles_http(urls, logger, session=session, max_workers=workers)
+    return time.perf_counter() - start, results
+
+
+def run_selenium(urls, logger, browser, batched):
+    from scraper.browser import get_webdriver
+    from scraper.commands import CommandCounter
+    from scraper.elpais import extract_article_details
+
+    driver = get_webdriver(browser)
+    try:
+        start = time.perf_counter()
+        with CommandCounter(driver) as commands:
+            results = [extract_article_details(driver, url, logger, batched=batched) for url in urls]
+        return time.perf_counter() - start, results, commands
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05, help="Injected server latency in seconds")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--browser", help="Also time the Selenium path with this browser")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("bench")
+    server, base_url = start_fixture_server(latency=args.latency)
+    urls = [f"{base_url}/articles/{idx}.html" for idx in range(1, args.articles + 1)]
+    report = {"articles": args.articles, "latency": args.latency}
+    try:
+        elapsed, results = run_http(urls, logger, args.workers)
+        report["http_seconds"] = round(elapsed, 4)
+        report["http_complete"] = sum(1 for r in results if r["title"] and r["content"])
+        if args.browser:
+            for mode, batched in (("selenium", False), ("selenium_batched", True)):
+                elapsed, results, commands = run_selenium(urls, logger, args.browser, batched)
+                report[f"{mode}_seconds"] = round(elapsed, 4)
+                report[f"{mode}_commands_per_article"] = round(commands.total / len(urls), 2)
+                report[f"{mode}_commands"] = dict(commands.counts)
+            report["speedup"] = round(report["selenium_seconds"] / report["http_seconds"], 2)
+    finally:
+        server.shutdown()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
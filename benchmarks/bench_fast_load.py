@@ -0,0 +1,63 @@
+"""
+Measures page-load time and bytes transferred per article with and without
+the fast-load profile of get_webdriver.
+
+Usage:
+    python -m benchmarks.bench_fast_load --browser chrome URL [URL ...]
+
+Without URLs, articles from the local fixture server are used.
+"""
+import argparse
+import json
+import statistics
+import time
+from benchmarks.fixture_server import start_fixture_server
+from scraper.browser import get_webdriver, page_load_metrics
+
+
+def measure(browser, urls, fast_load):
+    driver = get_webdriver(browser, fast_load=fast_load)
+    try:
+        samples = []
+        for url in urls:
+            start = time.perf_counter()
+            driver.get(url)
+            elapsed = time.perf_counter() - start
+            metrics = page_load_metrics(driver)
+            samples.append({"url": url, "get_seconds": elapsed, **metrics})
+        return {
+            "median_get_seconds": round(statistics.median(s["get_seconds"] for s in samples), 4),
+            "median_transfer_bytes": statistics.median(s["transfer_bytes"] for s in samples),
+            "median_resources": statistics.median(s["resources"] for s in samples),
+            "samples": samples,
+        }
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("urls", nargs="*")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--articles", type=int, default=10, help="Fixture articles when no URLs are given")
+    args = parser.parse_args()
+
+    server = None
+    urls = args.urls
+    if not urls:
+        server, base_url = start_fixture_server()
+        urls = [f"{base_url}/articles/{idx}.html" for idx in range(1, args.articles + 1)]
+    try:
+        report = {
+            "browser": args.browser,
+            "default": measure(args.browser, urls, fast_load=False),
+            "fast_load": measure(args.browser, urls, fast_load=True),
+        }
+    finally:
+        if server:
+            server.shutdown()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
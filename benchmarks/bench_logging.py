@@ -0,0 +1,122 @@
+"""
+Measures the logging cost per scraped article on the scraping threads.
+
+Compares the previous synchronous FileHandler session logger with the
+queue-based one from utils.logging, with several threads each logging the
+records local.py writes per article. --write-delay adds a sleep to every
+file write to simulate a slow disk. Also times a filtered-out debug call
+built with an f-string against a lazy %-style one.
+
+Usage:
+    python -m benchmarks.bench_logging --threads 8 --articles 500 [--write-delay 0.0005]
+"""
+import argparse
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import timeit
+from utils.logging import close_session_logger, setup_session_logger, TEXT_FORMAT
+
+CONTENT = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40
+
+
+class FakeDriver:
+    def __init__(self, name):
+        self.capabilities = {"platformName": "bench", "browserName": name, "browserVersion": "1"}
+
+
+def sync_logger(logfile):
+    """
+    The setup_session_logger implementation this benchmark compares against.
+    """
+    logger = logging.getLogger(f"sync:{logfile}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    fh = logging.FileHandler(logfile, mode="w")
+    fh.setFormatter(logging.Formatter(TEXT_FORMAT))
+    logger.addHandler(fh)
+    return logger
+
+
+def slow_down(handlers, delay):
+    for handler in handlers:
+        emit = handler.emit
+
+        def slow_emit(record, emit=emit):
+            time.sleep(delay)
+            emit(record)
+
+        handler.emit = slow_emit
+
+
+def log_articles(logger, articles, lazy, samples):
+    for idx in range(articles):
+        start = time.perf_counter()
+        if lazy:
+            logger.info("\nArticle %d (%s) -\nTitle: %s\nContent: %s", idx + 1, "new", "Título", CONTENT)
+            logger.info("Article %d - Spanish: %s | English: %s", idx + 1, "Título", "Title")
+        else:
+            logger.info(f"\nArticle {idx + 1} (new) -\nTitle: Título\nContent: {CONTENT}")
+            logger.info(f"Article {idx + 1} - Spanish: Título | English: Title")
+        samples.append(time.perf_counter() - start)
+
+
+def run(logger, threads, articles, lazy):
+    samples = []
+    workers = [threading.Thread(target=log_articles, args=(logger, articles, lazy, samples)) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    caller_seconds = time.perf_counter() - start
+    samples.sort()
+    return {
+        "mean_us_per_article": round(sum(samples) / len(samples) * 1e6, 2),
+        "p99_us_per_article": round(samples[int(len(samples) * 0.99)] * 1e6, 2),
+        "threads_seconds": round(caller_seconds, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--articles", type=int, default=500, help="Articles logged per thread")
+    parser.add_argument("--write-delay", type=float, default=0.0, help="Seconds added to every file write")
+    args = parser.parse_args()
+
+    report = {"threads": args.threads, "articles_per_thread": args.articles, "write_delay": args.write_delay}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            os.makedirs("logs")
+            logger = sync_logger("logs/sync.log")
+            slow_down(logger.handlers, args.write_delay)
+            report["sync_file_handler"] = run(logger, args.threads, args.articles, lazy=False)
+
+            logger = setup_session_logger(FakeDriver("queue"), console=False)
+            from utils.logging import _listeners
+            slow_down(_listeners[logger.name].handlers, args.write_delay)
+            report["queue_listener"] = run(logger, args.threads, args.articles, lazy=True)
+            start = time.perf_counter()
+            close_session_logger(logger)
+            report["queue_listener"]["drain_seconds"] = round(time.perf_counter() - start, 4)
+        finally:
+            os.chdir(cwd)
+
+    quiet = logging.getLogger("bench.quiet")
+    quiet.setLevel(logging.INFO)
+    title = "Título"
+    report["filtered_debug_ns"] = {
+        "f_string": round(timeit.timeit(lambda: quiet.debug(f"Title: {title} Content: {CONTENT}"), number=200_000) / 200_000 * 1e9, 1),
+        "lazy": round(timeit.timeit(lambda: quiet.debug("Title: %s Content: %s", title, CONTENT), number=200_000) / 200_000 * 1e9, 1),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmarks re-extraction of archived pages with replay_extract.
+
+Fills a temporary SnapshotArchive with fixture article pages (or uses an
+existing archive), then times the archive reads alone and the full replay.
+
+Usage:
+    python -m benchmarks.bench_replay --pages 5000 [--workers 4] [--archive output/snapshots]
+"""
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from benchmarks.fixture_server import render_article
+from scraper.snapshots import SnapshotArchive, replay_extract
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--archive", help="Replay an existing archive instead of a generated one")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("bench")
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = SnapshotArchive(args.archive or tmp)
+        report = {}
+        if not args.archive:
+            start = time.perf_counter()
+            for idx in range(1, args.pages + 1):
+                archive.add(f"https://elpais.com/opinion/{idx}.html", render_article(idx), {"status": 200})
+            report["write_seconds"] = round(time.perf_counter() - start, 3)
+        report["pages"] = len(archive)
+        report["archive_bytes"] = os.path.getsize(archive.data_path)
+
+        start = time.perf_counter()
+        for _ in archive.records():
+            pass
+        report["read_seconds"] = round(time.perf_counter() - start, 3)
+
+        start = time.perf_counter()
+        results = replay_extract(archive, logger, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        report["replay_seconds"] = round(elapsed, 3)
+        report["pages_per_second"] = round(len(results) / elapsed, 1)
+        report["missing_title"] = sum(1 for result in results if not result["title"])
+        archive.close()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
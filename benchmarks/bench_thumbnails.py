@@ -0,0 +1,72 @@
+"""
+Benchmarks thumbnail generation with ThumbnailPool.
+
+Resizes the images of a directory (by default the image store, or generated
+1600x900 JPEGs when it has none) into a temporary directory and reports
+bytes before and after, CPU time per image and wall time per worker count.
+
+Usage:
+    python -m benchmarks.bench_thumbnails [--images output/images] [--workers 1 2 4] [--format WEBP] [--quality 75]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from utils.thumbnails import Image, ThumbnailPool, thumbnails_supported
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".gif")
+
+
+def find_images(root: str) -> list:
+    paths = []
+    for dirpath, _, filenames in os.walk(root):
+        paths.extend(os.path.join(dirpath, name) for name in filenames if name.lower().endswith(IMAGE_EXTENSIONS))
+    return sorted(paths)
+
+
+def generate_images(out_dir: str, count: int) -> list:
+    paths = []
+    for idx in range(count):
+        path = os.path.join(out_dir, f"generated-{idx}.jpg")
+        Image.effect_mandelbrot((1600, 900), (-2.2, -1.2, 1.0, 1.2), 40 + idx % 60).convert("RGB").save(path, quality=90)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", default="output/images")
+    parser.add_argument("--count", type=int, default=40, help="Images to generate when --images has none")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--format", default="WEBP")
+    parser.add_argument("--quality", type=int, default=75)
+    parser.add_argument("--width", type=int, default=640)
+    args = parser.parse_args()
+    if not thumbnails_supported():
+        sys.exit("Pillow is required for this benchmark: pip install Pillow")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = find_images(args.images) or generate_images(tmp, args.count)
+        report = {"images": len(paths), "format": args.format, "quality": args.quality, "width": args.width, "runs": []}
+        for workers in args.workers:
+            out_dir = os.path.join(tmp, f"thumbnails-{workers}")
+            start = time.perf_counter()
+            with ThumbnailPool(workers, out_dir, args.width, args.format, args.quality) as pool:
+                pool.map(paths)
+            elapsed = time.perf_counter() - start
+            stats = pool.stats
+            report["runs"].append({
+                "workers": workers,
+                "wall_seconds": round(elapsed, 3),
+                "images_per_second": round(stats["images"] / elapsed, 1),
+                "cpu_ms_per_image": round(1000 * stats["cpu_seconds"] / max(stats["images"], 1), 2),
+                "bytes_in_per_image": stats["bytes_in"] // max(stats["images"], 1),
+                "bytes_out_per_image": stats["bytes_out"] // max(stats["images"], 1),
+            })
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
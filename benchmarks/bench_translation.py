@@ -0,0 +1,69 @@
+"""
+Benchmarks translation throughput against the local stand-in translation API.
+
+Translates a mix of titles and summaries with TranslationClient and, for
+comparison, with one translate_text call per chunk sent sequentially (a
+single translate_text call over the whole list exceeds the payload limit).
+
+Usage:
+    python -m benchmarks.bench_translation --texts 5000 --latency 0.05 --error-rate 0.05
+"""
+import argparse
+import json
+import logging
+import os
+import time
+from benchmarks.fixture_server import start_fixture_server
+from translator.api import translate_text
+from translator.client import TranslationClient, chunk_texts
+
+
+def make_texts(count):
+    texts = []
+    for idx in range(count // 2):
+        texts.append(f"Artículo de opinión número {idx}")
+        texts.append(f"Resumen del artículo {idx} sobre la actualidad política y social del país")
+    return texts[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-items", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=100.0)
+    args = parser.parse_args()
+
+    logger = logging.getLogger("bench")
+    server, base_url = start_fixture_server(
+        latency=args.latency, translate_max_items=args.max_items, translate_error_rate=args.error_rate
+    )
+    os.environ.setdefault("RAPIDAPI_KEY", "benchmark")
+    texts = make_texts(args.texts)
+    report = {"texts": len(texts), "latency": args.latency, "error_rate": args.error_rate}
+    try:
+        client = TranslationClient(url=f"{base_url}/t", max_items=args.max_items,
+                                   max_workers=args.workers, rate=args.rate, backoff=0.05)
+        start = time.perf_counter()
+        translated = client.translate(texts, logger)
+        elapsed = time.perf_counter() - start
+        report["client_seconds"] = round(elapsed, 4)
+        report["client_texts_per_second"] = round(len(translated) / elapsed, 1)
+        report["client_stats"] = client.stats
+
+        if args.error_rate == 0:
+            start = time.perf_counter()
+            for chunk in chunk_texts(texts, args.max_items, client.max_bytes):
+                translate_text(chunk, logger, url=f"{base_url}/t")
+            elapsed = time.perf_counter() - start
+            report["sequential_seconds"] = round(elapsed, 4)
+            report["sequential_texts_per_second"] = round(len(texts) / elapsed, 1)
+    finally:
+        server.shutdown()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
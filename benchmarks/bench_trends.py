@@ -0,0 +1,84 @@
+"""
+Benchmarks TrendStore appends and rising-term queries.
+
+Fills a temporary store with --days daily runs of synthetic headline terms
+(Zipf-distributed over a --vocabulary word vocabulary, with a few terms
+made to rise over the last weeks), then times the appends, reopening the
+store and top_rising/series queries.
+
+Usage:
+    python -m benchmarks.bench_trends [--days 365] [--tokens 20000] [--vocabulary 50000]
+"""
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from collections import Counter
+import numpy as np
+from analyzer.trends import SECONDS_PER_DAY, TrendStore
+
+
+def synthetic_runs(days: int, tokens: int, vocabulary: int, seed: int = 1):
+    """
+    Yields (timestamp, {term: count}) per day; 'rising0'.. 'rising4' grow over the last 30 days.
+    """
+    rng = np.random.default_rng(seed)
+    start = time.time() - days * SECONDS_PER_DAY
+    for day in range(days):
+        ids = rng.zipf(1.3, tokens)
+        ids = ids[ids <= vocabulary]
+        counts = Counter({f"term{term_id}": int(count) for term_id, count in zip(*np.unique(ids, return_counts=True))})
+        if day >= days - 30:
+            for idx in range(5):
+                counts[f"rising{idx}"] = (day - days + 31) * (idx + 1)
+        yield start + day * SECONDS_PER_DAY, counts
+
+
+def timed_ms(fn, repeat: int = 20) -> tuple:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(1000 * (time.perf_counter() - start))
+    return round(statistics.median(samples), 3), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--tokens", type=int, default=20000, help="Tokens drawn per run")
+    parser.add_argument("--vocabulary", type=int, default=50000)
+    args = parser.parse_args()
+
+    runs = list(synthetic_runs(args.days, args.tokens, args.vocabulary))
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TrendStore(tmp)
+        append_ms = []
+        for timestamp, counts in runs:
+            start = time.perf_counter()
+            store.add_run(counts, timestamp)
+            append_ms.append(1000 * (time.perf_counter() - start))
+
+        start = time.perf_counter()
+        store = TrendStore(tmp)
+        open_ms = 1000 * (time.perf_counter() - start)
+        now = runs[-1][0]
+        week_ms, rising = timed_ms(lambda: store.top_rising(7, 28, 10, now=now))
+        quarter_ms, _ = timed_ms(lambda: store.top_rising(90, 275, 10, now=now))
+        series_ms, _ = timed_ms(lambda: store.series("term10"))
+        report = {
+            **store.to_dict(),
+            "append_ms_p50": round(statistics.median(append_ms), 3),
+            "append_ms_max": round(max(append_ms), 3),
+            "open_ms": round(open_ms, 3),
+            "top_rising_7d_vs_28d_ms": week_ms,
+            "top_rising_90d_vs_275d_ms": quarter_ms,
+            "series_full_year_ms": series_ms,
+            "top_rising": [entry["term"] for entry in rising],
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
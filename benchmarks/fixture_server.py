@@ -0,0 +1,306 @@
+"""
+Local El País fixture site for offline benchmarks.
+
+Serves a home page, the Opinión section, article pages and cover images,
+plus a stand-in for the translation API, with configurable injected latency.
+Pages recorded from the live site (see 'record') are served when present in
+the fixtures directory; anything missing is synthesized.
+
+Usage:
+    python -m benchmarks.fixture_server serve [--port 8000] [--latency 0.05] [--fixtures DIR]
+    python -m benchmarks.fixture_server record [--articles 20] [--fixtures DIR]
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Directory holding recorded pages: home.html, opinion.html, articles/<n>.html, img/<n>.jpg
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# Images used for synthesized covers
+COVER_IMAGES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), os.pardir, "output", "article_*_cover.jpg")))
+
+# Padding that stands in for the scripts and styles of a real article page
+HEAD_PADDING = "<script>window.__data = {};</script>\n" * 400
+
+# Number of articles listed on the synthesized Opinión page
+OPINION_ARTICLES = 30
+
+HOME_TEMPLATE = """<!DOCTYPE html>
+<html lang="es-ES">
+<head><meta charset="utf-8"><title>EL PAÍS: el periódico global</title>
+{padding}</head>
+<body>
+<nav><ul>
+<li><a href="/internacional/">Internacional</a></li>
+<li><a href="/opinion/">Opinión</a></li>
+<li><a href="/espana/">España</a></li>
+</ul></nav>
+<main>{articles}</main>
+</body>
+</html>
+"""
+
+OPINION_TEMPLATE = """<!DOCTYPE html>
+<html lang="es-ES">
+<head><meta charset="utf-8"><title>Opinión | EL PAÍS</title>
+{padding}</head>
+<body>
+<main>{articles}</main>
+</body>
+</html>
+"""
+
+TEASER_TEMPLATE = """<article class="c">
+<header class="c_h"><h2 class="c_t"><a href="/articles/{idx}.html">{title}</a></h2></header>
+<p class="c_d">{summary}</p>
+</article>
+"""
+
+ARTICLE_TEMPLATE = """<!DOCTYPE html>
+<html lang="es-ES">
+<head><meta charset="utf-8"><title>{title} | Opinión | EL PAÍS</title>
+{padding}</head>
+<body>
+<main>
+<article>
+<header class="a_e_txt">
+<h1 class="a_t">{title}</h1>
+<h2 class="a_st">{summary}</h2>
+<figure class="a_m"><img src="/img/{idx}.jpg?w=414" srcset="/img/{idx}.jpg?w=414 414w, /img/{idx}.jpg?w=828 828w, /img/{idx}.jpg?w=1200 1200w" sizes="(min-width: 1000px) 640px, 100vw" width="414" height="233" alt=""></figure>
+</header>
+<div class="a_c">{body}</div>
+</article>
+</main>
+</body>
+</html>
+"""
+
+
+def article_title(idx: int) -> str:
+    return f"Artículo de opinión número {idx}"
+
+
+def article_summary(idx: int) -> str:
+    return f"Resumen del artículo {idx} sobre la actualidad política y social"
+
+
+def render_teasers(count: int) -> str:
+    return "".join(
+        TEASER_TEMPLATE.format(idx=idx, title=article_title(idx), summary=article_summary(idx))
+        for idx in range(1, count + 1)
+    )
+
+
+def render_home() -> str:
+    """
+    Renders a synthetic El País home page with a link to the Opinión section.
+    """
+    return HOME_TEMPLATE.format(padding=HEAD_PADDING, articles=render_teasers(10))
+
+
+def render_opinion() -> str:
+    """
+    Renders a synthetic Opinión section page.
+    """
+    return OPINION_TEMPLATE.format(padding=HEAD_PADDING, articles=render_teasers(OPINION_ARTICLES))
+
+
+def render_article(idx: int) -> str:
+    """
+    Renders a synthetic El País article page.
+    """
+    return ARTICLE_TEMPLATE.format(
+        idx=idx,
+        title=article_title(idx),
+        summary=article_summary(idx),
+        padding=HEAD_PADDING,
+        body="<p>Lorem ipsum dolor sit amet.</p>" * 50,
+    )
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """
+    Serves the fixture site with an injected latency.
+
+    Routes:
+        GET /: home page
+        GET /opinion/: Opinión section
+        GET /articles/<n>.html: article page n
+        GET /img/<n>.jpg: cover image n, with ETag/If-None-Match support
+        POST /t: stand-in for the Rapid Translate API, returning '[<to>] <text>'.
+            Answers 413 above translate_max_items texts and a random
+            translate_error_rate share of requests with 429.
+    """
+    latency = 0.0
+    fixtures_dir = FIXTURES_DIR
+    translate_requests = 0
+    translate_max_items = None
+    translate_error_rate = 0.0
+
+    def do_POST(self):
+        time.sleep(self.latency)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.split("?", 1)[0] != "/t":
+            return self._send(404, "text/plain", b"Not found")
+        type(self).translate_requests += 1
+        if random.random() < self.translate_error_rate:
+            return self._send(429, "text/plain", b"Too many requests")
+        payload = json.loads(body)
+        texts = payload["q"] if isinstance(payload["q"], list) else [payload["q"]]
+        if self.translate_max_items and len(texts) > self.translate_max_items:
+            return self._send(413, "text/plain", b"Payload too large")
+        translations = [f"[{payload['to']}] {text}" for text in texts]
+        self._send(200, "application/json", json.dumps(translations).encode("utf-8"))
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        path = self.path.split("?", 1)[0]
+        if path == "/":
+            return self._send_page("home.html", render_home)
+        if path in ("/opinion", "/opinion/"):
+            return self._send_page("opinion.html", render_opinion)
+        match = re.fullmatch(r"/articles/(\d+)\.html", path)
+        if match:
+            idx = int(match.group(1))
+            return self._send_page(os.path.join("articles", f"{idx}.html"), lambda: render_article(idx))
+        match = re.fullmatch(r"/img/(\d+)\.jpg", path)
+        if match:
+            return self._send_image(int(match.group(1)))
+        self._send(404, "text/plain", b"Not found")
+
+    def _send_page(self, name, render):
+        recorded = os.path.join(self.fixtures_dir, name)
+        body = _read(recorded) if os.path.exists(recorded) else render().encode("utf-8")
+        self._send(200, "text/html; charset=utf-8", body)
+
+    def _send_image(self, idx):
+        recorded = os.path.join(self.fixtures_dir, "img", f"{idx}.jpg")
+        if os.path.exists(recorded):
+            body = _read(recorded)
+        elif COVER_IMAGES:
+            body = _read(COVER_IMAGES[(idx - 1) % len(COVER_IMAGES)])
+        else:
+            return self._send(404, "text/plain", b"Not found")
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self._send(200, "image/jpeg", body, {"ETag": etag})
+
+    def _send(self, status, content_type, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(latency: float = 0.0, host: str = "127.0.0.1", port: int = 0,
+                         translate_max_items: int = None, translate_error_rate: float = 0.0,
+                         fixtures_dir: str = FIXTURES_DIR):
+    """
+    Starts the fixture server in a background thread.
+
+    Args:
+        latency (float): Seconds of delay added to every response
+        host (str): Interface to bind
+        port (int): Port to bind (0 picks a free port)
+        translate_max_items (int): Texts per translation request above which 413 is returned
+        translate_error_rate (float): Share of translation requests answered with 429
+        fixtures_dir (str): Directory of recorded pages to serve instead of synthesized ones
+
+    Returns:
+        (ThreadingHTTPServer, str): The server and its base URL. Call
+        server.shutdown() to stop it.
+    """
+    handler = type("LatencyFixtureHandler", (FixtureHandler,), {
+        "latency": latency,
+        "fixtures_dir": fixtures_dir,
+        "translate_max_items": translate_max_items,
+        "translate_error_rate": translate_error_rate,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def record_fixtures(fixtures_dir: str = FIXTURES_DIR, articles: int = 20, base_url: str = "https://elpais.com"):
+    """
+    Records the live home page, Opinión section, articles and cover images.
+
+    Article links and cover images are rewritten to the fixture routes, so
+    the recorded pages work against the local server.
+    """
+    from scraper.static import create_http_session, parse_article_html
+
+    session = create_http_session()
+    os.makedirs(os.path.join(fixtures_dir, "articles"), exist_ok=True)
+    os.makedirs(os.path.join(fixtures_dir, "img"), exist_ok=True)
+
+    home = session.get(f"{base_url}/", timeout=15).text
+    opinion = session.get(f"{base_url}/opinion/", timeout=15).text
+    links = list(dict.fromkeys(re.findall(r'href="(https://elpais\.com/opinion/\d{4}-\d{2}-\d{2}/[^"]+\.html)"', opinion)))
+    links = links[:articles]
+    for idx, url in enumerate(links, start=1):
+        html = session.get(url, timeout=15).text
+        cover = parse_article_html(html, url)["cover_image_url"]
+        if cover:
+            with open(os.path.join(fixtures_dir, "img", f"{idx}.jpg"), "wb") as f:
+                f.write(session.get(cover, timeout=15).content)
+            html = html.replace(cover.replace("&", "&amp;"), f"/img/{idx}.jpg").replace(cover, f"/img/{idx}.jpg")
+        with open(os.path.join(fixtures_dir, "articles", f"{idx}.html"), "w", encoding="utf-8") as f:
+            f.write(html)
+        opinion = opinion.replace(f'href="{url}"', f'href="/articles/{idx}.html"')
+    home = home.replace(f'href="{base_url}/opinion/"', 'href="/opinion/"')
+    with open(os.path.join(fixtures_dir, "home.html"), "w", encoding="utf-8") as f:
+        f.write(home)
+    with open(os.path.join(fixtures_dir, "opinion.html"), "w", encoding="utf-8") as f:
+        f.write(opinion)
+    print(f"Recorded home, Opinión and {len(links)} articles into {fixtures_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("serve", "record"))
+    parser.add_argument("--fixtures", default=FIXTURES_DIR)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--articles", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record_fixtures(args.fixtures, args.articles)
+        return
+    server, base_url = start_fixture_server(args.latency, port=args.port, fixtures_dir=args.fixtures)
+    print(f"Serving fixture site at {base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
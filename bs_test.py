@@ -1,5 +1,4 @@
 import json
-import os
 import logging
 from scraper.elpais import (
     is_spanish_website,
@@ -7,23 +6,22 @@ from scraper.elpais import (
     get_first_n_opinion_articles,
     extract_article_details,
 )
-from utils.image_downloader import download_image
-from translator.api import translate_text
+from scraper.commands import CommandCounter
+from utils.image_downloader import ImageStore
+from pipeline.results import ResultSink
+from pipeline.scrape import build_scrape_pipeline
 from analyzer.text_analysis import print_repeated_words
 from dotenv import load_dotenv
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium import webdriver
 
 from utils.logging import (
+    get_bs_logfile_name,
+    close_session_logger,
     setup_basic_logger,
     setup_session_logger
 )
-
-load_dotenv()
-RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
-
-# Setup basic logging for the entire script
-setup_basic_logger()
+from utils.metrics import enable_metrics_from_env, watch_driver
 
 def set_browserstack_status(driver, status, reason):
     """
@@ -37,16 +35,21 @@ def set_browserstack_status(driver, status, reason):
             % (status, json.dumps(reason))
         )
     except Exception as e:
-        logging.warning(f"Failed to set BrowserStack status: {type(e).__name__}: {e}")
+        logging.warning("Failed to set BrowserStack status: %s: %s", type(e).__name__, e)
 
 def test_bs_main():
+    # Setup basic logging and load the Rapid API key when the test runs, not on import
+    setup_basic_logger()
+    load_dotenv()
     logging.info("Remote Test Execution Started...")
     driver = None
     logger = None
+    # Timing spans and WebDriver command metrics, collected when SCRAPER_METRICS is set
+    metrics = enable_metrics_from_env()
     try:
         options = ChromeOptions()
         options.set_capability('sessionName', 'ElPais Translation Test')
-        driver = webdriver.Chrome(options=options)
+        driver = watch_driver(webdriver.Chrome(options=options))
         driver.get("https://elpais.com/")
 
         logger = setup_session_logger(driver)
@@ -65,31 +68,42 @@ def test_bs_main():
                 raise Exception("Spanish edition could not be loaded.")
 
         # Task 2: Scraping Articles from the Opinion Section
-        go_to_opinion_section(driver, logger)
-        logger.info("Navigated to the Opinion section")
-        article_links = get_first_n_opinion_articles(driver, logger, n=5)
-        if len(article_links) < 5:
-            raise Exception("First five articles could not be extracted, check the website.")
+        # Batched lookups keep WebDriver round trips to the remote grid low
+        with CommandCounter(driver) as commands:
+            go_to_opinion_section(driver, logger)
+            logger.info("Navigated to the Opinion section")
+            article_links = get_first_n_opinion_articles(driver, logger, n=5, batched=True)
+            if len(article_links) < 5:
+                raise Exception("First five articles could not be extracted, check the website.")
 
-        articles = []
-        for idx, art in enumerate(article_links):
-            article = extract_article_details(driver, art['url'], logger)
-            articles.append(article)
-            logger.info(f"\nArticle {idx+1} -\nTitle: {article['title']}\nContent: {article['content']}")
-            if article['cover_image_url']:
-                img_filename = f"output/article_{idx+1}_cover.jpg"
-                try:
-                    download_image(article['cover_image_url'], img_filename, logger)
-                except Exception as imgerr:
-                    logger.warning(f"Image download failed: {imgerr}")
-        logger.info("Successfully scraped articles from the Opinion section.")
+            # Task 3 runs in the same pipeline: images are downloaded and titles
+            # translated while the remaining articles are still being extracted
+            image_store = ImageStore()
+            english_titles = []
+            pipeline = build_scrape_pipeline(
+                lambda url: extract_article_details(driver, url, logger, batched=True), logger,
+                image_store=image_store, english_titles=english_titles
+            )
+            # One JSON Lines file per session, so parallel platforms never share a file
+            items = []
+            with ResultSink() as results:
+                for item in pipeline.run(art['url'] for art in article_links):
+                    results.write(item)
+                    items.append(item)
+            items.sort(key=lambda item: item.index)
+        logger.info("Results written to %s", results.paths['jsonl'])
+        image_store.save()
+        logger.info("Task 2 sent %d WebDriver commands: %s", commands.total, commands.summary())
 
-        # Task 3: Translating Titles
+        failed = [item for item in items if item.error]
+        if failed:
+            raise Exception(f"{len(failed)} articles failed: {failed[0].error}")
         logger.info("Translation from spanish to english using Rapid Translate Multi Traduction API:")
-        spanish_titles = [details["title"] for details in articles]
-        english_titles = translate_text(spanish_titles, logger, "es", "en")
-        for idx, (es, en) in enumerate(zip(spanish_titles, english_titles)):
-            logger.info(f"Article {idx+1} - Spanish: {es} | English: {en}")
+        for item in items:
+            idx, article = item.index, item.value
+            logger.info("\nArticle %d -\nTitle: %s\nContent: %s", idx+1, article['title'], article['content'], extra={"article": idx+1})
+            logger.info("Article %d - Spanish: %s | English: %s", idx+1, article['title'], article['title_en'], extra={"article": idx+1})
+        logger.info("Successfully scraped articles from the Opinion section.")
         logger.info("Successfully translated Spanish titles to English.")
 
         # Task 4: Finding repeated words
@@ -102,19 +116,25 @@ def test_bs_main():
         caps = driver.capabilities
         platform = caps.get("platformName", caps.get("platform", "unknown")).replace(" ", "_")
         browser = caps.get("browserName", "unknown").replace(" ", "_")
-        logger.info(f"Successfully tested on {browser} in platform {platform} !")    
+        logger.info("Successfully tested on %s in platform %s !", browser, platform)    
         # Set BrowserStack session as passed
         set_browserstack_status(driver, "passed", "All tasks completed successfully.")
 
     except Exception as e:
-        (logger or logging).exception(f"Test failed: {e}")
+        (logger or logging).exception("Test failed: %s", e)
         if driver and hasattr(driver, "session_id") and driver.session_id:
             set_browserstack_status(driver, "failed", f"{type(e).__name__}: {e}")
 
     finally:
+        if driver and metrics:
+            json_path, prom_path = metrics.export(get_bs_logfile_name(driver))
+            (logger or logging).info("Metrics written to %s and %s", json_path, prom_path)
         if driver:
             driver.quit()
             (logger or logging).info("Browser closed.")
+        if logger:
+            # Flush the queued records before the process exits
+            close_session_logger(logger)
 
 if __name__ == "__main__":
     test_bs_main()
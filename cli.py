@@ -0,0 +1,202 @@
+"""
+Command line entry point for the scraper and its stages.
+
+Each subcommand imports what it needs when it runs, so '--help' and the
+offline subcommands (analyze, replay) start without loading Selenium.
+
+Usage:
+    python cli.py scrape --browser firefox -n 10 --skip translate
+    python cli.py scrape --deep --max-articles 300 --since 2025-07-01
+    python cli.py download https://imagenes.elpais.com/cover.jpg --thumbnails
+    python cli.py translate "Texto en español" --target en
+    python cli.py analyze --results output/results --column title_en --top 10
+    python cli.py replay --archive output/snapshots --workers 4 --output output/replay.jsonl
+    python cli.py trends --add-results output/results --window 7 --baseline 28
+"""
+import sys
+import json
+import logging
+import argparse
+from datetime import date
+from utils.logging import setup_basic_logger
+
+logger = logging.getLogger("cli")
+
+
+def _read_column(path: str, column: str) -> list:
+    from pipeline.results import read_results
+    return [record[column] for record in read_results(path, [column]) if record[column]]
+
+
+def _inputs(args, column: str) -> list:
+    values = list(args.values)
+    if args.results:
+        values += _read_column(args.results, column)
+    if not values:
+        raise SystemExit("Nothing to process: pass values or --results.")
+    return values
+
+
+def _print_json(data):
+    json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+
+def scrape(args) -> int:
+    import local
+    n = args.max_articles if args.deep else args.articles
+    ok = local.main(args.browser, n, args.pool_size, tuple(args.skip), args.snapshots,
+                    deep=args.deep, since=args.since, sections=args.sections)
+    return 0 if ok else 1
+
+
+def download(args) -> int:
+    from utils.image_downloader import ImageStore, download_images
+    image_urls = _inputs(args, "cover_image_url")
+    entries = download_images(image_urls, logger, ImageStore(args.store), max_workers=args.workers)
+    if args.thumbnails:
+        from utils.thumbnails import ThumbnailPool
+        paths = [entry["path"] for entry in entries if entry]
+        with ThumbnailPool(args.thumbnail_workers, image_format=args.format, quality=args.quality) as pool:
+            thumbnails = dict(zip(paths, pool.map(paths)))
+        for entry in entries:
+            if entry:
+                entry["thumbnail"] = thumbnails.get(entry["path"])
+    _print_json([{"url": url, "image": entry} for url, entry in zip(image_urls, entries)])
+    return 0 if all(entries) else 1
+
+
+def translate(args) -> int:
+    from dotenv import load_dotenv
+    from translator.cache import translate_text_cached
+    load_dotenv()
+    texts = _inputs(args, "title")
+    for text in translate_text_cached(texts, logger, args.source, args.target):
+        print(text)
+    return 0
+
+
+def analyze(args) -> int:
+    from analyzer.text_analysis import analyze_texts
+    texts = _inputs(args, args.column)
+    _print_json(analyze_texts(texts, args.ngram, args.language, args.top, args.min_repeats))
+    return 0
+
+
+def replay(args) -> int:
+    from scraper.snapshots import SnapshotArchive, replay_extract
+    archive = SnapshotArchive(args.archive)
+    try:
+        results = replay_extract(archive, logger, args.urls or None, workers=args.workers)
+    finally:
+        archive.close()
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for result in results:
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+def trends(args) -> int:
+    from analyzer.trends import TrendStore
+    store = TrendStore(args.store)
+    if args.add_results:
+        from pipeline.results import read_results
+        # Runs not newer than the store's last run are skipped, so a directory can be added again
+        runs = {}
+        for record in read_results(args.add_results, ["run_id", "scraped_at", "title_en", "status"]):
+            run = runs.setdefault(record["run_id"], {"time": record["scraped_at"], "titles": []})
+            if record["title_en"] and record["status"] in ("new", "changed"):
+                run["titles"].append(record["title_en"])
+        last_run = store.to_dict()["last_run"] or float("-inf")
+        added = 0
+        for run in sorted(runs.values(), key=lambda run: run["time"]):
+            if run["time"] > last_run:
+                store.add_texts(run["titles"], run["time"])
+                added += 1
+        logger.info("Added %d of %d result runs to the trend store.", added, len(runs))
+    if args.series:
+        times, counts = store.series(args.series)
+        _print_json([{"time": float(t), "count": int(c)} for t, c in zip(times, counts)])
+    else:
+        _print_json(store.top_rising(args.window, args.baseline, args.top, min_count=args.min_count))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # Kept in sync with local.OPTIONAL_STAGES without importing local (and Selenium) for --help
+    stages = ("download", "thumbnails", "translate", "analyze")
+    parser_scrape = commands.add_parser("scrape", help="Scrape Opinión articles with a local browser")
+    parser_scrape.add_argument("--browser", default="chrome", choices=("chrome", "firefox", "edge", "safari"))
+    parser_scrape.add_argument("-n", "--articles", type=int, default=5)
+    parser_scrape.add_argument("--pool-size", type=int, default=3)
+    parser_scrape.add_argument("--skip", nargs="+", default=[], choices=stages, help="Steps to leave out")
+    parser_scrape.add_argument("--snapshots", action="store_true", help="Archive rendered pages in output/snapshots")
+    parser_scrape.add_argument("--deep", action="store_true", help="Crawl sections past their first page of articles")
+    parser_scrape.add_argument("--max-articles", type=int, default=100, help="Articles to crawl with --deep")
+    parser_scrape.add_argument("--since", type=date.fromisoformat, metavar="YYYY-MM-DD",
+                               help="With --deep, skip articles published before this day")
+    parser_scrape.add_argument("--sections", nargs="+", metavar="URL", help="With --deep, section URLs to crawl (default: Opinión)")
+    parser_scrape.set_defaults(handler=scrape)
+
+    parser_download = commands.add_parser("download", help="Download images into the image store")
+    parser_download.add_argument("values", nargs="*", metavar="url", help="Image URLs")
+    parser_download.add_argument("--results", help="Also download the cover images of a result file or directory")
+    parser_download.add_argument("--store", default="output/images")
+    parser_download.add_argument("--workers", type=int, default=8)
+    parser_download.add_argument("--thumbnails", action="store_true", help="Also make thumbnails (needs Pillow)")
+    parser_download.add_argument("--thumbnail-workers", type=int, default=None)
+    parser_download.add_argument("--format", default="WEBP", choices=("WEBP", "JPEG"))
+    parser_download.add_argument("--quality", type=int, default=75)
+    parser_download.set_defaults(handler=download)
+
+    parser_translate = commands.add_parser("translate", help="Translate texts with the cached translator")
+    parser_translate.add_argument("values", nargs="*", metavar="text", help="Texts to translate")
+    parser_translate.add_argument("--results", help="Also translate the titles of a result file or directory")
+    parser_translate.add_argument("--source", default="es")
+    parser_translate.add_argument("--target", default="en")
+    parser_translate.set_defaults(handler=translate)
+
+    parser_analyze = commands.add_parser("analyze", help="Count repeated words and n-grams")
+    parser_analyze.add_argument("values", nargs="*", metavar="text", help="Texts to analyse")
+    parser_analyze.add_argument("--results", help="Also analyse a column of a result file or directory")
+    parser_analyze.add_argument("--column", default="title_en")
+    parser_analyze.add_argument("--ngram", type=int, default=1)
+    parser_analyze.add_argument("--language", choices=("en", "es"), default=None, help="Drop this language's stopwords")
+    parser_analyze.add_argument("--top", type=int, default=10)
+    parser_analyze.add_argument("--min-repeats", type=int, default=2)
+    parser_analyze.set_defaults(handler=analyze)
+
+    parser_replay = commands.add_parser("replay", help="Re-extract archived pages without a browser")
+    parser_replay.add_argument("urls", nargs="*", help="Archived URLs to re-extract (default: all)")
+    parser_replay.add_argument("--archive", default="output/snapshots")
+    parser_replay.add_argument("--workers", type=int, default=1)
+    parser_replay.add_argument("--output", help="JSON Lines file for the results (default: stdout)")
+    parser_replay.set_defaults(handler=replay)
+
+    parser_trends = commands.add_parser("trends", help="Show terms rising across runs")
+    parser_trends.add_argument("--store", default="output/trends")
+    parser_trends.add_argument("--add-results", help="First add the runs of a result file or directory not yet in the store")
+    parser_trends.add_argument("--window", type=float, default=7, help="Days in the recent window")
+    parser_trends.add_argument("--baseline", type=float, default=28, help="Days in the baseline before it")
+    parser_trends.add_argument("--top", type=int, default=20)
+    parser_trends.add_argument("--min-count", type=int, default=3)
+    parser_trends.add_argument("--series", metavar="TERM", help="Print the counts of one term per run instead")
+    parser_trends.set_defaults(handler=trends)
+    return parser
+
+
+def main(argv: list = None) -> int:
+    args = build_parser().parse_args(argv)
+    setup_basic_logger()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
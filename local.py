@@ -1,35 +1,97 @@
 import logging
-import os
+from datetime import date
 from scraper.elpais import (
     is_spanish_website,
     go_to_opinion_section,
     get_first_n_opinion_articles,
-    extract_article_details,
 )
-from utils.image_downloader import download_image
+from utils.image_downloader import ImageStore
 from scraper.browser import get_webdriver
-from translator.api import translate_text
+from scraper.crawl import crawl_article_urls
+from scraper.pool import DriverPool, pooled_extractor
+from scraper.snapshots import SnapshotArchive
+from scraper.session import ManagedSession
+from pipeline.scrape import build_scrape_pipeline
+from pipeline.results import ResultSink, arrow_supported
+from pipeline.state import CrawlStateStore
 from analyzer.text_analysis import print_repeated_words
+from analyzer.trends import TrendStore, log_rising_terms
 from dotenv import load_dotenv
 from utils.logging import (
+        get_bs_logfile_name,
+        close_session_logger,
         setup_basic_logger,
         setup_session_logger
         )
+from utils.metrics import enable_metrics_from_env, watch_driver
+from utils.thumbnails import ThumbnailPool, thumbnails_supported
 
-#Load Rapid API key for translation
-load_dotenv() 
-RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
+# Number of parallel browser sessions used to extract article details
+POOL_SIZE = 3
 
-setup_basic_logger()
+# Pooled browsers are restarted after this many pages or once their process
+# tree uses more than this many MB, keeping memory flat on long crawls
+MAX_PAGES_PER_SESSION = 200
+MAX_SESSION_RSS_MB = 1500
 
-def main():
+# Articles checked more recently than this many seconds are not scraped again
+REFRESH_AFTER = 6 * 3600
 
+# Save each rendered article page to output/snapshots so it can be re-extracted
+# offline with scraper.snapshots.replay_extract
+SNAPSHOT_PAGES = False
+
+# Cover images are resized to COVER_IMAGE_WIDTH and re-encoded into
+# output/thumbnails in worker processes (needs Pillow)
+THUMBNAIL_FORMAT = "WEBP"
+THUMBNAIL_QUALITY = 75
+THUMBNAIL_WORKERS = 2
+
+# Every article record is streamed to output/results/<run id>.jsonl as it is
+# produced, and to Parquet as well when pyarrow is installed
+RESULT_FORMATS = ("jsonl", "parquet")
+
+# Titles of new and changed articles are added to the trend store in
+# output/trends, and terms rising over TREND_WINDOW_DAYS are logged
+TREND_WINDOW_DAYS = 7
+TREND_BASELINE_DAYS = 28
+
+# Steps after extraction that can be left out with main(skip=...)
+OPTIONAL_STAGES = ("download", "thumbnails", "translate", "analyze")
+
+def main(browser: str = "chrome", n: int = 5, pool_size: int = POOL_SIZE, skip: tuple = (),
+         snapshots: bool = SNAPSHOT_PAGES, deep: bool = False, since: date = None, sections: list = None) -> bool:
+    """
+    Scrapes the first n Opinión articles, then downloads, translates and analyses them.
+
+    In deep mode the sections are crawled beyond their first render with
+    crawl_article_urls, and each URL enters the pipeline as soon as it is found.
+
+    Args:
+        browser (str): Browser type passed to get_webdriver
+        n (int): Number of articles to scrape (in deep mode, the maximum)
+        pool_size (int): Parallel browser sessions extracting articles
+        skip (tuple): Steps of OPTIONAL_STAGES to leave out
+        snapshots (bool): Archive every rendered article in output/snapshots
+        deep (bool): Crawl pagination, "more" links and scrolling for up to n articles
+        since (date): In deep mode, skip articles published before this day
+        sections (list): In deep mode, section URLs to crawl (default: Opinión)
+
+    Returns:
+        bool: True when every step succeeded.
+    """
+    #Load Rapid API key for translation
+    load_dotenv()
     driver = None 
     logger = None
+    # Closed in the finally block, whether or not the run succeeds
+    state = archive = thumbnails = None
+    success = False
+    # Timing spans and WebDriver command metrics, collected when SCRAPER_METRICS is set
+    metrics = enable_metrics_from_env()
     try:
         # Initialize Selenium WebDriver
-        browser = "chrome"
-        driver = get_webdriver(browser)
+        driver = watch_driver(get_webdriver(browser))
         logger = setup_session_logger(driver)
 
         driver.get("https://elpais.com/")
@@ -50,49 +112,113 @@ def main():
                 raise Exception("Spanish edition could not be loaded.")
             
         # Task 2
-        go_to_opinion_section(driver, logger)
-        logger.info("Navigated to opinion section.")
-        logger.info("Scraping articles from opinion section.")
-        article_links = get_first_n_opinion_articles(driver, logger, n=5)
-        if len(article_links) < 5:
-            raise Exception("First five articles could not be extracted, check the website.")
+        if deep:
+            # The main driver only discovers links; extraction uses the pool's sessions
+            logger.info("Crawling up to %d articles.", n)
+            article_urls = crawl_article_urls(driver, logger, sections=sections, max_articles=n, since=since)
+        else:
+            go_to_opinion_section(driver, logger)
+            logger.info("Navigated to opinion section.")
+            logger.info("Scraping articles from opinion section.")
+            article_links = get_first_n_opinion_articles(driver, logger, n=n, batched=True)
+            if len(article_links) < n:
+                raise Exception(f"First {n} articles could not be extracted, check the website.")
+            article_urls = (art['url'] for art in article_links)
         
-        articles = []
-        for idx, art in enumerate(article_links):
-            article = extract_article_details(driver, art['url'], logger)
-            articles.append(article)
-            logger.info(f"\nArticle {idx+1} -\nTitle: {article['title']}\nContent: {article['content']}")
-            if article['cover_image_url']:
-                img_filename = f"output/article_{idx+1}_cover.jpg"
-                download_image(article['cover_image_url'], img_filename, logger)
-        logger.info("Successfully scraped articles from the Opinion section.")
+        # Tasks 2 and 3 run as a pipeline: images are downloaded and titles
+        # translated while the remaining articles are still being extracted
+        image_store = ImageStore()
+        english_titles = []
+        state = CrawlStateStore()
+        archive = SnapshotArchive() if snapshots else None
+        if "download" not in skip and "thumbnails" not in skip:
+            if thumbnails_supported():
+                thumbnails = ThumbnailPool(THUMBNAIL_WORKERS, image_format=THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY)
+            else:
+                logger.info("Pillow is not installed, cover images are kept at their downloaded size.")
+        session_factory = lambda: ManagedSession(browser, max_pages=MAX_PAGES_PER_SESSION, max_rss_mb=MAX_SESSION_RSS_MB)
+        with DriverPool(size=pool_size, factory=session_factory, lazy=True) as pool:
+            pipeline = build_scrape_pipeline(
+                pooled_extractor(pool, logger, batched=True, archive=archive), logger,
+                extract_workers=pool_size, image_store=image_store, english_titles=english_titles,
+                state=state, refresh_after=REFRESH_AFTER, thumbnails=thumbnails,
+                skip=tuple(stage for stage in skip if stage in ("download", "translate"))
+            )
+            formats = RESULT_FORMATS if arrow_supported() else ("jsonl",)
+            items = []
+            with ResultSink(formats=formats) as results:
+                for item in pipeline.run(article_urls):
+                    results.write(item)
+                    items.append(item)
+            items.sort(key=lambda item: item.index)
+        logger.info("Results written to %s", ", ".join(results.paths.values()))
+        image_store.save()
+        if thumbnails is not None:
+            # Waits for the stats callbacks; closing again in finally is a no-op
+            thumbnails.close()
+            stats = thumbnails.stats
+            logger.info("Thumbnails: %d images, %d -> %d bytes, %.1f ms CPU per image.", stats['images'], stats['bytes_in'],
+                        stats['bytes_out'], 1000 * stats['cpu_seconds'] / max(stats['images'], 1))
 
-        # Task 3
         logger.info("Translation from spanish to english using Rapid Translate Multi Traduction API:")
-        spanish_titles = [details["title"] for details in articles]
-        english_titles = translate_text(spanish_titles, logger, "es", "en") 
-        for idx, (es, en) in enumerate(zip(spanish_titles, english_titles)):
-            logger.info(f"Article {idx+1} - Spanish: {es} | English: {en}")   
-        logger.info("Successfully translated Spanish titles to English.")
+        for item in items:
+            idx = item.index
+            if item.error:
+                logger.error("Article %d failed: %s", idx+1, item.error, extra={"article": idx+1})
+                continue
+            article = item.value
+            logger.info("\nArticle %d (%s) -\nTitle: %s\nContent: %s", idx+1, article['crawl_status'], article['title'], article['content'], extra={"article": idx+1})
+            if article['image']:
+                logger.info("Article %d cover image: %s (%s)", idx+1, article['image']['path'], article['image']['status'], extra={"article": idx+1})
+            if article.get('thumbnail'):
+                thumbnail = article['thumbnail']
+                logger.info("Article %d thumbnail: %s, %d -> %d bytes, %.1f ms CPU", idx+1, thumbnail['path'], thumbnail['bytes_in'],
+                            thumbnail['bytes_out'], 1000 * thumbnail['cpu_seconds'], extra={"article": idx+1})
+            logger.info("Article %d - Spanish: %s | English: %s", idx+1, article['title'], article['title_en'], extra={"article": idx+1})
+        logger.info("Successfully scraped articles from the Opinion section.")
+        if "translate" not in skip:
+            logger.info("Successfully translated Spanish titles to English.")
 
         # Task 4
-        logger.info("Analysis if there are words repeating.")
-        print_repeated_words(english_titles, logger, 2)
-        logger.info("Successfully analysed words.")
+        if "analyze" not in skip and "translate" not in skip:
+            logger.info("Analysis if there are words repeating.")
+            print_repeated_words(english_titles, logger, 2)
+            logger.info("Successfully analysed words.")
+
+            # Headlines kept from earlier runs are not counted again
+            fresh_titles = [
+                item.value['title_en'] for item in items
+                if not item.error and item.value.get('crawl_status') in ("new", "changed") and item.value['title_en']
+            ]
+            trends = TrendStore()
+            trends.add_texts(fresh_titles)
+            log_rising_terms(trends, logger, TREND_WINDOW_DAYS, TREND_BASELINE_DAYS)
 
         # Success
         caps = driver.capabilities
         platform = caps.get("platformName", caps.get("platform", "unknown")).replace(" ", "_")
         browser = caps.get("browserName", "unknown").replace(" ", "_")
-        logger.info(f"Successfully tested on {browser} in platform {platform} !")
+        logger.info("Successfully tested on %s in platform %s !", browser, platform)
+        success = True
         
     except Exception as e:
-        (logger or logging).exception(f"An error occurred: {e}")
+        (logger or logging).exception("An error occurred: %s", e)
 
     finally:
+        for resource in (thumbnails, archive, state):
+            if resource is not None:
+                resource.close()
+        if driver and metrics:
+            json_path, prom_path = metrics.export(get_bs_logfile_name(driver))
+            (logger or logging).info("Metrics written to %s and %s", json_path, prom_path)
         if driver:
             driver.quit()
             (logger or logging).info("Browser closed.")
+        if logger:
+            # Flush the queued records before the process exits
+            close_session_logger(logger)
+    return success
 
 if __name__ == "__main__":
+    setup_basic_logger()
     main()
@@ -0,0 +1,233 @@
+import json
+import os
+import sys
+import time
+import logging
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import yaml
+from dotenv import load_dotenv
+from scraper.browser import get_webdriver
+from scraper.elpais import (
+    is_spanish_website,
+    go_to_opinion_section,
+    get_first_n_opinion_articles,
+    extract_article_details,
+)
+from scraper.static import extract_articles_http
+from translator.cache import normalize_text, translate_text_cached
+from utils.logging import close_session_logger, setup_basic_logger, setup_session_logger
+
+# browserName values from browserstack.yml mapped to get_webdriver browsers
+LOCAL_BROWSERS = {
+    "chrome": "chrome",
+    "chromium": "chrome",
+    "googlechrome": "chrome",
+    "firefox": "firefox",
+    "edge": "edge",
+    "microsoftedge": "edge",
+    "safari": "safari",
+    "ie": "ie",
+    "internet explorer": "ie",
+}
+
+MATRIX_REPORT_PATH = "output/matrix_report.json"
+
+# Browser workers are started fresh instead of forked from a process whose
+# discovery and translation threads may hold locks, as in utils.thumbnails
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def load_platforms(config_path: str) -> list[dict]:
+    """
+    Reads the 'platforms' list from a browserstack.yml file.
+    """
+    with open(config_path, encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    return config.get("platforms") or []
+
+
+def plan_local_browsers(platforms: list[dict]):
+    """
+    Maps BrowserStack platforms to the browsers get_webdriver can launch here.
+
+    Mobile devices and browsers that do not run on this OS are skipped, and
+    platforms that resolve to the same local browser are run once.
+
+    Returns:
+        (dict, list): {browser: [platform labels]} to run, and skipped
+        platforms as {'platform', 'reason'} dicts.
+    """
+    browsers, skipped = {}, []
+    for platform in platforms:
+        name = str(platform.get("browserName", "")).lower()
+        label = " ".join(str(platform[key]) for key in ("deviceName", "os", "osVersion", "browserName", "browserVersion") if key in platform)
+        browser = LOCAL_BROWSERS.get(name)
+        if platform.get("deviceName"):
+            skipped.append({"platform": label, "reason": "mobile devices only run on BrowserStack"})
+        elif browser is None:
+            skipped.append({"platform": label, "reason": f"unsupported browser '{name}'"})
+        elif browser == "safari" and sys.platform != "darwin":
+            skipped.append({"platform": label, "reason": "Safari needs macOS"})
+        elif browser == "ie" and not sys.platform.startswith("win"):
+            skipped.append({"platform": label, "reason": "Internet Explorer needs Windows"})
+        else:
+            browsers.setdefault(browser, []).append(label)
+    return browsers, skipped
+
+
+def discover_articles(browser: str, n: int, logger) -> list[dict]:
+    """
+    Finds the first n Opinión articles once, on the given browser, and
+    extracts the reference results every browser is checked against.
+    """
+    driver = get_webdriver(browser)
+    try:
+        driver.get("https://elpais.com/")
+        if not is_spanish_website(driver, logger):
+            driver.get("https://elpais.com/?ed=es")
+        go_to_opinion_section(driver, logger)
+        links = get_first_n_opinion_articles(driver, logger, n=n, batched=True)
+        reference = extract_articles_http([link["url"] for link in links], logger, driver=driver)
+    finally:
+        driver.quit()
+    return reference
+
+
+def _matches(actual, expected) -> bool:
+    if actual is None or expected is None:
+        return actual is expected
+    return normalize_text(actual) == normalize_text(expected)
+
+
+def check_browser(browser: str, reference: list[dict], fast_load: bool = False) -> dict:
+    """
+    Extracts the shared articles on one local browser and compares them to the reference.
+
+    Runs in a worker process, with its own WebDriver and session log.
+
+    Returns:
+        dict: Status, timings and per-article comparison for the browser.
+    """
+    setup_basic_logger()
+    report = {"browser": browser, "status": "passed", "articles": []}
+    driver = logger = None
+    start = time.perf_counter()
+    try:
+        driver = get_webdriver(browser, fast_load=fast_load)
+        report["startup_seconds"] = round(time.perf_counter() - start, 3)
+        logger = setup_session_logger(driver)
+        for expected in reference:
+            article_start = time.perf_counter()
+            entry = {"url": expected["url"]}
+            try:
+                actual = extract_article_details(driver, expected["url"], logger, batched=True)
+                entry["title_match"] = _matches(actual["title"], expected["title"])
+                entry["content_match"] = _matches(actual["content"], expected["content"])
+                entry["has_cover_image"] = bool(actual["cover_image_url"])
+                if not (entry["title_match"] and entry["content_match"]):
+                    entry["title"] = actual["title"]
+                    entry["content"] = actual["content"]
+            except Exception as e:
+                entry["error"] = f"{type(e).__name__}: {e}"
+            entry["seconds"] = round(time.perf_counter() - article_start, 3)
+            if entry.get("error") or not (entry["title_match"] and entry["content_match"]):
+                report["status"] = "failed"
+            report["articles"].append(entry)
+    except Exception as e:
+        report["status"] = "error"
+        report["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if driver:
+            driver.quit()
+        if logger:
+            close_session_logger(logger)
+    seconds = sorted(entry["seconds"] for entry in report["articles"])
+    report["total_seconds"] = round(time.perf_counter() - start, 3)
+    if seconds:
+        report["article_seconds_p50"] = seconds[len(seconds) // 2]
+        report["article_seconds_max"] = seconds[-1]
+    return report
+
+
+def run_matrix(config_path: str = "browserstack.yml", n: int = 5, workers: int = None, fast_load: bool = False,
+               report_path: str = MATRIX_REPORT_PATH) -> dict:
+    """
+    Runs the scraper on every local browser listed in browserstack.yml.
+
+    Link discovery and the title translation run once in this process; each
+    browser then extracts the same articles in its own worker process and
+    checks its results against the shared reference.
+
+    Args:
+        config_path (str): browserstack.yml with a 'platforms' list
+        n (int): Number of Opinión articles to check
+        workers (int): Parallel browser processes (default: one per browser)
+        fast_load (bool): Use the fast-load browser profile in the workers
+        report_path (str): Where the combined JSON report is written
+
+    Returns:
+        dict: The combined report.
+    """
+    logger = logging.getLogger("matrix")
+    browsers, skipped = plan_local_browsers(load_platforms(config_path))
+    for entry in skipped:
+        logger.info("Skipping %s: %s.", entry["platform"], entry["reason"])
+    if not browsers:
+        raise RuntimeError(f"No platform in {config_path} can run locally.")
+
+    start = time.perf_counter()
+    reference = discover_articles(next(iter(browsers)), n, logger)
+    report = {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "config": config_path,
+        "skipped": skipped,
+        "discovery_seconds": round(time.perf_counter() - start, 3),
+        "articles": [{"url": article["url"], "title": article["title"]} for article in reference],
+    }
+    try:
+        titles_en = translate_text_cached([article["title"] or "" for article in reference], logger)
+        for article, title_en in zip(report["articles"], titles_en):
+            article["title_en"] = title_en
+    except Exception as e:
+        logger.error("Translation failed: %s: %s", type(e).__name__, e)
+        report["translation_error"] = f"{type(e).__name__}: {e}"
+
+    names = list(browsers)
+    mp_context = multiprocessing.get_context(START_METHOD)
+    with ProcessPoolExecutor(max_workers=workers or len(names), mp_context=mp_context) as executor:
+        results = executor.map(check_browser, names, [reference] * len(names), [fast_load] * len(names))
+        report["browsers"] = {
+            result["browser"]: {**result, "platforms": browsers[result["browser"]]} for result in results
+        }
+    report["total_seconds"] = round(time.perf_counter() - start, 3)
+
+    os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    for name, result in report["browsers"].items():
+        logger.info("%s: %s in %.1fs (%s)", name, result["status"], result["total_seconds"], ", ".join(result["platforms"]))
+    logger.info("Matrix report written to %s", report_path)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the scraper on the local browsers listed in browserstack.yml.")
+    parser.add_argument("--config", default="browserstack.yml")
+    parser.add_argument("-n", "--articles", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--fast-load", action="store_true")
+    parser.add_argument("--report", default=MATRIX_REPORT_PATH)
+    args = parser.parse_args()
+
+    # Loaded before the worker processes start, so they inherit the environment
+    load_dotenv()
+    setup_basic_logger()
+    report = run_matrix(args.config, args.articles, args.workers, args.fast_load, args.report)
+    if any(result["status"] != "passed" for result in report["browsers"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+import os
+import json
+import time
+import logging
+import importlib.util
+from analyzer.text_analysis import tokenize
+
+logger = logging.getLogger(__name__)
+
+# pyarrow is optional and slow to import, so it is only loaded by _arrow()
+pa = pq = None
+
+# Default directory of the result files
+RESULTS_DIR = "output/results"
+
+# Pipeline stages whose durations are exported as '<stage>_seconds'
+TIMED_STAGES = ("extract", "download", "thumbnail", "translate", "analyze")
+
+# Columns of a result record and their types
+RESULT_COLUMNS = {
+    "run_id": "string",
+    "scraped_at": "float64",
+    "index": "int64",
+    "url": "string",
+    "status": "string",
+    "error": "string",
+    "title": "string",
+    "title_en": "string",
+    "content": "string",
+    "cover_image_url": "string",
+    "image_sha256": "string",
+    "image_bytes": "int64",
+    "thumbnail_bytes": "int64",
+    "duplicate_of": "string",
+    "terms": "list<string>",
+    **{f"{stage}_seconds": "float64" for stage in TIMED_STAGES},
+}
+
+FORMAT_EXTENSIONS = {"jsonl": ".jsonl", "parquet": ".parquet", "arrow": ".arrow"}
+
+# Format read when a run was written in several, most preferred first
+READ_PREFERENCE = ("parquet", "arrow", "jsonl")
+
+
+def arrow_supported() -> bool:
+    """
+    True when pyarrow is installed, so Parquet and Arrow files can be written and read.
+    """
+    return pa is not None or importlib.util.find_spec("pyarrow") is not None
+
+
+def _arrow(purpose: str):
+    global pa, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(f"pyarrow is required {purpose}: pip install pyarrow") from None
+        pa, pq = pyarrow, pyarrow.parquet
+    return pa, pq
+
+
+def new_run_id() -> str:
+    """
+    Returns an id for a scrape run, unique across parallel processes.
+    """
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+def result_record(item, run_id: str) -> dict:
+    """
+    Flattens a scrape pipeline item into a record with the RESULT_COLUMNS fields.
+
+    'terms' holds the words of the English title, as counted by the analyzer.
+    """
+    article = item.value if isinstance(item.value, dict) else {"url": item.value}
+    image = article.get("image") or {}
+    thumbnail = article.get("thumbnail") or {}
+    image_path = image.get("path")
+    record = {
+        "run_id": run_id,
+        "scraped_at": time.time(),
+        "index": item.index,
+        "url": article.get("url"),
+        "status": "failed" if item.error else article.get("crawl_status", "new"),
+        "error": item.error,
+        "title": article.get("title"),
+        "title_en": article.get("title_en"),
+        "content": article.get("content"),
+        "cover_image_url": article.get("cover_image_url"),
+        "image_sha256": image.get("sha256"),
+        "image_bytes": os.path.getsize(image_path) if image_path and os.path.exists(image_path) else None,
+        "thumbnail_bytes": thumbnail.get("bytes_out"),
+        "duplicate_of": article.get("duplicate_of"),
+        "terms": list(tokenize(article["title_en"])) if article.get("title_en") else [],
+    }
+    for stage in TIMED_STAGES:
+        record[f"{stage}_seconds"] = item.timings.get(stage)
+    return record
+
+
+def _arrow_schema(columns: dict = RESULT_COLUMNS):
+    types = {"string": pa.string(), "int64": pa.int64(), "float64": pa.float64(), "list<string>": pa.list_(pa.string())}
+    return pa.schema([(name, types[kind]) for name, kind in columns.items()])
+
+
+class JsonLinesSink:
+    """
+    Appends records to a JSON Lines file, one flushed line per record.
+
+    Lines are written as soon as records arrive, so a crashed run keeps
+    everything written before the crash.
+    """
+
+    def __init__(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, record: dict):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ArrowSink:
+    """
+    Writes records to a Parquet or Arrow IPC file in batches of batch_size rows.
+
+    Only the current batch is held in memory; each full batch becomes one
+    Parquet row group or Arrow record batch. Requires pyarrow.
+
+    Args:
+        path (str): Output file; an existing file is replaced
+        file_format (str): 'parquet' or 'arrow'
+        batch_size (int): Records buffered before a batch is written
+        columns (dict): Column names and types (default RESULT_COLUMNS)
+    """
+
+    def __init__(self, path: str, file_format: str = "parquet", batch_size: int = 1000, columns: dict = RESULT_COLUMNS):
+        _arrow(f"for {file_format} output")
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.schema = _arrow_schema(columns)
+        if file_format == "parquet":
+            self._writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_file(path, self.schema)
+        self._batch = []
+
+    def write(self, record: dict):
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._batch:
+            batch = pa.RecordBatch.from_pylist(self._batch, schema=self.schema)
+            if isinstance(self._writer, pq.ParquetWriter):
+                self._writer.write_batch(batch)
+            else:
+                self._writer.write(batch)
+            self._batch = []
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+
+class ResultSink:
+    """
+    Streams scrape pipeline results to files as they are produced.
+
+    Every item passed to write becomes one result_record, written to
+    '<root>/<run_id>.jsonl' and, with pyarrow, to batched Parquet or Arrow
+    files next to it; read_results reads only one of the copies. Nothing but
+    the current Arrow batch is kept in memory, however many articles a crawl
+    produces.
+
+    Usage:
+        with ResultSink(formats=("jsonl", "parquet")) as results:
+            for item in pipeline.run(urls):
+                results.write(item)
+
+    Args:
+        root (str): Directory of the result files (default 'output/results')
+        run_id (str): Id stored in every record and used as the file name (default: new_run_id())
+        formats (tuple): Any of 'jsonl', 'parquet' and 'arrow'
+        batch_size (int): Rows per Parquet row group / Arrow record batch
+    """
+
+    def __init__(self, root: str = RESULTS_DIR, run_id: str = None, formats=("jsonl",), batch_size: int = 1000):
+        self.run_id = run_id or new_run_id()
+        self.paths = {}
+        self._sinks = []
+        self.records = 0
+        for file_format in formats:
+            if file_format not in FORMAT_EXTENSIONS:
+                raise ValueError(f"Unsupported result format '{file_format}', use one of {', '.join(FORMAT_EXTENSIONS)}.")
+            path = os.path.join(root, self.run_id + FORMAT_EXTENSIONS[file_format])
+            if file_format == "jsonl":
+                sink = JsonLinesSink(path)
+            else:
+                sink = ArrowSink(path, file_format, batch_size)
+            self.paths[file_format] = path
+            self._sinks.append(sink)
+
+    def write(self, item) -> dict:
+        """
+        Writes one PipelineItem and returns its record.
+        """
+        record = result_record(item, self.run_id)
+        for sink in self._sinks:
+            sink.write(record)
+        self.records += 1
+        return record
+
+    def close(self):
+        for sink in self._sinks:
+            sink.close()
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _result_files(path: str) -> list:
+    # One list of candidate files per run, in reading preference order
+    if not os.path.isdir(path):
+        return [[path]]
+    runs = {}
+    for name in os.listdir(path):
+        run_id, extension = os.path.splitext(name)
+        if extension in FORMAT_EXTENSIONS.values():
+            runs.setdefault(run_id, {})[extension] = os.path.join(path, name)
+    preference = [FORMAT_EXTENSIONS[file_format] for file_format in READ_PREFERENCE]
+    return [[runs[run_id][extension] for extension in preference if extension in runs[run_id]] for run_id in sorted(runs)]
+
+
+def _jsonl_records(file_path: str, columns: list):
+    with open(file_path, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            yield record if columns is None else {column: record.get(column) for column in columns}
+
+
+def _open_records(file_path: str, columns: list, batch_size: int):
+    # Opens a result file, raising before any record is yielded if it cannot be read
+    extension = os.path.splitext(file_path)[1]
+    if extension == FORMAT_EXTENSIONS["jsonl"]:
+        return _jsonl_records(file_path, columns)
+    _arrow(f"to read {file_path}")
+    if extension == FORMAT_EXTENSIONS["parquet"]:
+        batches = pq.ParquetFile(file_path).iter_batches(batch_size=batch_size, columns=columns)
+    else:
+        reader = pa.ipc.open_file(pa.memory_map(file_path))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        if columns is not None:
+            batches = (batch.select(columns) for batch in batches)
+    return (record for batch in batches for record in batch.to_pylist())
+
+
+def read_results(path: str, columns: list = None, batch_size: int = 1000):
+    """
+    Reads result records back, optionally only some of their columns.
+
+    Parquet files only decode the requested columns from disk; Arrow and
+    JSON Lines files are read batch by batch (line by line) and projected.
+    Records are yielded one at a time, so memory stays bounded.
+
+    A run written in several formats is read once, from the first readable
+    file in READ_PREFERENCE order: an unfinished Parquet or Arrow file of a
+    crashed run, or one that cannot be read without pyarrow, falls back to
+    the JSON Lines file of the run.
+
+    Args:
+        path (str): A result file, or a directory whose runs are read in run_id order
+        columns (list): Column names to load (default: all)
+        batch_size (int): Rows decoded at a time from Parquet and Arrow files
+
+    Yields:
+        dict: One record per article, with only the requested columns.
+    """
+    for candidates in _result_files(path):
+        for position, file_path in enumerate(candidates):
+            fallback = position < len(candidates) - 1
+            if fallback and not file_path.endswith(FORMAT_EXTENSIONS["jsonl"]) and not arrow_supported():
+                continue
+            try:
+                records = _open_records(file_path, columns, batch_size)
+            except Exception as e:
+                if not fallback:
+                    raise
+                logger.warning("Cannot read %s (%s: %s), reading the next format of the run.", file_path, type(e).__name__, e)
+                continue
+            yield from records
+            break
+
+
+def load_columns(path: str, columns: list) -> dict:
+    """
+    Loads selected columns of the results into lists.
+
+    Returns:
+        dict: {column: [values...]} in record order.
+    """
+    data = {column: [] for column in columns}
+    for record in read_results(path, columns):
+        for column in columns:
+            data[column].append(record.get(column))
+    return data
@@ -0,0 +1,171 @@
+import time
+import queue
+import logging
+import threading
+from dataclasses import dataclass, field
+from utils.metrics import span
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the stream on a queue
+_DONE = object()
+
+
+@dataclass
+class PipelineItem:
+    """
+    One unit of work flowing through a Pipeline.
+
+    Attributes:
+        index (int): Position of the item in the source
+        value: Current value, replaced by the output of each stage
+        error (str): First stage error, if any; later stages skip failed items
+        timings (dict): Seconds spent in each stage
+    """
+    index: int
+    value: object
+    error: str = None
+    timings: dict = field(default_factory=dict)
+
+
+class Stage:
+    """
+    A pipeline stage running fn in its own pool of worker threads.
+
+    Args:
+        name (str): Stage name used in timings and errors
+        fn (callable): Called with one value (or a list of values when
+            batch_size > 1) and returns the new value (or list of values)
+        workers (int): Number of worker threads
+        batch_size (int): Maximum values per call of fn
+        batch_timeout (float): Seconds to wait for a batch to fill before
+            processing a partial one
+        queue_size (int): Capacity of the stage's input queue
+    """
+
+    def __init__(self, name: str, fn, workers: int = 1, batch_size: int = 1, batch_timeout: float = 0.2, queue_size: int = 16):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.queue_size = queue_size
+
+
+class Pipeline:
+    """
+    Runs stages connected by bounded queues so they overlap in time.
+
+    Each item moves to the next stage as soon as it is ready, and a bounded
+    queue makes a fast stage wait for a slow one instead of buffering without
+    limit. A failing item is marked with its error and passed through, so it
+    never stops the other items.
+
+    Usage:
+        pipeline = Pipeline([Stage("extract", extract, workers=3), Stage("translate", translate, batch_size=20)])
+        for item in pipeline.run(urls):
+            ...
+    """
+
+    def __init__(self, stages: list, logger=logger):
+        self.stages = stages
+        self.logger = logger
+
+    def run(self, source):
+        """
+        Feeds values from an iterable through all stages.
+
+        Yields:
+            PipelineItem: Items in completion order as they leave the last stage.
+        """
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        queues.append(queue.Queue())
+        threads = [threading.Thread(target=self._feed, args=(source, queues[0]), daemon=True)]
+        for stage, in_queue, out_queue in zip(self.stages, queues, queues[1:]):
+            remaining = [stage.workers]
+            lock = threading.Lock()
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work, args=(stage, in_queue, out_queue, remaining, lock), daemon=True
+                ))
+        for thread in threads:
+            thread.start()
+
+        while True:
+            item = queues[-1].get()
+            if item is _DONE:
+                break
+            yield item
+        for thread in threads:
+            thread.join()
+
+    def run_all(self, source) -> list:
+        """
+        Runs the pipeline to completion and returns the items in source order.
+        """
+        return sorted(self.run(source), key=lambda item: item.index)
+
+    def _feed(self, source, out_queue):
+        try:
+            for index, value in enumerate(source):
+                out_queue.put(PipelineItem(index, value))
+        except Exception as e:
+            self.logger.error("Pipeline source failed: %s: %s", type(e).__name__, e)
+        finally:
+            out_queue.put(_DONE)
+
+    def _work(self, stage, in_queue, out_queue, remaining, lock):
+        while True:
+            batch, finished = self._next_batch(stage, in_queue)
+            if batch:
+                self._process(stage, batch)
+                for item in batch:
+                    out_queue.put(item)
+            if finished:
+                # Let sibling workers see the end of the stream too
+                in_queue.put(_DONE)
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    out_queue.put(_DONE)
+                return
+
+    def _next_batch(self, stage, in_queue):
+        item = in_queue.get()
+        if item is _DONE:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + stage.batch_timeout
+        while len(batch) < stage.batch_size:
+            try:
+                item = in_queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _process(self, stage, batch):
+        pending = [item for item in batch if item.error is None]
+        if not pending:
+            return
+        start = time.perf_counter()
+        try:
+            with span(f"pipeline.{stage.name}"):
+                if stage.batch_size > 1:
+                    values = stage.fn([item.value for item in pending])
+                    if len(values) != len(pending):
+                        raise RuntimeError(f"returned {len(values)} values for a batch of {len(pending)}")
+                else:
+                    values = [stage.fn(pending[0].value)]
+        except Exception as e:
+            self.logger.warning("Stage '%s' failed for %d item(s): %s: %s", stage.name, len(pending), type(e).__name__, e)
+            for item in pending:
+                item.error = f"{stage.name}: {type(e).__name__}: {e}"
+            return
+        elapsed = time.perf_counter() - start
+        for item, value in zip(pending, values):
+            item.value = value
+            item.timings[stage.name] = elapsed
@@ -0,0 +1,130 @@
+import time
+import threading
+from analyzer.near_duplicates import NearDuplicateIndex, article_fingerprint
+from pipeline.runner import Pipeline, Stage
+from pipeline.state import CrawlStateStore, classify_article, stored_article
+from translator.cache import translate_text_cached
+from utils.image_downloader import ImageStore, create_image_session, fetch_into_store
+from utils.thumbnails import ThumbnailPool
+
+
+def build_scrape_pipeline(extract, logger, extract_workers: int = 1, image_store: ImageStore = None,
+                          image_workers: int = 4, translate=translate_text_cached, translate_batch: int = 10,
+                          english_titles: list = None, source: str = "es", target: str = "en",
+                          state: CrawlStateStore = None, refresh_after: float = None,
+                          duplicates: NearDuplicateIndex = None, thumbnails: ThumbnailPool = None,
+                          skip: tuple = ()) -> Pipeline:
+    """
+    Builds the article extraction -> image download -> translation -> analysis pipeline.
+
+    Link discovery is the pipeline source: pass the article URLs (or a
+    generator yielding them) to Pipeline.run.
+
+    Args:
+        extract (callable): Called with an article URL, returns the
+            extract_article_details result. Must be safe to call from
+            extract_workers threads at once (e.g. backed by a DriverPool).
+        extract_workers (int): Concurrent extractions
+        image_store (ImageStore): Store for cover images (default store under 'output/images')
+        image_workers (int): Concurrent image downloads
+        translate (callable): Function with the translate_text signature
+        translate_batch (int): Titles per translation call
+        english_titles (list): Receives translated titles in completion order for analysis
+        source (str): Source language
+        target (str): Target language
+        state (CrawlStateStore): Optional crawl state. Unchanged articles reuse
+            their stored image and translation, and every processed article
+            is saved back to it. A failed extraction is served from its stored
+            record, if any, and never saved.
+        refresh_after (float): With a state store, articles checked less than
+            this many seconds ago are not extracted again at all
+        duplicates (NearDuplicateIndex): Optional near-duplicate index. Articles
+            whose title and content match an earlier one get 'duplicate_of'
+            set and skip image download, translation and analysis.
+        thumbnails (ThumbnailPool): Optional pool; adds a stage after the
+            download that resizes and re-encodes each cover image in its
+            worker processes.
+        skip (tuple): Optional stages to leave out, 'download' and/or
+            'translate'; their fields stay None.
+
+    Returns:
+        Pipeline: Items carry the article dict, extended with 'image' (store
+        entry or None), 'title_en', with a thumbnail pool 'thumbnail'
+        (make_thumbnail result or None) and, with a state store, 'crawl_status'
+        ('new', 'changed', 'unchanged', 'skipped' or 'failed') and, with a duplicate
+        index, 'duplicate_of' (URL of the earlier article or None).
+    """
+    image_store = image_store or ImageStore()
+    image_session = create_image_session(image_workers)
+    analysis_lock = threading.Lock()
+
+    def extract_with_state(article_url):
+        record = state.get(article_url)
+        if record and refresh_after and time.time() - record["last_checked"] < refresh_after:
+            return stored_article(record, target)
+        return classify_article(extract(article_url), record, target)
+
+    def extract_and_dedupe(article_url):
+        article = extract_article(article_url)
+        if not (article.get("title") or article.get("content")):
+            # Nothing to fingerprint: every failed extraction would match the first one
+            article["duplicate_of"] = None
+            return article
+        article["duplicate_of"] = duplicates.find_or_add(article_url, article_fingerprint(article))
+        if article["duplicate_of"]:
+            logger.info("%s is a near-duplicate of %s, skipping it.", article_url, article['duplicate_of'])
+        return article
+
+    def download(article):
+        if article.get("image") or article.get("duplicate_of"):
+            return article
+        article["image"] = None
+        if article.get("cover_image_url"):
+            try:
+                article["image"] = fetch_into_store(article["cover_image_url"], image_store, image_session, logger)
+            except Exception as e:
+                logger.warning("Image download failed: %s", e)
+        return article
+
+    def thumbnail(article):
+        if article.get("image") and "thumbnail" not in article:
+            try:
+                article["thumbnail"] = thumbnails.make(article["image"]["path"])
+            except Exception as e:
+                logger.warning("Thumbnail failed for %s: %s: %s", article["image"]["path"], type(e).__name__, e)
+                article["thumbnail"] = None
+        return article
+
+    def translate_titles(articles):
+        pending = [
+            article for article in articles
+            if article.get("title_en") is None and not article.get("duplicate_of")
+        ]
+        if pending:
+            titles = [article["title"] or "" for article in pending]
+            translated = translate(titles, logger, source, target)
+            for article, title_en in zip(pending, translated):
+                article["title_en"] = title_en
+        return articles
+
+    def analyze(article):
+        article.setdefault("image", None)
+        article.setdefault("title_en", None)
+        if state is not None and article.get("crawl_status") not in ("skipped", "failed"):
+            state.save(article, target)
+        if english_titles is not None and not article.get("duplicate_of") and article.get("title_en") is not None:
+            with analysis_lock:
+                english_titles.append(article["title_en"])
+        return article
+
+    extract_article = extract_with_state if state is not None else extract
+    stages = [Stage("extract", extract_and_dedupe if duplicates is not None else extract_article, workers=extract_workers)]
+    if "download" not in skip:
+        stages.append(Stage("download", download, workers=image_workers))
+    if thumbnails is not None and "download" not in skip:
+        # The threads only wait on the worker processes, so one per process keeps them busy
+        stages.append(Stage("thumbnail", thumbnail, workers=thumbnails.workers))
+    if "translate" not in skip:
+        stages.append(Stage("translate", translate_titles, batch_size=translate_batch))
+    stages.append(Stage("analyze", analyze))
+    return Pipeline(stages, logger)
@@ -0,0 +1,175 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+# Default location of the crawl state database
+CRAWL_STATE_PATH = "output/crawl_state.sqlite3"
+
+# Fields an extraction must have to be classified and saved
+REQUIRED_FIELDS = ("title", "content")
+
+
+def article_hash(article: dict) -> str:
+    """
+    Hashes the extracted fields of an article to detect changes between runs.
+    """
+    fields = [article.get("title"), article.get("content"), article.get("cover_image_url")]
+    return hashlib.sha256(json.dumps(fields, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class CrawlStateStore:
+    """
+    Persistent index of processed articles keyed by URL.
+
+    Stores the last extracted fields, their content hash, the cover image
+    store entry and translations per target language, so a later run can
+    skip articles that were checked recently or have not changed.
+
+    Args:
+        path (str): SQLite database file (default 'output/crawl_state.sqlite3')
+    """
+
+    def __init__(self, path: str = CRAWL_STATE_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                content TEXT,
+                cover_image_url TEXT,
+                content_hash TEXT NOT NULL,
+                image TEXT,
+                translations TEXT NOT NULL DEFAULT '{}',
+                first_seen REAL NOT NULL,
+                last_checked REAL NOT NULL,
+                last_changed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> dict:
+        """
+        Returns the stored record for an article URL, or None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, title, content, cover_image_url, content_hash, image, translations, "
+                "first_seen, last_checked, last_changed FROM articles WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("url", "title", "content", "cover_image_url", "content_hash", "image",
+                "translations", "first_seen", "last_checked", "last_changed")
+        record = dict(zip(keys, row))
+        record["image"] = json.loads(record["image"]) if record["image"] else None
+        record["translations"] = json.loads(record["translations"])
+        return record
+
+    def save(self, article: dict, target: str = "en"):
+        """
+        Inserts or updates an article after it went through the pipeline.
+
+        Expects the article dict produced by the scrape pipeline, with
+        'image' and 'title_en' set when available. Articles with a missing
+        REQUIRED_FIELDS field are not saved.
+        """
+        if any(article.get(field) is None for field in REQUIRED_FIELDS):
+            return
+        now = time.time()
+        content_hash = article.get("content_hash") or article_hash(article)
+        previous = self.get(article["url"])
+        translations = previous["translations"] if previous else {}
+        if previous and previous["content_hash"] != content_hash:
+            translations = {}
+        if article.get("title_en") is not None:
+            translations[target] = article["title_en"]
+        changed = previous is None or previous["content_hash"] != content_hash
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    title = excluded.title,
+                    content = excluded.content,
+                    cover_image_url = excluded.cover_image_url,
+                    content_hash = excluded.content_hash,
+                    image = excluded.image,
+                    translations = excluded.translations,
+                    last_checked = excluded.last_checked,
+                    last_changed = CASE WHEN ? THEN excluded.last_changed ELSE articles.last_changed END
+                """,
+                (
+                    article["url"], article.get("title"), article.get("content"), article.get("cover_image_url"),
+                    content_hash, json.dumps(article.get("image")) if article.get("image") else None,
+                    json.dumps(translations, ensure_ascii=False), now, now, now, changed,
+                ),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def classify_article(article: dict, record: dict, target: str = "en") -> dict:
+    """
+    Compares a fresh extraction with its stored record.
+
+    Sets 'crawl_status' to 'new', 'changed' or 'unchanged' and 'content_hash'.
+    Unchanged articles get the stored image entry and translation, when the
+    image file still exists, so later stages can skip them.
+
+    An extraction missing a REQUIRED_FIELDS field (e.g. the empty result of a
+    failed extraction) is not compared: it gets 'crawl_status' 'failed' and
+    is replaced by the stored record when there is one, so it never
+    overwrites a good record.
+    """
+    if any(article.get(field) is None for field in REQUIRED_FIELDS):
+        if record is not None:
+            return stored_article(record, target, status="failed")
+        article["crawl_status"] = "failed"
+        return article
+    article["content_hash"] = article_hash(article)
+    if record is None:
+        article["crawl_status"] = "new"
+    elif record["content_hash"] != article["content_hash"]:
+        article["crawl_status"] = "changed"
+    else:
+        article["crawl_status"] = "unchanged"
+        if record["image"] and os.path.exists(record["image"]["path"]):
+            article["image"] = {**record["image"], "status": "cached"}
+        if target in record["translations"]:
+            article["title_en"] = record["translations"][target]
+    return article
+
+
+def stored_article(record: dict, target: str = "en", status: str = "skipped") -> dict:
+    """
+    Rebuilds a pipeline article dict from a stored record without re-extracting it.
+
+    The article gets the given 'crawl_status', 'skipped' by default.
+    """
+    article = {
+        "url": record["url"],
+        "title": record["title"],
+        "content": record["content"],
+        "cover_image_url": record["cover_image_url"],
+        "content_hash": record["content_hash"],
+        "crawl_status": status,
+    }
+    if record["image"] and os.path.exists(record["image"]["path"]):
+        article["image"] = {**record["image"], "status": "cached"}
+    if target in record["translations"]:
+        article["title_en"] = record["translations"][target]
+    return article
@@ -1,5 +1,6 @@
 import logging
 import sys
+from urllib.parse import quote
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -7,10 +8,92 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 
 logger = logging.getLogger("webdriver")
 
+# URL patterns blocked by the fast-load profile: ad, tracking and analytics
+# hosts, plus web fonts and video, which the scraper never reads
+FAST_LOAD_BLOCKED_URLS = [
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googletagmanager.com*",
+    "*googletagservices.com*",
+    "*google-analytics.com*",
+    "*adservice.google.*",
+    "*amazon-adsystem.com*",
+    "*criteo.*",
+    "*taboola.com*",
+    "*outbrain.com*",
+    "*chartbeat.*",
+    "*scorecardresearch.com*",
+    "*facebook.net*",
+    "*permutive.*",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.m3u8",
+]
+
+# Chromium and Firefox setting that stops images from loading; <img src> stays in the DOM
+CHROMIUM_NO_IMAGES_PREFS = {"profile.managed_default_content_settings.images": 2}
+
+# Returns navigation timing and bytes transferred for the current page
+PAGE_LOAD_METRICS_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+var bytes = nav ? nav.transferSize : 0;
+for (var i = 0; i < resources.length; i++) {
+    bytes += resources[i].transferSize || 0;
+}
+return {
+    dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+    load_ms: nav ? nav.loadEventEnd : null,
+    transfer_bytes: bytes,
+    resources: resources.length
+};
+"""
+
+
+def _firefox_block_pac(patterns: list) -> str:
+    """
+    Builds a proxy auto-config script sending blocked URLs to a closed port.
+    """
+    conditions = " || ".join(f'shExpMatch(url, "{pattern}")' for pattern in patterns)
+    pac = (
+        "function FindProxyForURL(url, host) {"
+        f" if ({conditions}) return 'PROXY 127.0.0.1:9';"
+        " return 'DIRECT'; }"
+    )
+    return "data:text/javascript," + quote(pac)
+
+
+def _apply_cdp_blocking(driver, patterns: list):
+    """
+    Blocks URL patterns in a Chromium session through the DevTools protocol.
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def page_load_metrics(driver) -> dict:
+    """
+    Reads load timings and bytes transferred for the current page.
+
+    transfer_bytes only counts cross-origin resources that send a
+    Timing-Allow-Origin header, so it is a lower bound.
+
+    Returns:
+        dict: { 'dom_content_loaded_ms', 'load_ms', 'transfer_bytes', 'resources' }
+    """
+    return driver.execute_script(PAGE_LOAD_METRICS_SCRIPT)
+
+
 def get_webdriver(
     browser: str = "chrome",
     headless: bool = True,
-    window_size: str = "1920,1080"
+    window_size: str = "1920,1080",
+    fast_load: bool = False,
+    blocked_urls: list = None
 ) -> webdriver.Remote:
     """
     Returns a Selenium WebDriver instance for the selected browser.
@@ -19,6 +102,9 @@ def get_webdriver(
         browser (str): Browser type. One of: 'chrome', 'firefox', 'edge', 'safari', 'ie'
         headless (bool): Whether to run browser in headless mode (if supported)
         window_size (str): Browser window size (e.g. '1920,1080')
+        fast_load (bool): Use the fast-load profile: eager page loads, images
+            disabled and ads, trackers, fonts and video blocked (chrome, firefox, edge)
+        blocked_urls (list): Extra URL patterns to block with the fast-load profile
 
     Returns:
         WebDriver instance for the selected browser.
@@ -29,7 +115,8 @@ def get_webdriver(
         WebDriverException: If driver or browser is missing or misconfigured.
     """
     browser = browser.lower()
-    logger.info(f"Initializing WebDriver for browser: '{browser}', headless={headless}.")
+    logger.info("Initializing WebDriver for browser: '%s', headless=%s, fast_load=%s.", browser, headless, fast_load)
+    patterns = FAST_LOAD_BLOCKED_URLS + list(blocked_urls or [])
 
     # Parse and validate window_size
     width, height = 1920, 1080  # default fallback
@@ -37,7 +124,7 @@ def get_webdriver(
         try:
             width, height = [int(dim) for dim in window_size.split(",")]
         except Exception as ex:
-            logger.warning(f"Invalid window_size '{window_size}', using default 1920x1080. Error: {ex}")
+            logger.warning("Invalid window_size '%s', using default 1920x1080. Error: %s", window_size, ex)
 
     try:
         if browser == "chrome":
@@ -47,8 +134,14 @@ def get_webdriver(
                 options.add_argument('--disable-gpu')
                 options.add_argument('--no-sandbox')
             options.add_argument(f'--window-size={width},{height}')
+            if fast_load:
+                options.page_load_strategy = "eager"
+                options.add_experimental_option("prefs", CHROMIUM_NO_IMAGES_PREFS)
             logger.info("Launching Chrome WebDriver...")
-            return webdriver.Chrome(options=options)
+            driver = webdriver.Chrome(options=options)
+            if fast_load:
+                _apply_cdp_blocking(driver, patterns)
+            return driver
 
         elif browser == "firefox":
             options = FirefoxOptions()
@@ -56,6 +149,13 @@ def get_webdriver(
                 options.add_argument('--headless')
             options.add_argument(f'--width={width}')
             options.add_argument(f'--height={height}')
+            if fast_load:
+                options.page_load_strategy = "eager"
+                options.set_preference("permissions.default.image", 2)
+                options.set_preference("gfx.downloadable_fonts.enabled", False)
+                options.set_preference("media.autoplay.default", 5)
+                options.set_preference("network.proxy.type", 2)
+                options.set_preference("network.proxy.autoconfig_url", _firefox_block_pac(patterns))
             logger.info("Launching Firefox WebDriver...")
             return webdriver.Firefox(options=options)
 
@@ -66,14 +166,22 @@ def get_webdriver(
                 options.add_argument('--no-sandbox')
                 options.add_argument('--disable-dev-shm-usage')
             options.add_argument(f'--window-size={width},{height}')
+            if fast_load:
+                options.page_load_strategy = "eager"
+                options.add_experimental_option("prefs", CHROMIUM_NO_IMAGES_PREFS)
             logger.info("Launching Edge WebDriver...")
-            return webdriver.Edge(options=options)
+            driver = webdriver.Edge(options=options)
+            if fast_load:
+                _apply_cdp_blocking(driver, patterns)
+            return driver
 
         elif browser == "safari":
             if sys.platform != "darwin":
                 error_msg = "Safari WebDriver is only available on macOS."
                 raise NotImplementedError(error_msg)
             # Safari headless support is limited
+            if fast_load:
+                logger.warning("The fast-load profile is not supported on Safari, ignoring it.")
             logger.info("Launching Safari WebDriver...")
             return webdriver.Safari()
 
@@ -82,6 +190,8 @@ def get_webdriver(
                 error_msg = "Internet Explorer WebDriver is only available on Windows."
                 raise NotImplementedError(error_msg)
 
+            if fast_load:
+                logger.warning("The fast-load profile is not supported on Internet Explorer, ignoring it.")
             options = webdriver.IeOptions()
             logger.info("Launching Internet Explorer WebDriver...")
             return webdriver.Ie(options=options)
@@ -92,7 +202,7 @@ def get_webdriver(
         
     except Exception as e:
         # Log and re-raise for caller to handle
-        logger.error(f"Failed to initialize the '{browser}' WebDriver: {type(e).__name__}")
+        logger.error("Failed to initialize the '%s' WebDriver: %s", browser, type(e).__name__)
         raise 
 
 
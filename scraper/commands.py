@@ -0,0 +1,55 @@
+import time
+from collections import Counter
+
+
+class CommandCounter:
+    """
+    Counts the WebDriver commands a driver sends, grouped by command name,
+    and the round-trip time spent in each.
+
+    Every command, including those issued through WebElement methods, goes
+    through WebDriver.execute, which is wrapped on the driver instance while
+    the counter is active.
+
+    Usage:
+        with CommandCounter(driver) as commands:
+            extract_article_details(driver, url, logger)
+        logger.info("%d WebDriver commands: %s", commands.total, commands.summary())
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.counts = Counter()
+        self.seconds = Counter()
+        self._previous = None
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def summary(self) -> str:
+        """
+        Formats the counts as 'command=count' pairs, most frequent first.
+        """
+        return ", ".join(f"{name}={count}" for name, count in self.counts.most_common())
+
+    def __enter__(self):
+        self._previous = self.driver.__dict__.get("execute")
+        execute = self.driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.counts[driver_command] += 1
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.seconds[driver_command] += time.perf_counter() - start
+
+        self.driver.execute = counting_execute
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._previous is None:
+            del self.driver.execute
+        else:
+            self.driver.execute = self._previous
@@ -0,0 +1,165 @@
+import re
+import math
+import hashlib
+import logging
+from datetime import date
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from scraper.elpais import OPINION_URL
+from scraper.waits import wait_for_dom
+
+logger = logging.getLogger(__name__)
+
+# Article URLs carry their publication date, e.g. /opinion/2025-07-27/titulo.html
+URL_DATE_PATTERN = re.compile(r"/(\d{4})-(\d{2})-(\d{2})/")
+
+# Returns the links of the articles from index arguments[0] on, so each
+# scroll step only transfers the articles that are new since the last one
+NEW_ARTICLE_LINKS_SCRIPT = """
+var articles = document.querySelectorAll('article');
+var links = [];
+for (var i = arguments[0]; i < articles.length; i++) {
+    var link = articles[i].querySelector('header > h2 > a') || articles[i].querySelector('h2 a');
+    links.push(link ? link.href : null);
+}
+return {count: articles.length, links: links};
+"""
+
+# Finds the way to more articles: a pagination link, a "more" button, or
+# nothing, in which case the crawler scrolls to trigger infinite loading
+NEXT_PAGE_SCRIPT = """
+var next = document.querySelector('a[rel="next"]');
+if (next && next.href) {
+    return {kind: 'link', href: next.href};
+}
+var candidates = document.querySelectorAll('a[href], button');
+for (var i = 0; i < candidates.length; i++) {
+    var text = candidates[i].textContent.trim().toLowerCase();
+    if (/^(ver m[aá]s|m[aá]s noticias|cargar m[aá]s|m[aá]s art[ií]culos|siguiente)/.test(text)) {
+        if (candidates[i].tagName === 'A' && candidates[i].href && candidates[i].href.indexOf('#') === -1) {
+            return {kind: 'link', href: candidates[i].href};
+        }
+        candidates[i].click();
+        return {kind: 'button'};
+    }
+}
+window.scrollTo(0, document.body.scrollHeight);
+return {kind: 'scroll'};
+"""
+
+
+class BloomFilter:
+    """
+    Fixed-memory set of strings with a bounded false-positive rate.
+
+    A false positive makes the crawler skip a URL it has not seen; there are
+    no false negatives, so no URL is ever yielded twice.
+
+    Args:
+        capacity (int): Expected number of items
+        error_rate (float): Target false-positive rate at capacity
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+def article_date(url: str):
+    """
+    Returns the publication date embedded in an article URL, or None.
+    """
+    match = URL_DATE_PATTERN.search(url)
+    if not match:
+        return None
+    try:
+        return date(*(int(part) for part in match.groups()))
+    except ValueError:
+        return None
+
+
+def crawl_article_urls(driver: WebDriver, logger, sections: list = None, max_articles: int = 100,
+                       since: date = None, max_pages: int = 20, seen=None, timeout: int = 10):
+    """
+    Yields article URLs from one or more sections, following pagination,
+    "more" buttons and infinite scrolling beyond the first render.
+
+    URLs are yielded as soon as they are found, so extraction can start
+    before discovery finishes, e.g. by passing the generator as the source of
+    a Pipeline. The crawl driver must not be shared with the extraction stage.
+
+    Args:
+        driver (WebDriver): Selenium driver instance
+        sections (list): Section URLs to crawl (default: the Opinión section)
+        max_articles (int): Stop after yielding this many URLs
+        since (date): Skip articles dated before this day; a section stops
+            once a whole page is older than it
+        max_pages (int): Maximum pages or scroll steps per section
+        seen: Set-like object of URLs already yielded (default: a new set;
+            pass a BloomFilter to bound memory on very long crawls)
+        timeout (int): Seconds to wait for more articles after each step
+
+    Yields:
+        str: Article URLs.
+    """
+    sections = sections or [OPINION_URL]
+    seen = set() if seen is None else seen
+    yielded = 0
+
+    for section_url in sections:
+        logger.info("Crawling section %s", section_url)
+        driver.get(section_url)
+        visited = {section_url}
+        offset = 0
+        for page in range(max_pages):
+            try:
+                wait_for_dom(driver, "return document.querySelectorAll('article').length > %d;" % offset, timeout)
+            except TimeoutException:
+                logger.info("No more articles in %s after %d steps.", section_url, page)
+                break
+
+            found = driver.execute_script(NEW_ARTICLE_LINKS_SCRIPT, offset)
+            offset = found["count"]
+            fresh = older = 0
+            for url in found["links"]:
+                if not url or url in seen:
+                    continue
+                seen.add(url)
+                published = article_date(url)
+                if since and published and published < since:
+                    older += 1
+                    continue
+                fresh += 1
+                yield url
+                yielded += 1
+                if yielded >= max_articles:
+                    logger.info("Crawl reached %d articles.", max_articles)
+                    return
+            logger.info("Step %d of %s: %d new article URLs.", page + 1, section_url, fresh)
+            if older and not fresh:
+                logger.info("Reached articles older than %s in %s.", since, section_url)
+                break
+
+            next_page = driver.execute_script(NEXT_PAGE_SCRIPT)
+            if next_page["kind"] == "link":
+                if next_page["href"] in visited:
+                    break
+                visited.add(next_page["href"])
+                driver.get(next_page["href"])
+                offset = 0
+
+    logger.info("Crawl finished with %d article URLs.", yielded)
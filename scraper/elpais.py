@@ -3,60 +3,110 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 import time
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from urllib.parse import urljoin
+from scraper.images import select_image_candidate
+from scraper.waits import find_opinion_link, wait_for_html_lang, wait_for_selector
+from utils.metrics import timed
+from utils.resilience import AdaptiveCall, driver_target
 
-def is_spanish_website(driver: WebDriver, logger, timeout:int = 10) -> bool:
+OPINION_URL = "https://elpais.com/opinion/"
+
+# Bounds of the page waits when no explicit timeout is given: they start at
+# 'default' and then follow recent latencies of the same browser/platform
+WAIT_TIMEOUTS = {"default": 10, "floor": 2, "ceiling": 30}
+
+# Collects the link of the first n <article> elements in one round trip
+ARTICLE_LINKS_SCRIPT = """
+return Array.from(document.querySelectorAll('article')).slice(0, arguments[0]).map(function (art) {
+    var link = art.querySelector('header > h2 > a');
+    return link ? link.href : null;
+});
+"""
+
+# Collects all header fields of an article page in one round trip
+ARTICLE_DETAILS_SCRIPT = """
+var header = document.querySelector('article > header');
+var root = header || document.querySelector('article');
+if (!root) {
+    return null;
+}
+function text(tag) {
+    var el = root.querySelector(tag);
+    return el ? el.innerText.trim() : null;
+}
+var img = root.querySelector('img');
+return {
+    has_header: header !== null,
+    title: text('h1'),
+    content: text('h2'),
+    cover_image: img ? {
+        src: img.src,
+        srcset: img.getAttribute('srcset'),
+        sizes: img.getAttribute('sizes'),
+        width: img.getAttribute('width')
+    } : null
+};
+"""
+
+@timed("scraper.is_spanish_website")
+def is_spanish_website(driver: WebDriver, logger, timeout:int = None) -> bool:
     """
     Checks the <html lang="..."> tag to confirm the site is in Spanish.
     
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
-        timeout: Time to wait before the html loads
+        timeout: Time to wait before the html loads (default: adaptive)
 
     Returns:
         bool: True if site language is Spanish, False otherwise.
     """
     try:
         # Wait for the <html> lang attribute to be set/updated dynamically
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.find_element(By.TAG_NAME, "html").get_attribute("lang") is not None
-        )
-        html_tag = driver.find_element(By.TAG_NAME, "html")
-        lang = html_tag.get_attribute("lang")
-        logger.info(f"Detected page language: {lang}")
+        with AdaptiveCall("wait.html_lang", driver_target(driver), timeout, **WAIT_TIMEOUTS) as call:
+            lang = wait_for_html_lang(driver, call.timeout)
+        logger.info("Detected page language: %s", lang)
         return lang is not None and lang.lower().startswith("es")
     except Exception as e:
-        logger.error(f"Error detecting the page")
+        logger.error("Error detecting the page")
         raise
 
-def go_to_opinion_section(driver: WebDriver, logger, timeout:int = 10):
+@timed("scraper.go_to_opinion_section")
+def go_to_opinion_section(driver: WebDriver, logger, timeout:int = None, opinion_url: str = OPINION_URL):
     """
     Navigate to El País Opinión section.
 
+    The link-text, href and direct-URL strategies are raced in the page, so
+    a missing link falls back to the direct URL as soon as the page has
+    loaded instead of after the full timeout.
+
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
-        timeout: Time to wait before the html loads
+        timeout: Time to wait before the html loads (default: adaptive)
+        opinion_url (str): Section URL used by the direct strategy
     """
     try:
-        opinion_link = WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable((By.LINK_TEXT, "Opinión"))
-        )
-        opinion_link.click()
-        # Now wait for navigation to /opinion page to complete
-        WebDriverWait(driver, timeout).until(
-            lambda d: "/opinion" in d.current_url
-        )
-    except (TimeoutException, NoSuchElementException):
-        logger.warning("Could not find clickable Opinión link, navigating directly to section.")
-        driver.get("https://elpais.com/opinion/")
+        with AdaptiveCall("wait.opinion_link", driver_target(driver), timeout, **WAIT_TIMEOUTS) as call:
+            found = find_opinion_link(driver, call.timeout)
+        if found["strategy"] == "direct":
+            logger.warning(
+                "Could not find clickable Opinión link, navigating directly to section (decided in %.0f ms).",
+                found['elapsed'] * 1000
+            )
+            driver.get(opinion_url)
+            return
+        logger.info("Found Opinión link by %s in %.0f ms.", found['strategy'], found['elapsed'] * 1000)
+        driver.get(found["href"])
+        if "/opinion" not in driver.current_url:
+            logger.warning("Opinión link did not lead to the section, navigating directly to section.")
+            driver.get(opinion_url)
 
     except Exception as e:
-        logger.error(f"Unexpected error navigating to Opinión")
+        logger.error("Unexpected error navigating to Opinión")
         raise 
 
 
-def get_first_n_opinion_articles(driver: WebDriver, logger, n: int = 5, timeout: int = 10) -> list[dict]:
+@timed("scraper.get_first_n_opinion_articles")
+def get_first_n_opinion_articles(driver: WebDriver, logger, n: int = 5, timeout: int = None, batched: bool = False) -> list[dict]:
     """
     Fetches the URLs for the first n Opinion articles listed on the page.
     Waits robustly for articles to appear.
@@ -64,16 +114,20 @@ def get_first_n_opinion_articles(driver: WebDriver, logger, n: int = 5, timeout:
     Args:
         driver (WebDriver): Selenium driver instance
         n (int): Number of articles to fetch (default 5)
-        timeout (int): Seconds to wait for articles to appear (default 10)
+        timeout (int): Seconds to wait for articles to appear (default: adaptive)
+        batched (bool): Collect all links with one injected script instead of
+            two WebDriver commands per article (default False)
     Returns:
         List[dict]: [{ 'url': str }]
     """
     articles_data = []
     try:
         # Wait for at least one <article> to be present
-        WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((By.TAG_NAME, "article"))
-        )
+        with AdaptiveCall("wait.article_list", driver_target(driver), timeout, **WAIT_TIMEOUTS) as call:
+            wait_for_selector(driver, "article", call.timeout)
+        if batched:
+            return _get_article_links_batched(driver, logger, n)
+
         article_elements = driver.find_elements(By.TAG_NAME, "article")
         if not article_elements:
             logger.warning("No <article> elements found on Opinión page.")
@@ -88,37 +142,64 @@ def get_first_n_opinion_articles(driver: WebDriver, logger, n: int = 5, timeout:
                 else:
                     logger.warning("Article missing link URL.")
             except Exception as e:
-                logger.warning(f"Failed to extract article link: {type(e).__name__}: {e}")
+                logger.warning("Failed to extract article link: %s: %s", type(e).__name__, e)
 
-        logger.info(f"Collected {len(articles_data)} article URLs from Opinión section.")
+        logger.info("Collected %d article URLs from Opinión section.", len(articles_data))
         return articles_data
 
     except TimeoutException:
-        logger.error(f"Timed out waiting for <article> elements on page.")
+        logger.error("Timed out waiting for <article> elements on page.")
         return []
     except Exception as e:
-        logger.exception(f"Unexpected error while collecting article links: {e}")
+        logger.exception("Unexpected error while collecting article links: %s", e)
         raise
 
 
-def extract_article_details(driver, article_url, logger, timeout=10):
+def _get_article_links_batched(driver: WebDriver, logger, n: int) -> list[dict]:
+    """
+    Single-round-trip variant of the link loop in get_first_n_opinion_articles.
+    """
+    links = driver.execute_script(ARTICLE_LINKS_SCRIPT, n) or []
+    if not links:
+        logger.warning("No <article> elements found on Opinión page.")
+        return []
+
+    articles_data = []
+    for url in links:
+        if url:
+            articles_data.append({'url': url})
+        else:
+            logger.warning("Article missing link URL.")
+    logger.info("Collected %d article URLs from Opinión section.", len(articles_data))
+    return articles_data
+
+
+@timed("scraper.extract_article_details")
+def extract_article_details(driver, article_url, logger, timeout=None, batched=False, archive=None):
     """
     Loads a news article and extracts its title, content/summary, and cover image.
-    Robust to missing elements and dynamic loading.
+    Robust to missing elements and dynamic loading. When the cover image has
+    a srcset, the smallest candidate covering COVER_IMAGE_WIDTH is used.
 
     Args:
         driver (WebDriver): Selenium driver instance
         article_url: Url of the article to fetch the details
-        timeout (int): Seconds to wait for articles to appear (default 10)
+        timeout (int): Seconds to wait for articles to appear (default: adaptive)
+        batched (bool): Read all header fields with one injected script instead
+            of one WebDriver command per field (default False)
+        archive (SnapshotArchive): Optional archive the rendered page is saved
+            to, so it can be re-extracted later with replay_extract
     """
     driver.get(article_url)
 
     try:
-        WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "article > header"))
-        )
+        with AdaptiveCall("wait.article_header", driver_target(driver), timeout, **WAIT_TIMEOUTS) as call:
+            wait_for_selector(driver, "article > header", call.timeout)
     except TimeoutException:
-        logger.error(f"Timeout waiting for main article header at {article_url}")
+        logger.error("Timeout waiting for main article header at %s", article_url)
+
+    if archive is not None:
+        archive.capture(driver, article_url)
 
     results = {
         "url": article_url,
@@ -127,33 +208,74 @@ def extract_article_details(driver, article_url, logger, timeout=10):
         "cover_image_url": None,
     }
 
+    if batched:
+        return _extract_article_details_batched(driver, article_url, logger, results)
+
     try:
         try:
             header = driver.find_element(By.CSS_SELECTOR, "article > header")
         except Exception:
-            logger.warning(f"No 'article > header' found at {article_url}, using <article> as fallback.")
+            logger.warning("No 'article > header' found at %s, using <article> as fallback.", article_url)
             header = driver.find_element(By.TAG_NAME, "article")
 
         # Extract title (h1)
         try:
             results["title"] = header.find_element(By.TAG_NAME, "h1").text.strip()
         except Exception:
-            logger.warning(f"Missing <h1> (title) in {article_url}")
+            logger.warning("Missing <h1> (title) in %s", article_url)
 
         # Extract summary/content (h2)
         try:
             results["content"] = header.find_element(By.TAG_NAME, "h2").text.strip()
         except Exception:
-            logger.warning(f"Missing <h2> (summary/content) in {article_url}")
+            logger.warning("Missing <h2> (summary/content) in %s", article_url)
 
-        # Extract cover image (first img)
+        # Extract cover image (first img), preferring a smaller srcset candidate
         try:
-            results["cover_image_url"] = header.find_element(By.TAG_NAME, "img").get_attribute("src")
+            img = header.find_element(By.TAG_NAME, "img")
+            src, srcset = img.get_attribute("src"), img.get_attribute("srcset")
+            if srcset:
+                src = _cover_image_url(article_url, src, srcset, img.get_attribute("sizes"), img.get_attribute("width"))
+            results["cover_image_url"] = src
         except Exception:
-            logger.info(f"No cover image found in header at {article_url}")
+            logger.info("No cover image found in header at %s", article_url)
 
     except Exception as e:
-        logger.error(f"Failed to extract article details from {article_url}: {type(e).__name__}: {e}")
+        logger.error("Failed to extract article details from %s: %s: %s", article_url, type(e).__name__, e)
         raise
 
     return results
+
+
+def _extract_article_details_batched(driver, article_url, logger, results):
+    """
+    Single-round-trip variant of the field lookups in extract_article_details.
+    """
+    try:
+        fields = driver.execute_script(ARTICLE_DETAILS_SCRIPT)
+        if fields is None:
+            raise NoSuchElementException(f"No <article> element at {article_url}")
+    except Exception as e:
+        logger.error("Failed to extract article details from %s: %s: %s", article_url, type(e).__name__, e)
+        raise
+
+    if not fields["has_header"]:
+        logger.warning("No 'article > header' found at %s, using <article> as fallback.", article_url)
+    if fields["title"] is None:
+        logger.warning("Missing <h1> (title) in %s", article_url)
+    if fields["content"] is None:
+        logger.warning("Missing <h2> (summary/content) in %s", article_url)
+    image = fields["cover_image"]
+    if image is None:
+        logger.info("No cover image found in header at %s", article_url)
+
+    results["title"] = fields["title"]
+    results["content"] = fields["content"]
+    if image is not None:
+        results["cover_image_url"] = _cover_image_url(article_url, image["src"], image["srcset"], image["sizes"], image["width"])
+    return results
+
+
+def _cover_image_url(article_url, src, srcset, sizes, width):
+    url = select_image_candidate(src, srcset, sizes, width)
+    return urljoin(article_url, url) if url else None
@@ -0,0 +1,103 @@
+import re
+
+# Width in CSS pixels the cover images are displayed (and thumbnailed) at
+COVER_IMAGE_WIDTH = 640
+
+# A srcset descriptor such as '640w' or '1.5x'
+DESCRIPTOR_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)([wx])$", re.IGNORECASE)
+
+# The length of a 'sizes' entry when given in pixels, e.g. '(min-width: 800px) 640px'
+PIXEL_LENGTH_PATTERN = re.compile(r"(\d+(?:\.\d+)?)px\s*$", re.IGNORECASE)
+
+
+def parse_srcset(srcset: str) -> list[tuple]:
+    """
+    Splits a srcset attribute into its image candidates.
+
+    URLs may themselves contain commas (e.g. 'w_640,c_fill' transformations),
+    so candidates are split the way browsers do: a URL runs up to the next
+    whitespace, and its descriptors up to the next comma.
+
+    Args:
+        srcset (str): Value of the srcset attribute
+
+    Returns:
+        List[tuple]: (url, value, unit) per candidate, where unit is 'w' or
+        'x' (value 1.0 and unit 'x' when no descriptor was given). Candidates
+        with invalid descriptors are dropped.
+    """
+    candidates = []
+    position, length = 0, len(srcset or "")
+    while position < length:
+        while position < length and (srcset[position].isspace() or srcset[position] == ","):
+            position += 1
+        start = position
+        while position < length and not srcset[position].isspace():
+            position += 1
+        url = srcset[start:position]
+        descriptors = []
+        if url.endswith(","):
+            url = url.rstrip(",")
+        else:
+            end = srcset.find(",", position)
+            end = length if end == -1 else end
+            descriptors = srcset[position:end].split()
+            position = end
+        if not url:
+            continue
+        if not descriptors:
+            candidates.append((url, 1.0, "x"))
+            continue
+        match = DESCRIPTOR_PATTERN.match(descriptors[0])
+        if match and len(descriptors) == 1:
+            candidates.append((url, float(match.group(1)), match.group(2).lower()))
+    return candidates
+
+
+def _layout_width(sizes: str, width) -> float:
+    if sizes:
+        # The last entry has no media condition and applies by default
+        match = PIXEL_LENGTH_PATTERN.search(sizes.rsplit(",", 1)[-1])
+        if match:
+            return float(match.group(1))
+    try:
+        return float(width) if width else None
+    except (TypeError, ValueError):
+        return None
+
+
+def select_image_candidate(src: str, srcset: str = None, sizes: str = None, width=None,
+                           target_width: int = COVER_IMAGE_WIDTH) -> str:
+    """
+    Picks the smallest image candidate that is at least target_width pixels wide.
+
+    Width descriptors are compared directly. Density descriptors (and src,
+    as the 1x candidate) are converted to widths using the layout width
+    from 'sizes' when it is given in pixels, or else the width attribute.
+    When no candidate is wide enough the widest one is used, and when no
+    widths are known at all src is kept.
+
+    Args:
+        src (str): Value of the src attribute
+        srcset (str): Value of the srcset attribute
+        sizes (str): Value of the sizes attribute
+        width: Value of the width attribute
+        target_width (int): Smallest acceptable image width in pixels
+
+    Returns:
+        str: URL of the chosen candidate, as written in the attribute (may be relative).
+    """
+    candidates = parse_srcset(srcset) if srcset else []
+    if not candidates:
+        return src
+    layout = _layout_width(sizes, width)
+    widths = []
+    for url, value, unit in candidates + ([(src, 1.0, "x")] if src else []):
+        if unit == "w":
+            widths.append((value, url))
+        elif layout:
+            widths.append((value * layout, url))
+    if not widths:
+        return src or candidates[0][0]
+    large_enough = [candidate for candidate in widths if candidate[0] >= target_width]
+    return min(large_enough)[1] if large_enough else max(widths)[1]
@@ -0,0 +1,255 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+from scraper.browser import get_webdriver
+from scraper.elpais import extract_article_details
+from utils.metrics import watch_driver
+
+logger = logging.getLogger("webdriver")
+
+# Seconds session() waits for a free session before giving up
+ACQUIRE_TIMEOUT = 300
+
+# Seconds between re-checks of a blocked acquire, so a slot freed by a failed
+# replace can be filled with a new session
+ACQUIRE_POLL_INTERVAL = 1.0
+
+
+class DriverPool:
+    """
+    A fixed-size pool of WebDriver sessions built on get_webdriver.
+
+    Sessions are started in parallel and handed out one at a time, so each
+    session is only ever driven by one thread. A session that dies while in
+    use is quit and replaced with a fresh one.
+
+    Args:
+        size (int): Number of browser sessions to keep open
+        browser (str): Browser type passed to get_webdriver
+        factory (callable): Optional zero-argument callable creating a driver,
+            used instead of get_webdriver (e.g. for remote sessions)
+        lazy (bool): Create sessions on first use instead of on start, so a
+            run that needs no browser never launches one
+        **driver_kwargs: Extra keyword arguments passed to get_webdriver
+    """
+
+    def __init__(self, size: int = 3, browser: str = "chrome", factory=None, lazy: bool = False, **driver_kwargs):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}.")
+        self.size = size
+        self._factory = factory or (lambda: get_webdriver(browser, **driver_kwargs))
+        self._idle = queue.Queue()
+        self._drivers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._lazy = lazy
+        self._created = 0
+
+    def start(self) -> "DriverPool":
+        """
+        Launches all sessions of the pool concurrently, unless the pool is lazy.
+
+        If any session fails to start, the ones that did are quit and the
+        first error is raised.
+        """
+        if self._lazy:
+            return self
+        self._created = self.size
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._create) for _ in range(self.size)]
+        drivers, errors = [], []
+        for future in futures:
+            try:
+                drivers.append(future.result())
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            # Quit the sessions that did start, or their browsers outlive the process
+            for driver in drivers:
+                self._quit(driver)
+            self._created = 0
+            raise errors[0]
+        with self._lock:
+            self._drivers.update(drivers)
+        for driver in drivers:
+            self._idle.put(driver)
+        logger.info("Driver pool started with %d sessions.", self.size)
+        return self
+
+    def acquire(self, timeout: float = None):
+        """
+        Takes an idle session out of the pool, blocking until one is free.
+
+        Raises:
+            TimeoutError: If no session became free within timeout seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._closed:
+                raise RuntimeError("Driver pool is closed.")
+            with self._lock:
+                create = self._idle.empty() and self._created < self.size
+                if create:
+                    self._created += 1
+            if create:
+                try:
+                    driver = self._create()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+                with self._lock:
+                    self._drivers.add(driver)
+                return driver
+            wait = ACQUIRE_POLL_INTERVAL if deadline is None else min(ACQUIRE_POLL_INTERVAL, deadline - time.monotonic())
+            try:
+                return self._idle.get(timeout=max(wait, 0))
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"No WebDriver session became free within {timeout} seconds.") from None
+
+    def release(self, driver):
+        """
+        Returns a healthy session to the pool.
+        """
+        if self._closed:
+            self._quit(driver)
+        else:
+            self._idle.put(driver)
+
+    def replace(self, driver):
+        """
+        Quits a broken session and puts a newly created one in its place.
+
+        If the new session cannot be created, its slot is freed so that a
+        later acquire creates one instead.
+        """
+        with self._lock:
+            self._drivers.discard(driver)
+        self._quit(driver)
+        try:
+            new_driver = self._create()
+        except Exception as e:
+            with self._lock:
+                self._created -= 1
+            logger.warning("Failed to replace a WebDriver session: %s: %s", type(e).__name__, e)
+            return
+        with self._lock:
+            self._drivers.add(new_driver)
+        logger.warning("Replaced a failed WebDriver session in the pool.")
+        self.release(new_driver)
+
+    @contextmanager
+    def session(self, timeout: float = ACQUIRE_TIMEOUT):
+        """
+        Context manager yielding a pooled session.
+
+        The session is returned to the pool on exit, or replaced if it is no
+        longer responsive after an error. Waits at most timeout seconds for a
+        free session (None waits forever).
+        """
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except Exception:
+            if is_session_alive(driver):
+                self.release(driver)
+            else:
+                self.replace(driver)
+            raise
+        else:
+            self.release(driver)
+
+    def close(self):
+        """
+        Quits every session owned by the pool.
+        """
+        self._closed = True
+        with self._lock:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+        for driver in drivers:
+            self._quit(driver)
+        logger.info("Driver pool closed.")
+
+    def _create(self):
+        return watch_driver(self._factory())
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Failed to quit WebDriver session: %s: %s", type(e).__name__, e)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def is_session_alive(driver) -> bool:
+    """
+    Checks whether a WebDriver session still answers commands.
+    """
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+def pooled_extractor(pool: DriverPool, logger, timeout: int = None, retries: int = 1, batched: bool = False, archive=None,
+                     acquire_timeout: float = ACQUIRE_TIMEOUT):
+    """
+    Returns a thread-safe function extracting one article on a pooled session.
+
+    The function retries on a fresh session when one fails, and returns a
+    result with None fields once all attempts are exhausted. With an archive,
+    every rendered article page is also snapshotted into it. Each attempt
+    waits at most acquire_timeout seconds for a free session.
+    """
+    def extract(article_url):
+        for attempt in range(retries + 1):
+            try:
+                with pool.session(acquire_timeout) as driver:
+                    return extract_article_details(driver, article_url, logger, timeout, batched=batched, archive=archive)
+            except Exception as e:
+                logger.warning("Attempt %d failed for %s: %s: %s", attempt + 1, article_url, type(e).__name__, e)
+        logger.error("Giving up on %s after %d attempts.", article_url, retries + 1)
+        return {
+            "url": article_url,
+            "title": None,
+            "content": None,
+            "cover_image_url": None,
+        }
+
+    return extract
+
+
+def extract_articles_pooled(pool: DriverPool, article_urls: list, logger, timeout: int = None, retries: int = 1, batched: bool = False, archive=None) -> list[dict]:
+    """
+    Extracts article details for many URLs across the sessions of a DriverPool.
+
+    Args:
+        pool (DriverPool): A started driver pool
+        article_urls (list): Article URLs to extract
+        logger: Logger for progress and errors
+        timeout (int): Seconds to wait for each article header (default: adaptive)
+        retries (int): Extra attempts for an article whose session failed (default 1)
+        batched (bool): Use the single-round-trip mode of extract_article_details
+        archive (SnapshotArchive): Optional archive for the rendered pages
+
+    Returns:
+        List[dict]: Results of extract_article_details, in the same order as
+        article_urls. Articles that could not be extracted have None fields.
+    """
+    extract = pooled_extractor(pool, logger, timeout, retries, batched, archive)
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        results = list(executor.map(extract, article_urls))
+    logger.info("Extracted %d articles using %d WebDriver sessions.", len(results), pool.size)
+    return results
@@ -0,0 +1,220 @@
+import os
+import logging
+from scraper.browser import get_webdriver
+from utils.metrics import watch_driver
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger("webdriver")
+
+# Storage types cleared for the current origin on Chromium browsers
+CDP_STORAGE_TYPES = "cache_storage,indexeddb,local_storage,service_workers,shader_cache,websql"
+
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+def _proc_children() -> dict:
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces, so fields are read after its closing parenthesis
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def _proc_tree_rss(pid: int) -> int:
+    children = _proc_children()
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, ()))
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                total += int(f.read().split()[1]) * page_size
+        except OSError:
+            continue
+    return total
+
+
+def process_tree_rss(pid: int) -> int:
+    """
+    Sums the resident set size of a process and all of its descendants.
+
+    Uses psutil when installed and /proc otherwise. Shared pages are counted
+    once per process, so the figure overstates the real footprint but
+    tracks its growth.
+
+    Returns:
+        int: Bytes, or None when the process tree cannot be inspected.
+    """
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+    if os.path.isdir("/proc"):
+        return _proc_tree_rss(pid)
+    return None
+
+
+def driver_pid(driver) -> int:
+    """
+    Returns the PID of a local driver's service process (the browser is its
+    child), or None for remote sessions.
+    """
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    return getattr(process, "pid", None)
+
+
+class ManagedSession:
+    """
+    WebDriver proxy that recycles its browser to keep memory bounded on long crawls.
+
+    Navigations through get are counted. Every clear_every pages the
+    browser's cache and the current origin's storage are cleared in place;
+    every check_every pages the RSS of the driver's process tree is
+    measured. Once max_pages pages were loaded or the tree uses more than
+    max_rss_mb, the browser is quit and a new one is created with the same
+    options before the next navigation. Everything else is delegated to the
+    current driver, so a ManagedSession can be used wherever a WebDriver is,
+    including as a DriverPool factory:
+
+        DriverPool(size=3, factory=lambda: ManagedSession("chrome", max_pages=200))
+
+    Args:
+        browser (str): Browser type passed to get_webdriver
+        max_pages (int): Pages loaded before the browser is recycled (None for no limit)
+        max_rss_mb (float): Process tree RSS in MB above which the browser is recycled (None for no limit)
+        clear_every (int): Pages between in-place cache and storage clears (None to never clear)
+        check_every (int): Pages between RSS measurements
+        factory (callable): Optional zero-argument callable creating the driver,
+            used instead of get_webdriver
+        **driver_kwargs: Extra keyword arguments passed to get_webdriver
+    """
+
+    def __init__(self, browser: str = "chrome", max_pages: int = 200, max_rss_mb: float = 1500,
+                 clear_every: int = 25, check_every: int = 10, factory=None, **driver_kwargs):
+        self.max_pages = max_pages
+        self.max_rss = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self.clear_every = clear_every
+        self.check_every = check_every
+        self._factory = factory or (lambda: get_webdriver(browser, **driver_kwargs))
+        self.stats = {"pages": 0, "recycles": 0, "clears": 0, "last_rss": None}
+        self.pages = 0
+        self._recycle_due = False
+        self._driver = None
+
+    @property
+    def driver(self):
+        """
+        The current WebDriver, created on first use.
+        """
+        if self._driver is None:
+            self._driver = watch_driver(self._factory())
+            self.pages = 0
+            self._recycle_due = False
+        return self._driver
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the proxy itself
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.driver, name)
+
+    def execute(self, driver_command, params=None):
+        return self.driver.execute(driver_command, params)
+
+    def get(self, url: str):
+        """
+        Navigates to url, recycling or clearing the browser first when due.
+        """
+        if self._recycle_due:
+            self.recycle()
+        elif self.clear_every and self.pages and self.pages % self.clear_every == 0:
+            self.clear_state()
+        self.driver.get(url)
+        self.pages += 1
+        self.stats["pages"] += 1
+        self._check_limits()
+
+    def _check_limits(self):
+        if self.max_pages and self.pages >= self.max_pages:
+            self._recycle_due = True
+            return
+        if self.max_rss and self.pages % self.check_every == 0:
+            rss = self.rss()
+            self.stats["last_rss"] = rss
+            if rss is not None and rss > self.max_rss:
+                logger.info("Browser process tree uses %.0f MB after %d pages, recycling it.", rss / 1048576, self.pages)
+                self._recycle_due = True
+
+    def rss(self) -> int:
+        """
+        RSS in bytes of the current driver's process tree, or None if unknown.
+        """
+        pid = driver_pid(self._driver) if self._driver is not None else None
+        return process_tree_rss(pid) if pid else None
+
+    def clear_state(self):
+        """
+        Clears the HTTP cache and the current origin's storage without restarting.
+
+        Cookies are kept, so consent and edition choices survive.
+        """
+        driver = self._driver
+        if driver is None:
+            return
+        try:
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                origin = driver.execute_script("return location.origin;")
+                if origin and origin != "null":
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": CDP_STORAGE_TYPES})
+            driver.execute_script(CLEAR_STORAGE_SCRIPT)
+            self.stats["clears"] += 1
+        except Exception as e:
+            logger.warning("Could not clear browser state: %s: %s", type(e).__name__, e)
+
+    def recycle(self):
+        """
+        Quits the current browser; the next command starts a new one.
+        """
+        if self._driver is not None:
+            logger.info("Recycling WebDriver session after %d pages.", self.pages)
+            self._quit()
+            self.stats["recycles"] += 1
+        self._recycle_due = False
+
+    def _quit(self):
+        driver, self._driver = self._driver, None
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Failed to quit WebDriver session: %s: %s", type(e).__name__, e)
+
+    def quit(self):
+        if self._driver is not None:
+            self._quit()
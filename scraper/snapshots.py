@@ -0,0 +1,241 @@
+import os
+import json
+import mmap
+import time
+import zlib
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from scraper.static import parse_article_html
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = "output/snapshots"
+
+# Bytes decompressed per step when scanning the archive
+READ_CHUNK_SIZE = 256 * 1024
+
+# Response metadata the browser exposes for the current page
+SNAPSHOT_METADATA_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+return {
+    final_url: location.href,
+    title: document.title,
+    content_type: document.contentType,
+    charset: document.characterSet,
+    last_modified: document.lastModified,
+    status: nav && nav.responseStatus ? nav.responseStatus : null,
+    transfer_bytes: nav ? nav.transferSize : null
+};
+"""
+
+
+class SnapshotArchive:
+    """
+    Append-only archive of page snapshots with a URL index, similar to WARC.
+
+    Every snapshot is one gzip member holding a JSON metadata line followed
+    by the page source, appended to '<root>/pages.gz' (so the whole file is
+    also a valid multi-member gzip stream). '<root>/index.jsonl' maps each
+    URL to the offset and length of its latest member. Reads go through a
+    memory map of the data file and only decompress the requested member.
+
+    Args:
+        root (str): Directory holding pages.gz and index.jsonl
+    """
+
+    def __init__(self, root: str = SNAPSHOT_DIR):
+        self.root = root
+        self.data_path = os.path.join(root, "pages.gz")
+        self.index_path = os.path.join(root, "index.jsonl")
+        os.makedirs(root, exist_ok=True)
+        self.index = {}
+        self._lock = threading.Lock()
+        self._map = None
+        self._data = None
+        self._index_file = None
+        if os.path.exists(self.index_path):
+            self._load_index()
+        elif os.path.exists(self.data_path) and os.path.getsize(self.data_path):
+            self.rebuild_index()
+
+    def _load_index(self):
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A write interrupted mid-line; the data member is still intact
+                    continue
+                self.index[entry["url"]] = entry
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.index
+
+    def urls(self) -> list:
+        return list(self.index)
+
+    def add(self, url: str, html: str, metadata: dict = None) -> dict:
+        """
+        Appends a snapshot of url and returns its index entry.
+
+        Args:
+            url (str): URL the page was requested with, used as the index key
+            html (str): Page source
+            metadata (dict): Response metadata stored with the page
+        """
+        header = {"url": url, "captured": time.time(), **(metadata or {})}
+        payload = json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n" + html.encode("utf-8")
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        member = compressor.compress(payload) + compressor.flush()
+        with self._lock:
+            if self._data is None:
+                self._data = open(self.data_path, "ab")
+                self._index_file = open(self.index_path, "a", encoding="utf-8")
+            offset = self._data.seek(0, os.SEEK_END)
+            self._data.write(member)
+            self._data.flush()
+            entry = {"url": url, "offset": offset, "length": len(member), "size": len(payload), "captured": header["captured"]}
+            self._index_file.write(json.dumps(entry) + "\n")
+            self._index_file.flush()
+            self.index[url] = entry
+        return entry
+
+    def capture(self, driver, url: str) -> dict:
+        """
+        Snapshots the rendered page_source of the driver's current page.
+        """
+        try:
+            metadata = driver.execute_script(SNAPSHOT_METADATA_SCRIPT) or {}
+        except Exception as e:
+            logger.warning("Could not read page metadata for %s: %s", url, e)
+            metadata = {}
+        return self.add(url, driver.page_source, metadata)
+
+    def _view(self, end: int):
+        if self._map is None or len(self._map) < end:
+            if self._data is not None:
+                self._data.flush()
+            if self._map is not None:
+                self._map.close()
+            with open(self.data_path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _decode(self, entry: dict):
+        end = entry["offset"] + entry["length"]
+        with self._lock:
+            view = self._view(end)
+            member = view[entry["offset"]:end]
+        payload = zlib.decompress(member, 31)
+        header, _, body = payload.partition(b"\n")
+        return json.loads(header), body.decode("utf-8")
+
+    def get(self, url: str):
+        """
+        Returns (metadata, html) of the latest snapshot of url, or None.
+        """
+        entry = self.index.get(url)
+        return self._decode(entry) if entry else None
+
+    def records(self, urls: list = None):
+        """
+        Yields (metadata, html) for the given URLs, or every URL in file order.
+        """
+        entries = [self.index[url] for url in urls if url in self.index] if urls is not None else \
+            sorted(self.index.values(), key=lambda entry: entry["offset"])
+        for entry in entries:
+            yield self._decode(entry)
+
+    def rebuild_index(self) -> int:
+        """
+        Rebuilds index.jsonl by streaming through the gzip members of pages.gz,
+        e.g. after the index was lost.
+
+        Returns:
+            int: Number of snapshots found.
+        """
+        self.index = {}
+        entries = []
+        with open(self.data_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            offset = 0
+            while offset < len(view):
+                decompressor = zlib.decompressobj(31)
+                payload = bytearray()
+                position = offset
+                while not decompressor.eof and position < len(view):
+                    chunk = view[position:position + READ_CHUNK_SIZE]
+                    position += len(chunk)
+                    payload += decompressor.decompress(chunk)
+                if not decompressor.eof:
+                    logger.warning("Truncated snapshot at offset %d of %s, ignoring it.", offset, self.data_path)
+                    break
+                end = position - len(decompressor.unused_data)
+                header = json.loads(payload.partition(b"\n")[0])
+                entry = {"url": header["url"], "offset": offset, "length": end - offset,
+                         "size": len(payload), "captured": header["captured"]}
+                entries.append(entry)
+                self.index[entry["url"]] = entry
+                offset = end
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in entries)
+        return len(entries)
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._data is not None:
+                self._data.close()
+                self._index_file.close()
+                self._data = self._index_file = None
+
+
+def _replay_record(url: str, metadata: dict, html: str, parse) -> dict:
+    result = parse(html, metadata.get("final_url") or url)
+    result["url"] = url
+    return result
+
+
+def _replay_chunk(root: str, urls: list, parse) -> list:
+    archive = SnapshotArchive(root)
+    try:
+        return [_replay_record(url, *archive.get(url), parse) for url in urls]
+    finally:
+        archive.close()
+
+
+def replay_extract(archive: SnapshotArchive, logger, urls: list = None, parse=parse_article_html,
+                   workers: int = 1, chunk_size: int = 500) -> list[dict]:
+    """
+    Runs an extractor over archived pages instead of a live browser.
+
+    Args:
+        archive (SnapshotArchive): Archive written in snapshot mode
+        logger: Logger for progress
+        urls (list): URLs to re-extract (default: every archived URL)
+        parse (callable): parse(html, url) returning an extract_article_details
+            style dict (default parse_article_html); must be a module-level
+            function when workers > 1
+        workers (int): Worker processes; 1 parses in this process
+        chunk_size (int): URLs per worker task
+
+    Returns:
+        List[dict]: One result per archived URL, in the order of urls.
+    """
+    urls = [url for url in (urls if urls is not None else archive.urls()) if url in archive]
+    start = time.perf_counter()
+    if workers > 1 and len(urls) > chunk_size:
+        chunks = [urls[i:i + chunk_size] for i in range(0, len(urls), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = [result for chunk in executor.map(_replay_chunk, [archive.root] * len(chunks), chunks,
+                                                        [parse] * len(chunks)) for result in chunk]
+    else:
+        results = [_replay_record(url, metadata, html, parse)
+                   for url, (metadata, html) in zip(urls, archive.records(urls))]
+    logger.info("Replayed %d archived pages in %.2fs.", len(results), time.perf_counter() - start)
+    return results
@@ -0,0 +1,290 @@
+import re
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from scraper.images import select_image_candidate
+from utils.metrics import timed
+from utils.resilience import AdaptiveCall
+
+logger = logging.getLogger(__name__)
+
+# Elements that never have a closing tag, so they must not be pushed on the stack
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# Fields that must be present in the static parse to skip the Selenium fallback
+REQUIRED_FIELDS = ("title", "content")
+
+# Bounds of article page request timeouts when no explicit timeout is given
+FETCH_TIMEOUTS = {"default": 10, "floor": 2, "ceiling": 30}
+
+# Bytes fed to the parser at a time; parsing stops once the header is closed
+PARSE_CHUNK_SIZE = 16 * 1024
+
+# Parsing starts at the first <article> after <body>, skipping the head's scripts and styles
+BODY_PATTERN = re.compile(r"<body[\s>]", re.IGNORECASE)
+ARTICLE_PATTERN = re.compile(r"<article[\s>]", re.IGNORECASE)
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "es-ES,es;q=0.9",
+}
+
+
+def create_http_session(pool_size: int = 10, retries: int = 2) -> requests.Session:
+    """
+    Creates a keep-alive requests session with a connection pool.
+
+    Args:
+        pool_size (int): Maximum connections kept open per host
+        retries (int): Retries for connection errors and 5xx responses; once
+            they run out, the last 5xx response is returned, so that
+            raise_for_status raises an HTTPError the circuit breaker counts
+
+    Returns:
+        requests.Session: Session to share between threads.
+    """
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+class _Region:
+    """
+    Collects the first h1, h2 and img found inside one element.
+    """
+
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.closed = False
+        self.fields = {"title": None, "content": None, "cover_image_url": None}
+        self._capture = None
+
+    def start(self, tag, attrs, depth):
+        if self._capture is None:
+            field = {"h1": "title", "h2": "content"}.get(tag)
+            if field and self.fields[field] is None:
+                self._capture = (field, depth, [])
+        if tag == "img" and self.fields["cover_image_url"] is None:
+            attrs = dict(attrs)
+            self.fields["cover_image_url"] = select_image_candidate(
+                attrs.get("src"), attrs.get("srcset"), attrs.get("sizes"), attrs.get("width")
+            )
+
+    def data(self, text):
+        if self._capture is not None:
+            self._capture[2].append(text)
+
+    def end(self, depth):
+        if self._capture is not None and depth < self._capture[1]:
+            field, _, parts = self._capture
+            self.fields[field] = " ".join("".join(parts).split())
+            self._capture = None
+        if depth < self.depth:
+            self.closed = True
+
+
+class ArticleHeaderParser(HTMLParser):
+    """
+    Streaming parser for the title, summary and cover image of an article page.
+
+    Mirrors the Selenium lookup in extract_article_details: fields are read
+    from the first 'article > header', falling back to the first <article>.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.header = None
+        self.article = None
+
+    @property
+    def done(self) -> bool:
+        return self.header is not None and self.header.closed
+
+    def _regions(self):
+        return [r for r in (self.header, self.article) if r is not None and not r.closed]
+
+    def handle_starttag(self, tag, attrs):
+        parent = self.stack[-1] if self.stack else None
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(tag)
+        depth = len(self.stack)
+        if tag == "article" and self.article is None:
+            self.article = _Region(depth)
+        elif tag == "header" and parent == "article" and self.header is None:
+            self.header = _Region(depth)
+        for region in self._regions():
+            region.start(tag, attrs, depth)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_data(self, data):
+        for region in self._regions():
+            region.data(data)
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS or tag not in self.stack:
+            return
+        while self.stack and self.stack.pop() != tag:
+            pass
+        depth = len(self.stack)
+        for region in self._regions():
+            region.end(depth)
+
+    def result(self) -> dict:
+        region = self.header or self.article
+        if region is None:
+            return {"title": None, "content": None, "cover_image_url": None}
+        return dict(region.fields)
+
+
+def _parse_header(html: str, start: int) -> dict:
+    parser = ArticleHeaderParser()
+    for offset in range(start, len(html), PARSE_CHUNK_SIZE):
+        parser.feed(html[offset:offset + PARSE_CHUNK_SIZE])
+        if parser.done:
+            break
+    parser.close()
+    return parser.result()
+
+
+def parse_article_html(html: str, article_url: str) -> dict:
+    """
+    Parses server-rendered article HTML into the extract_article_details result format.
+
+    Args:
+        html (str): Page source of the article
+        article_url (str): URL of the article, used to resolve relative image URLs
+
+    Returns:
+        dict: { 'url', 'title', 'content', 'cover_image_url' }
+    """
+    body = BODY_PATTERN.search(html)
+    article = ARTICLE_PATTERN.search(html, body.start() if body else 0)
+    fields = _parse_header(html, article.start() if article else 0)
+    if article and not any(fields.values()):
+        # The match was not a real element (e.g. markup inside a script); parse everything
+        fields = _parse_header(html, 0)
+    if fields["cover_image_url"]:
+        fields["cover_image_url"] = urljoin(article_url, fields["cover_image_url"])
+    return {"url": article_url, **fields}
+
+
+@timed("scraper.fetch_article_static")
+def fetch_article_static(session: requests.Session, article_url: str, logger, timeout: int = None) -> dict:
+    """
+    Fetches an article over HTTP and parses its header without a browser.
+
+    Args:
+        session (requests.Session): Session from create_http_session
+        article_url: Url of the article to fetch the details
+        timeout (int): Seconds to wait for the response (default: adaptive per host)
+    """
+    with AdaptiveCall("http.article", urlparse(article_url).netloc, timeout, breaker=True, **FETCH_TIMEOUTS) as call:
+        response = session.get(article_url, timeout=call.timeout)
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        if retries is not None and retries.history:
+            # The elapsed time includes urllib3's retries and backoff sleeps
+            call.skip_sample()
+        response.raise_for_status()
+    return parse_article_html(response.text, response.url or article_url)
+
+
+def _empty_result(article_url: str) -> dict:
+    return {"url": article_url, "title": None, "content": None, "cover_image_url": None}
+
+
+def missing_fields(result: dict, required=REQUIRED_FIELDS) -> list:
+    """
+    Lists the required fields that are empty in an extraction result.
+    """
+    return [field for field in required if not result.get(field)]
+
+
+@timed("scraper.extract_article_details_http")
+def extract_article_details_http(article_url, logger, session=None, driver=None, timeout=None) -> dict:
+    """
+    Extracts article details over HTTP, using Selenium only when fields are missing.
+
+    Args:
+        article_url: Url of the article to fetch the details
+        session (requests.Session): Optional shared session (one is created if omitted)
+        driver (WebDriver): Optional Selenium driver for the fallback path
+        timeout (int): Seconds to wait for the page (default: adaptive)
+    """
+    session = session or create_http_session()
+    try:
+        result = fetch_article_static(session, article_url, logger, timeout)
+    except Exception as e:
+        logger.warning("Static fetch failed for %s: %s: %s", article_url, type(e).__name__, e)
+        result = _empty_result(article_url)
+
+    missing = missing_fields(result)
+    if not missing:
+        return result
+    if driver is None:
+        logger.warning("Static parse of %s is missing %s and no driver is available.", article_url, missing)
+        return result
+    logger.info("Static parse of %s is missing %s, falling back to Selenium.", article_url, missing)
+    # Imported on use, so the HTTP path and offline replay never load Selenium
+    from scraper.elpais import extract_article_details
+    return extract_article_details(driver, article_url, logger, timeout)
+
+
+def extract_articles_http(article_urls: list, logger, session=None, driver=None, max_workers: int = 8, timeout: int = None) -> list[dict]:
+    """
+    Extracts many articles concurrently over HTTP, with a Selenium fallback.
+
+    Static fetches run in a thread pool sharing one connection pool. Articles
+    that still miss fields are then re-extracted one by one on the driver,
+    since a WebDriver session cannot be shared between threads.
+
+    Args:
+        article_urls (list): Article URLs to extract
+        session (requests.Session): Optional shared session
+        driver (WebDriver): Optional Selenium driver for the fallback path
+        max_workers (int): Concurrent HTTP requests (default 8)
+        timeout (int): Seconds to wait for each page (default: adaptive)
+
+    Returns:
+        List[dict]: Results in the same order as article_urls.
+    """
+    session = session or create_http_session(pool_size=max_workers)
+
+    def fetch(article_url):
+        try:
+            return fetch_article_static(session, article_url, logger, timeout)
+        except Exception as e:
+            logger.warning("Static fetch failed for %s: %s: %s", article_url, type(e).__name__, e)
+            return _empty_result(article_url)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(fetch, article_urls))
+
+    from scraper.elpais import extract_article_details
+    fallbacks = 0
+    for idx, result in enumerate(results):
+        missing = missing_fields(result)
+        if missing and driver is not None:
+            logger.info("Static parse of %s is missing %s, falling back to Selenium.", result['url'], missing)
+            results[idx] = extract_article_details(driver, result["url"], logger, timeout)
+            fallbacks += 1
+    logger.info("Extracted %d articles over HTTP, %d needed the Selenium fallback.", len(results), fallbacks)
+    return results
@@ -0,0 +1,147 @@
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Resolves as soon as the predicate returns a truthy value. The predicate is
+# re-checked on every DOM mutation and readyState change, never on a timer.
+# Resolves with null once timeout_ms has passed without a match.
+WAIT_SCRIPT_TEMPLATE = """
+var timeoutMs = arguments[0];
+var done = arguments[arguments.length - 1];
+var finished = false;
+var observer = null;
+var timer = null;
+function predicate() {
+%s
+}
+function finish(value) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    document.removeEventListener('readystatechange', check);
+    done(value);
+}
+function check() {
+    var value = null;
+    try { value = predicate(); } catch (e) { value = null; }
+    if (value) { finish(value); }
+}
+timer = setTimeout(function () { finish(null); }, timeoutMs);
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+document.addEventListener('readystatechange', check);
+check();
+"""
+
+# Looks for the Opinión link by text and by href at the same time. Once the
+# page has finished loading and stayed quiet for settleMs without a match,
+# it resolves with the direct-URL strategy instead of waiting out the timeout.
+OPINION_LINK_PREDICATE = """
+    var links = document.querySelectorAll('a[href]');
+    for (var i = 0; i < links.length; i++) {
+        if (links[i].textContent.trim() === 'Opinión') {
+            return {strategy: 'link_text', href: links[i].href};
+        }
+    }
+    for (var j = 0; j < links.length; j++) {
+        if (/^\\/opinion\\/?$/.test(links[j].pathname)) {
+            return {strategy: 'href', href: links[j].href};
+        }
+    }
+    if (document.readyState === 'complete') {
+        window.__opinionSettle = window.__opinionSettle || Date.now();
+        if (Date.now() - window.__opinionSettle >= %d) {
+            return {strategy: 'direct', href: null};
+        }
+        setTimeout(check, %d);
+    }
+    return null;
+"""
+
+
+def wait_for_dom(driver: WebDriver, predicate_js: str, timeout: float = 10, message: str = ""):
+    """
+    Waits for a JavaScript predicate to become truthy using a MutationObserver.
+
+    Unlike WebDriverWait, which polls every 0.5 s with one or more WebDriver
+    commands per poll, this sends a single execute_async_script command that
+    returns the moment the DOM satisfies the condition.
+
+    Args:
+        driver (WebDriver): Selenium driver instance
+        predicate_js (str): Body of a JavaScript function returning a truthy
+            value when the condition is met
+        timeout (float): Seconds to wait before giving up (default 10)
+        message (str): Message for the TimeoutException
+
+    Returns:
+        The value returned by the predicate.
+
+    Raises:
+        TimeoutException: If the condition is not met within timeout.
+    """
+    script = WAIT_SCRIPT_TEMPLATE % predicate_js
+    previous = None
+    if timeout >= 30:
+        # The default WebDriver script timeout is 30 s; it is raised for this
+        # script only, so later async scripts keep the session's own limit
+        previous = driver.timeouts.script
+        driver.set_script_timeout(timeout + 5)
+    try:
+        value = driver.execute_async_script(script, int(timeout * 1000))
+    finally:
+        if previous is not None:
+            driver.set_script_timeout(previous)
+    if not value:
+        raise TimeoutException(message or f"DOM condition not met after {timeout} seconds.")
+    return value
+
+
+def wait_for_selector(driver: WebDriver, css_selector: str, timeout: float = 10):
+    """
+    Waits until an element matching css_selector is present in the DOM.
+
+    Raises:
+        TimeoutException: If no element appears within timeout.
+    """
+    predicate = "return document.querySelector(%s) !== null;" % _js_string(css_selector)
+    return wait_for_dom(driver, predicate, timeout, f"No element matching '{css_selector}' after {timeout} seconds.")
+
+
+def wait_for_html_lang(driver: WebDriver, timeout: float = 10) -> str:
+    """
+    Waits until the <html> element has a lang attribute and returns it.
+
+    Raises:
+        TimeoutException: If the attribute is not set within timeout.
+    """
+    predicate = "var lang = document.documentElement.getAttribute('lang'); return lang === null ? null : {lang: lang};"
+    return wait_for_dom(driver, predicate, timeout, "No lang attribute on <html>.")["lang"]
+
+
+def find_opinion_link(driver: WebDriver, timeout: float = 10, settle_ms: int = 300) -> dict:
+    """
+    Races the link-text, href and direct-URL strategies for the Opinión section.
+
+    Args:
+        driver (WebDriver): Selenium driver instance
+        timeout (float): Upper bound in seconds for the race (default 10)
+        settle_ms (int): Milliseconds to wait after page load for late links
+            before choosing the direct URL (default 300)
+
+    Returns:
+        dict: { 'strategy': 'link_text' | 'href' | 'direct', 'href': str or None,
+        'elapsed': seconds spent }
+    """
+    start = time.perf_counter()
+    try:
+        found = wait_for_dom(driver, OPINION_LINK_PREDICATE % (settle_ms, settle_ms), timeout)
+    except TimeoutException:
+        found = {"strategy": "direct", "href": None}
+    found["elapsed"] = time.perf_counter() - start
+    return found
+
+
+def _js_string(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
@@ -0,0 +1,9 @@
+import pytest
+from benchmarks.bench_e2e import percentile
+
+
+@pytest.mark.parametrize("pct, n, expected", [
+    (50, 10, 5), (90, 10, 9), (95, 20, 19), (95, 10, 10), (99, 100, 99), (100, 7, 7), (1, 7, 1),
+])
+def test_percentile_is_nearest_rank(pct, n, expected):
+    assert percentile(list(range(n, 0, -1)), pct) == expected
@@ -0,0 +1,15 @@
+from datetime import date
+from cli import build_parser
+
+
+def test_scrape_deep_options():
+    args = build_parser().parse_args(["scrape", "--deep", "--max-articles", "300", "--since", "2025-07-01",
+                                      "--sections", "https://elpais.com/opinion/", "https://elpais.com/espana/"])
+    assert args.deep and args.max_articles == 300
+    assert args.since == date(2025, 7, 1)
+    assert args.sections == ["https://elpais.com/opinion/", "https://elpais.com/espana/"]
+
+
+def test_scrape_defaults_to_first_render():
+    args = build_parser().parse_args(["scrape"])
+    assert not args.deep and args.since is None and args.sections is None
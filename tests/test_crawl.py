@@ -0,0 +1,105 @@
+import re
+import logging
+from datetime import date
+from scraper.crawl import BloomFilter, NEW_ARTICLE_LINKS_SCRIPT, NEXT_PAGE_SCRIPT, article_date, crawl_article_urls
+
+logger = logging.getLogger("test")
+
+SECTION = "https://elpais.com/opinion/"
+
+
+def article(day: str, slug: str) -> str:
+    return f"https://elpais.com/opinion/{day}/{slug}.html"
+
+
+class FakeSite:
+    """
+    Driver serving sections whose articles load in batches, one per scroll,
+    optionally followed by a next-page link once all batches are shown.
+    """
+
+    def __init__(self, pages: dict):
+        self.pages = pages
+        self.url = None
+        self.loaded = 0
+        self.visits = []
+
+    def get(self, url):
+        self.url = url
+        self.loaded = 1
+        self.visits.append(url)
+
+    def _articles(self):
+        batches = self.pages[self.url]["batches"]
+        return [link for batch in batches[:self.loaded] for link in batch]
+
+    def execute_async_script(self, script, timeout_ms):
+        offset = int(re.search(r"length > (\d+)", script).group(1))
+        return True if len(self._articles()) > offset else None
+
+    def execute_script(self, script, *args):
+        if script == NEW_ARTICLE_LINKS_SCRIPT:
+            articles = self._articles()
+            return {"count": len(articles), "links": articles[args[0]:]}
+        if script == NEXT_PAGE_SCRIPT:
+            page = self.pages[self.url]
+            if self.loaded >= len(page["batches"]) and page.get("next"):
+                return {"kind": "link", "href": page["next"]}
+            self.loaded += 1
+            return {"kind": "scroll"}
+        raise AssertionError("unexpected script")
+
+
+def test_article_date_parses_url_dates():
+    assert article_date(article("2025-07-27", "titulo")) == date(2025, 7, 27)
+    assert article_date("https://elpais.com/opinion/") is None
+    assert article_date("https://elpais.com/opinion/2025-02-30/titulo.html") is None
+
+
+def test_bloom_filter_membership():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    urls = [article("2025-07-27", f"a{i}") for i in range(1000)]
+    for url in urls:
+        bloom.add(url)
+    assert all(url in bloom for url in urls)
+    others = [article("2025-07-28", f"b{i}") for i in range(1000)]
+    assert sum(url in bloom for url in others) < 50
+
+
+def test_crawl_follows_scrolling_and_pagination_without_duplicates():
+    page_2 = SECTION + "?page=2"
+    site = FakeSite({
+        SECTION: {
+            "batches": [[article("2025-07-27", "a"), article("2025-07-27", "b")],
+                        [article("2025-07-27", "b"), article("2025-07-26", "c"), None]],
+            "next": page_2,
+        },
+        page_2: {"batches": [[article("2025-07-26", "c"), article("2025-07-25", "d")]]},
+    })
+    urls = list(crawl_article_urls(site, logger, max_articles=10, timeout=1))
+    assert urls == [article("2025-07-27", "a"), article("2025-07-27", "b"),
+                    article("2025-07-26", "c"), article("2025-07-25", "d")]
+    assert site.visits == [SECTION, page_2]
+
+
+def test_crawl_stops_at_max_articles():
+    site = FakeSite({SECTION: {"batches": [[article("2025-07-27", f"a{i}") for i in range(5)]] * 3}})
+    crawl = crawl_article_urls(site, logger, max_articles=3, timeout=1)
+    assert len(list(crawl)) == 3
+
+
+def test_crawl_stops_at_since_cutoff():
+    site = FakeSite({SECTION: {"batches": [
+        [article("2025-07-27", "a"), article("2025-06-01", "old")],
+        [article("2025-05-01", "older"), article("2025-05-02", "oldest")],
+        [article("2025-07-27", "never-reached")],
+    ]}})
+    urls = list(crawl_article_urls(site, logger, since=date(2025, 7, 1), timeout=1))
+    assert urls == [article("2025-07-27", "a")]
+
+
+def test_crawl_with_bloom_filter_skips_seen_urls():
+    seen = BloomFilter(capacity=100)
+    seen.add(article("2025-07-27", "a"))
+    site = FakeSite({SECTION: {"batches": [[article("2025-07-27", "a"), article("2025-07-27", "b")]]}})
+    assert list(crawl_article_urls(site, logger, seen=seen, timeout=1)) == [article("2025-07-27", "b")]
@@ -0,0 +1,49 @@
+from pipeline.state import CrawlStateStore, article_hash, classify_article, stored_article
+
+URL = "https://elpais.com/opinion/a.html"
+ARTICLE = {"url": URL, "title": "Título", "content": "Resumen", "cover_image_url": None}
+FAILED = {"url": URL, "title": None, "content": None, "cover_image_url": None}
+
+
+def saved_store(tmp_path, title_en="Title"):
+    store = CrawlStateStore(str(tmp_path / "state.sqlite3"))
+    store.save({**ARTICLE, "image": None, "title_en": title_en})
+    return store
+
+
+def test_classifies_new_changed_and_unchanged(tmp_path):
+    store = saved_store(tmp_path)
+    record = store.get(URL)
+    assert classify_article(dict(ARTICLE), None)["crawl_status"] == "new"
+    assert classify_article({**ARTICLE, "content": "Otro"}, record)["crawl_status"] == "changed"
+    unchanged = classify_article(dict(ARTICLE), record)
+    assert unchanged["crawl_status"] == "unchanged"
+    assert unchanged["title_en"] == "Title"
+    store.close()
+
+
+def test_failed_extraction_keeps_the_stored_record(tmp_path):
+    store = saved_store(tmp_path)
+    article = classify_article(dict(FAILED), store.get(URL))
+    assert article["crawl_status"] == "failed"
+    assert article["title"] == "Título" and article["title_en"] == "Title"
+    store.save(dict(FAILED))
+    assert store.get(URL)["content_hash"] == article_hash(ARTICLE)
+    store.close()
+
+
+def test_failed_extraction_without_record_is_not_saved(tmp_path):
+    store = CrawlStateStore(str(tmp_path / "state.sqlite3"))
+    assert classify_article(dict(FAILED), None)["crawl_status"] == "failed"
+    store.save({**FAILED, "image": None, "title_en": None})
+    assert store.get(URL) is None
+    store.close()
+
+
+def test_translations_are_dropped_when_the_article_changes(tmp_path):
+    store = saved_store(tmp_path)
+    store.save({**ARTICLE, "content": "Otro", "image": None, "title_en": None})
+    record = store.get(URL)
+    assert record["translations"] == {}
+    assert stored_article(record)["crawl_status"] == "skipped"
+    store.close()
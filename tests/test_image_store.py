@@ -0,0 +1,96 @@
+import logging
+import os
+from utils.image_downloader import ImageStore, download_images, fetch_into_store
+
+logger = logging.getLogger("test")
+
+IMAGES = {
+    "https://images.example/a.jpg": b"jpeg bytes",
+    "https://images.example/copy-of-a.jpg": b"jpeg bytes",
+    "https://images.example/b.png": b"png bytes",
+}
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size):
+        yield self._body
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class ImageServer:
+    """
+    Serves IMAGES with ETags and answers matching conditional requests with 304.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append((url, dict(headers or {})))
+        if url not in IMAGES:
+            return FakeResponse(404)
+        etag = f'"{len(IMAGES[url])}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return FakeResponse(304)
+        content_type = "image/png" if url.endswith(".png") else "image/jpeg"
+        return FakeResponse(200, IMAGES[url], {"ETag": etag, "Content-Type": content_type})
+
+
+def test_identical_images_are_stored_once(tmp_path):
+    store = ImageStore(str(tmp_path))
+    entries = download_images(list(IMAGES), logger, store, ImageServer(), max_workers=2)
+    assert entries[0]["path"] == entries[1]["path"] != entries[2]["path"]
+    assert entries[0]["path"].endswith(".jpg") and entries[2]["path"].endswith(".png")
+    with open(entries[2]["path"], "rb") as f:
+        assert f.read() == b"png bytes"
+    assert os.path.exists(store.index_path)
+
+
+def test_second_run_uses_conditional_requests(tmp_path):
+    download_images(list(IMAGES), logger, ImageStore(str(tmp_path)), ImageServer())
+    server = ImageServer()
+    entries = download_images(list(IMAGES), logger, ImageStore(str(tmp_path)), server)
+    assert all(entry["status"] == "not_modified" for entry in entries)
+    assert all("If-None-Match" in headers for _, headers in server.requests)
+
+
+def test_skipped_and_failed_images_are_none(tmp_path):
+    urls = [None, "https://images.example/missing.jpg", "https://images.example/a.jpg"]
+    entries = download_images(urls, logger, ImageStore(str(tmp_path)), ImageServer())
+    assert entries[:2] == [None, None] and entries[2]["status"] == "downloaded"
+
+
+def test_not_modified_image_whose_file_vanished_is_fetched_again(tmp_path):
+    url = "https://images.example/a.jpg"
+    store = ImageStore(str(tmp_path))
+    server = ImageServer()
+    path = fetch_into_store(url, store, server, logger)["path"]
+
+    class VanishingServer(ImageServer):
+        def get(self, url, headers=None, **kwargs):
+            # The file is removed after the validators were read
+            if headers and os.path.exists(path):
+                os.remove(path)
+            return super().get(url, headers, **kwargs)
+
+    server = VanishingServer()
+    entry = fetch_into_store(url, store, server, logger)
+    assert entry["status"] == "downloaded" and os.path.exists(entry["path"])
+    assert [headers for _, headers in server.requests] == [{"If-None-Match": '"10"'}, {}]
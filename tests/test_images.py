@@ -0,0 +1,41 @@
+from scraper.images import parse_srcset, select_image_candidate
+
+SRCSET = ("https://imagenes.elpais.com/resizer/v2/a.jpg?width=414 414w, "
+          "https://imagenes.elpais.com/resizer/v2/a.jpg?width=828 828w, "
+          "https://imagenes.elpais.com/resizer/v2/a.jpg?width=1960 1960w")
+
+
+def test_parse_srcset_width_and_density_descriptors():
+    assert parse_srcset("a.jpg 640w, b.jpg 2x, c.jpg") == [("a.jpg", 640.0, "w"), ("b.jpg", 2.0, "x"), ("c.jpg", 1.0, "x")]
+
+
+def test_parse_srcset_keeps_commas_inside_urls():
+    assert parse_srcset("https://cdn/w_640,c_fill/a.jpg 640w,https://cdn/w_1280,c_fill/a.jpg 1280w") == [
+        ("https://cdn/w_640,c_fill/a.jpg", 640.0, "w"),
+        ("https://cdn/w_1280,c_fill/a.jpg", 1280.0, "w"),
+    ]
+
+
+def test_parse_srcset_drops_invalid_descriptors():
+    assert parse_srcset("a.jpg 640q, b.jpg 100w 2x, c.jpg 300w") == [("c.jpg", 300.0, "w")]
+    assert parse_srcset("") == [] and parse_srcset(None) == []
+
+
+def test_selects_smallest_candidate_wide_enough():
+    assert select_image_candidate("src.jpg", SRCSET).endswith("width=828")
+    assert select_image_candidate("src.jpg", SRCSET, target_width=400).endswith("width=414")
+
+
+def test_falls_back_to_widest_candidate():
+    assert select_image_candidate("src.jpg", SRCSET, target_width=4000).endswith("width=1960")
+
+
+def test_density_descriptors_use_the_layout_width():
+    srcset = "a-1x.jpg 1x, a-2x.jpg 2x"
+    assert select_image_candidate("a.jpg", srcset, sizes="(min-width: 800px) 400px, 320px") == "a-2x.jpg"
+    assert select_image_candidate("a.jpg", srcset, width="700") == "a-1x.jpg"
+    assert select_image_candidate("a.jpg", srcset) == "a.jpg"
+
+
+def test_without_srcset_src_is_kept():
+    assert select_image_candidate("a.jpg") == "a.jpg"
@@ -0,0 +1,68 @@
+import gzip
+import json
+import logging
+import threading
+from utils.logging import close_session_logger, setup_session_logger
+
+
+class FakeDriver:
+    capabilities = {"platformName": "linux", "browserName": "chrome", "browserVersion": "120"}
+
+
+def test_session_logger_writes_jsonl_through_the_queue(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = setup_session_logger(FakeDriver(), console=False)
+    logger.info("Article %d - Spanish: %s", 1, "Título", extra={"article": 1})
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Extraction failed")
+    close_session_logger(logger)
+
+    with open("logs/session_bstack_linux_chrome_120.jsonl", encoding="utf-8") as f:
+        first, second = [json.loads(line) for line in f]
+    assert first["message"] == "Article 1 - Spanish: Título"
+    assert first["level"] == "INFO" and first["article"] == 1
+    assert first["logger"] == "logs/session_bstack_linux_chrome_120.log"
+    assert first["thread"] == threading.current_thread().name
+    assert second["level"] == "ERROR" and "ValueError: boom" in second["exception"]
+    with open("logs/session_bstack_linux_chrome_120.log", encoding="utf-8") as f:
+        assert "[INFO]: Article 1 - Spanish: Título" in f.read()
+
+
+def test_session_logs_rotate_into_gzip_backups(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = setup_session_logger(FakeDriver(), max_bytes=500, backup_count=2, console=False)
+    for i in range(40):
+        logger.info("Line %d of a long crawl", i)
+    close_session_logger(logger)
+
+    logs = tmp_path / "logs"
+    backups = sorted(path.name for path in logs.iterdir() if path.name.endswith(".gz"))
+    assert backups == [
+        "session_bstack_linux_chrome_120.jsonl.1.gz", "session_bstack_linux_chrome_120.jsonl.2.gz",
+        "session_bstack_linux_chrome_120.log.1.gz", "session_bstack_linux_chrome_120.log.2.gz",
+    ]
+    with gzip.open(logs / "session_bstack_linux_chrome_120.jsonl.1.gz", "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert records and all(record["message"].startswith("Line ") for record in records)
+    with open(logs / "session_bstack_linux_chrome_120.jsonl", encoding="utf-8") as f:
+        assert json.loads(f.readlines()[-1])["message"] == "Line 39 of a long crawl"
+
+
+def test_records_are_formatted_on_the_listener_thread(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    formatted_on = []
+
+    class Arg:
+        def __str__(self):
+            formatted_on.append(threading.current_thread().name)
+            return "value"
+
+    logger = setup_session_logger(FakeDriver(), console=False)
+    # Keep pytest's log capture on the root logger from formatting the record here
+    logger.propagate = False
+    logger.info("Deferred %s", Arg())
+    close_session_logger(logger)
+    assert formatted_on and threading.current_thread().name not in formatted_on
+    assert logging.getLogger("logs/session_bstack_linux_chrome_120.log").handlers == []
@@ -0,0 +1,50 @@
+import matrix
+from matrix import load_platforms, plan_local_browsers
+
+PLATFORMS = [
+    {"os": "Windows", "osVersion": "11", "browserName": "Chrome", "browserVersion": "latest"},
+    {"os": "OS X", "osVersion": "Sonoma", "browserName": "googlechrome", "browserVersion": "latest"},
+    {"os": "Windows", "osVersion": "10", "browserName": "MicrosoftEdge", "browserVersion": "latest"},
+    {"os": "OS X", "osVersion": "Ventura", "browserName": "Safari", "browserVersion": "16.5"},
+    {"os": "Windows", "osVersion": "10", "browserName": "IE", "browserVersion": "11.0"},
+    {"deviceName": "iPhone 15", "osVersion": "17", "browserName": "safari"},
+    {"os": "Windows", "osVersion": "11", "browserName": "opera"},
+]
+
+
+def test_names_are_mapped_and_merged(monkeypatch):
+    monkeypatch.setattr(matrix.sys, "platform", "linux")
+    browsers, _ = plan_local_browsers(PLATFORMS)
+    assert list(browsers) == ["chrome", "edge"]
+    assert browsers["chrome"] == ["Windows 11 Chrome latest", "OS X Sonoma googlechrome latest"]
+
+
+def test_mobile_and_unsupported_platforms_are_skipped(monkeypatch):
+    monkeypatch.setattr(matrix.sys, "platform", "linux")
+    _, skipped = plan_local_browsers(PLATFORMS)
+    reasons = {entry["platform"]: entry["reason"] for entry in skipped}
+    assert reasons["iPhone 15 17 safari"] == "mobile devices only run on BrowserStack"
+    assert reasons["Windows 11 opera"] == "unsupported browser 'opera'"
+
+
+def test_os_specific_browsers_follow_the_local_os(monkeypatch):
+    monkeypatch.setattr(matrix.sys, "platform", "linux")
+    browsers, skipped = plan_local_browsers(PLATFORMS)
+    assert "safari" not in browsers and "ie" not in browsers
+    assert {entry["reason"] for entry in skipped} >= {"Safari needs macOS", "Internet Explorer needs Windows"}
+
+    monkeypatch.setattr(matrix.sys, "platform", "darwin")
+    browsers, _ = plan_local_browsers(PLATFORMS)
+    assert browsers["safari"] == ["OS X Ventura Safari 16.5"] and "ie" not in browsers
+
+    monkeypatch.setattr(matrix.sys, "platform", "win32")
+    browsers, _ = plan_local_browsers(PLATFORMS)
+    assert "ie" in browsers and "safari" not in browsers
+
+
+def test_load_platforms_reads_browserstack_yml(tmp_path):
+    config = tmp_path / "browserstack.yml"
+    config.write_text("platforms:\n  - os: Windows\n    browserName: Chrome\n", encoding="utf-8")
+    assert load_platforms(str(config)) == [{"os": "Windows", "browserName": "Chrome"}]
+    (tmp_path / "empty.yml").write_text("", encoding="utf-8")
+    assert load_platforms(str(tmp_path / "empty.yml")) == []
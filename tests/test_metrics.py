@@ -0,0 +1,69 @@
+import json
+import pytest
+from scraper.commands import CommandCounter
+from utils.metrics import Metrics, active_metrics, disable_metrics, enable_metrics, span, timed, watch_driver
+
+
+class FakeDriver:
+    def execute(self, driver_command, params=None):
+        return {"value": driver_command}
+
+
+@pytest.fixture
+def metrics():
+    metrics = enable_metrics()
+    yield metrics
+    disable_metrics()
+
+
+@timed("fetch")
+def fetch(fail=False):
+    if fail:
+        raise RuntimeError("boom")
+    with span("parse"):
+        return "ok"
+
+
+def test_spans_nest_and_count_errors(metrics):
+    with span("run"):
+        fetch()
+        fetch()
+    with pytest.raises(RuntimeError):
+        fetch(fail=True)
+    assert metrics.spans["run/fetch"]["count"] == 2
+    assert metrics.spans["run/fetch/parse"]["count"] == 2
+    assert metrics.spans["fetch"] == {**metrics.spans["fetch"], "count": 1, "errors": 1}
+
+
+def test_nothing_is_recorded_while_metrics_are_off():
+    disable_metrics()
+    assert fetch() == "ok"
+    assert active_metrics() is None
+
+
+def test_watched_drivers_count_commands(metrics):
+    driver = watch_driver(FakeDriver())
+    driver.execute("get")
+    driver.execute("findElement")
+    driver.execute("findElement")
+    data = metrics.to_dict()
+    assert data["webdriver_commands_total"] == 3
+    assert list(data["webdriver_commands"]) == ["findElement", "get"]
+
+
+def test_command_counter_restores_the_driver():
+    driver = FakeDriver()
+    with CommandCounter(driver) as commands:
+        driver.execute("get")
+    assert commands.total == 1 and commands.summary() == "get=1"
+    assert "execute" not in driver.__dict__
+
+
+def test_export_writes_json_and_prometheus(tmp_path):
+    metrics = Metrics()
+    metrics.record('extract "quoted"', 0.5)
+    json_path, prom_path = metrics.export(str(tmp_path / "logs" / "session.log"))
+    with open(json_path) as f:
+        assert json.load(f)["spans"]['extract "quoted"']["mean_seconds"] == 0.5
+    with open(prom_path) as f:
+        assert 'scraper_span_calls_total{span="extract \\"quoted\\""} 1' in f.read()
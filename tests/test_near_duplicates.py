@@ -0,0 +1,33 @@
+import pytest
+from analyzer.near_duplicates import NearDuplicateIndex, article_fingerprint, simhash
+
+TEXT = "El Gobierno aprueba la nueva ley de vivienda para limitar la subida de los alquileres en las grandes ciudades"
+
+
+def test_identical_texts_have_equal_fingerprints():
+    assert simhash(TEXT) == simhash(f"  {TEXT.upper()}!")
+
+
+def test_unrelated_texts_are_far_apart():
+    other = "La selección gana el partido de fútbol en el último minuto con un gol de cabeza del delantero"
+    assert (simhash(TEXT) ^ simhash(other)).bit_count() > 10
+
+
+def test_index_finds_close_fingerprints_only():
+    index = NearDuplicateIndex(bands=4, max_distance=3)
+    assert index.find_or_add("a", 0b1011 << 40) is None
+    assert index.find_or_add("b", 0b1010 << 40) == "a"
+    assert index.query(0b0100 << 40) == []
+    assert len(index) == 1
+
+
+def test_article_fingerprint_uses_title_and_content():
+    article = {"title": "Título", "content": TEXT}
+    assert article_fingerprint(article) == simhash(f"Título {TEXT}")
+
+
+def test_invalid_band_settings():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(bands=5)
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(bands=4, max_distance=4)
@@ -0,0 +1,55 @@
+import time
+from pipeline.runner import Pipeline, Stage
+
+
+def test_items_pass_every_stage_in_source_order():
+    pipeline = Pipeline([Stage("double", lambda x: 2 * x, workers=3), Stage("inc", lambda x: x + 1)])
+    items = pipeline.run_all(range(20))
+    assert [item.value for item in items] == [2 * x + 1 for x in range(20)]
+    assert set(items[0].timings) == {"double", "inc"}
+
+
+def test_batched_stage_receives_lists():
+    sizes = []
+
+    def batch(values):
+        sizes.append(len(values))
+        return [value * 10 for value in values]
+
+    items = Pipeline([Stage("batch", batch, batch_size=4)]).run_all(range(10))
+    assert [item.value for item in items] == [value * 10 for value in range(10)]
+    assert max(sizes) <= 4 and sum(sizes) == 10
+
+
+def test_failed_items_carry_their_error_and_skip_later_stages():
+    later = []
+
+    def fail_odd(x):
+        if x % 2:
+            raise ValueError("odd")
+        return x
+
+    items = Pipeline([Stage("check", fail_odd), Stage("later", lambda x: later.append(x) or x)]).run_all(range(4))
+    assert [item.error for item in items] == [None, "check: ValueError: odd", None, "check: ValueError: odd"]
+    assert sorted(later) == [0, 2]
+
+
+def test_first_item_leaves_before_the_slow_stage_finishes():
+    def slow(x):
+        time.sleep(0.05)
+        return x
+
+    start = time.perf_counter()
+    results = Pipeline([Stage("slow", slow), Stage("second", lambda x: x)]).run(range(6))
+    next(results)
+    first = time.perf_counter() - start
+    assert len(list(results)) == 5
+    assert first < (time.perf_counter() - start) / 2
+
+
+def test_failing_source_ends_the_stream():
+    def source():
+        yield 1
+        raise RuntimeError("crawl failed")
+
+    assert [item.value for item in Pipeline([Stage("id", lambda x: x)]).run_all(source())] == [1]
@@ -0,0 +1,87 @@
+import logging
+import threading
+import pytest
+from scraper import pool as pool_module
+from scraper.pool import DriverPool, pooled_extractor
+
+logger = logging.getLogger("test")
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FlakyFactory:
+    """
+    Creates FakeDrivers, failing the calls whose numbers are in failures.
+    """
+
+    def __init__(self, failures=()):
+        self.calls = 0
+        self.failures = set(failures)
+        self.drivers = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call in self.failures:
+            raise RuntimeError("browser did not start")
+        driver = FakeDriver()
+        with self._lock:
+            self.drivers.append(driver)
+        return driver
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(pool_module, "ACQUIRE_POLL_INTERVAL", 0.01)
+
+
+def test_failed_replace_frees_the_slot():
+    factory = FlakyFactory(failures={2})
+    pool = DriverPool(size=1, factory=factory, lazy=True).start()
+    driver = pool.acquire()
+    pool.replace(driver)
+    assert driver.quit_called
+    assert pool._created == 0
+    # The next acquire creates a new session instead of waiting forever
+    new_driver = pool.acquire(timeout=1)
+    assert isinstance(new_driver, FakeDriver) and new_driver is not driver
+    assert factory.calls == 3
+    pool.close()
+
+
+def test_acquire_times_out_when_pool_is_busy():
+    pool = DriverPool(size=1, factory=FlakyFactory(), lazy=True).start()
+    pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+    pool.close()
+
+
+def test_pooled_extractor_gives_up_instead_of_hanging(monkeypatch):
+    def broken_extract(driver, url, *args, **kwargs):
+        raise RuntimeError("page crashed")
+
+    monkeypatch.setattr(pool_module, "extract_article_details", broken_extract)
+    monkeypatch.setattr(pool_module, "is_session_alive", lambda driver: False)
+    pool = DriverPool(size=1, factory=FlakyFactory(failures={2, 3}), lazy=True).start()
+    result = pooled_extractor(pool, logger, retries=2, acquire_timeout=1)("https://elpais.com/a.html")
+    assert result == {"url": "https://elpais.com/a.html", "title": None, "content": None, "cover_image_url": None}
+    pool.close()
+
+
+def test_failed_start_quits_the_sessions_that_started():
+    factory = FlakyFactory(failures={2})
+    pool = DriverPool(size=3, factory=factory)
+    with pytest.raises(RuntimeError, match="did not start"):
+        pool.start()
+    assert len(factory.drivers) == 2
+    assert all(driver.quit_called for driver in factory.drivers)
+    assert pool._idle.empty()
@@ -0,0 +1,150 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from scraper.static import create_http_session, fetch_article_static
+from utils import resilience
+from utils.image_downloader import ImageStore, download_image, fetch_into_store
+from utils.resilience import AdaptiveCall, CircuitBreaker, breaker_for, is_failure_status
+
+logger = logging.getLogger("test")
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    def iter_content(self, chunk_size):
+        yield self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, **kwargs):
+        return self.response
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = resilience.LatencyTracker()
+    monkeypatch.setattr(resilience, "latency", tracker)
+    return tracker
+
+
+@pytest.mark.parametrize("status, failure", [(200, False), (304, False), (404, False), (429, True), (503, True)])
+def test_is_failure_status(status, failure):
+    assert is_failure_status(status) is failure
+
+
+def test_circuit_opens_after_threshold_and_half_opens():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_after=0)
+    breaker.failure()
+    assert breaker.state == "closed"
+    breaker.failure()
+    assert breaker.state == "open"
+    assert breaker.allow() and breaker.state == "half_open"
+    breaker.success()
+    assert breaker.state == "closed"
+
+
+def test_failed_call_records_no_latency(tracker):
+    with AdaptiveCall("test.call", "host", breaker=True) as call:
+        call.failed()
+    assert tracker.snapshot() == {}
+    assert breaker_for("test.call host").failures == 1
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_fetch_into_store_counts_rate_limiting_as_failure(tmp_path, tracker, status):
+    host = f"fetch-{status}.example"
+    with pytest.raises(requests.HTTPError):
+        fetch_into_store(f"https://{host}/cover.jpg", ImageStore(str(tmp_path)), FakeSession(FakeResponse(status)), logger)
+    assert breaker_for(f"downloader.request {host}").failures == 1
+    assert tracker.snapshot() == {}
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_download_image_counts_rate_limiting_as_failure(tmp_path, tracker, status):
+    host = f"download-{status}.example"
+    assert not download_image(f"https://{host}/cover.jpg", str(tmp_path / "cover.jpg"), logger, FakeSession(FakeResponse(status)))
+    assert breaker_for(f"downloader.request {host}").failures == 1
+    assert tracker.snapshot() == {}
+
+
+def test_successful_download_records_latency(tmp_path, tracker):
+    host = "ok.example"
+    assert download_image(f"https://{host}/cover.jpg", str(tmp_path / "cover.jpg"), logger, FakeSession(FakeResponse(200, b"jpeg")))
+    assert breaker_for(f"downloader.request {host}").failures == 0
+    assert f"downloader.request {host}" in tracker.snapshot()
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """
+    Answers '/down' with 503 and '/flaky' with 503 on every other request.
+    """
+
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        status = 503 if self.path == "/down" or type(self).hits % 2 else 200
+        body = b"<html><body><article><h1>T</h1><h2>C</h2></article></body></html>"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    FlakyHandler.hits = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_repeated_5xx_after_session_retries_open_the_breaker(flaky_server, tracker):
+    session = create_http_session(retries=1)
+    for _ in range(5):
+        with pytest.raises(requests.HTTPError):
+            fetch_article_static(session, f"http://{flaky_server}/down", logger, timeout=5)
+    assert FlakyHandler.hits == 10
+    with pytest.raises(resilience.CircuitOpenError):
+        fetch_article_static(session, f"http://{flaky_server}/down", logger, timeout=5)
+    assert tracker.snapshot() == {}
+
+
+def test_retry_error_counts_as_failure(tracker):
+    with pytest.raises(requests.exceptions.RetryError):
+        with AdaptiveCall("test.retry", "host", breaker=True):
+            raise requests.exceptions.RetryError("too many 503 error responses")
+    assert breaker_for("test.retry host").failures == 1
+
+
+def test_retried_success_records_no_latency(flaky_server, tracker):
+    session = create_http_session(retries=1)
+    result = fetch_article_static(session, f"http://{flaky_server}/flaky", logger, timeout=5)
+    assert result["title"] == "T" and FlakyHandler.hits == 2
+    assert tracker.snapshot() == {}
+    assert breaker_for(f"http.article {flaky_server}").failures == 0
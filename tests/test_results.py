@@ -0,0 +1,55 @@
+import json
+import pytest
+from pipeline.results import ResultSink, arrow_supported, load_columns, read_results
+from pipeline.runner import PipelineItem
+
+FORMATS = ("jsonl", "parquet", "arrow") if arrow_supported() else ("jsonl",)
+
+
+def items(count: int) -> list:
+    return [
+        PipelineItem(idx, {"url": f"https://elpais.com/{idx}.html", "title": f"Título {idx}", "title_en": f"Hello title {idx}",
+                           "content": "Resumen", "crawl_status": "new"}, timings={"extract": 0.5})
+        for idx in range(count)
+    ]
+
+
+def write_run(root, run_id: str, formats, count: int = 3):
+    with ResultSink(str(root), run_id, formats, batch_size=2) as sink:
+        for item in items(count):
+            sink.write(item)
+    return sink
+
+
+def test_jsonl_round_trip(tmp_path):
+    write_run(tmp_path, "run-1", ("jsonl",))
+    records = list(read_results(str(tmp_path)))
+    assert [record["index"] for record in records] == [0, 1, 2]
+    assert records[0]["terms"] == ["hello", "title", "0"]
+    assert records[0]["extract_seconds"] == 0.5
+    assert list(read_results(str(tmp_path), ["url"]))[1] == {"url": "https://elpais.com/1.html"}
+
+
+def test_each_run_is_read_once(tmp_path):
+    write_run(tmp_path, "run-1", FORMATS)
+    write_run(tmp_path, "run-2", FORMATS, count=2)
+    data = load_columns(str(tmp_path), ["run_id", "title_en"])
+    assert data["run_id"] == ["run-1"] * 3 + ["run-2"] * 2
+    assert data["title_en"][3] == "Hello title 0"
+
+
+@pytest.mark.skipif(not arrow_supported(), reason="needs pyarrow")
+def test_parquet_is_preferred_and_projected(tmp_path):
+    sink = write_run(tmp_path, "run-1", ("jsonl", "parquet"))
+    # Make the JSON Lines copy distinguishable: the Parquet file must be the one read
+    with open(sink.paths["jsonl"], "w", encoding="utf-8") as f:
+        f.write(json.dumps({"title": "from jsonl"}) + "\n")
+    assert [record["title"] for record in read_results(str(tmp_path), ["title"])] == ["Título 0", "Título 1", "Título 2"]
+
+
+@pytest.mark.skipif(not arrow_supported(), reason="needs pyarrow")
+def test_unfinished_parquet_falls_back_to_jsonl(tmp_path):
+    sink = write_run(tmp_path, "run-1", ("jsonl", "parquet"))
+    with open(sink.paths["parquet"], "r+b") as f:
+        f.truncate(100)
+    assert len(list(read_results(str(tmp_path), ["url"]))) == 3
@@ -0,0 +1,27 @@
+import logging
+from analyzer.near_duplicates import NearDuplicateIndex
+from pipeline.scrape import build_scrape_pipeline
+from utils.image_downloader import ImageStore
+
+logger = logging.getLogger("test")
+
+ARTICLES = {
+    "a": {"url": "a", "title": "La subida de la vivienda", "content": "Los alquileres suben otra vez", "cover_image_url": None},
+    "b": {"url": "b", "title": "La subida de la vivienda", "content": "Los alquileres suben otra vez", "cover_image_url": None},
+}
+
+
+def extract(url):
+    return dict(ARTICLES.get(url) or {"url": url, "title": None, "content": None, "cover_image_url": None})
+
+
+def run(urls, tmp_path, **kwargs):
+    pipeline = build_scrape_pipeline(extract, logger, image_store=ImageStore(str(tmp_path / "images")),
+                                     skip=("download", "translate"), **kwargs)
+    return [item.value for item in pipeline.run_all(urls)]
+
+
+def test_failed_extractions_are_not_duplicates(tmp_path):
+    articles = run(["failed-1", "failed-2", "a", "b"], tmp_path, duplicates=NearDuplicateIndex())
+    assert [article["duplicate_of"] for article in articles] == [None, None, None, "a"]
+
@@ -0,0 +1,83 @@
+import os
+from scraper import session as session_module
+from scraper.session import ManagedSession, process_tree_rss
+
+
+class FakeDriver:
+    def __init__(self):
+        self.visited = []
+        self.scripts = []
+        self.quit_called = False
+        self.title = "El País"
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script):
+        self.scripts.append(script)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class Factory:
+    def __init__(self):
+        self.drivers = []
+
+    def __call__(self):
+        self.drivers.append(FakeDriver())
+        return self.drivers[-1]
+
+
+def test_recycles_after_max_pages():
+    factory = Factory()
+    session = ManagedSession(max_pages=2, max_rss_mb=None, clear_every=None, factory=factory)
+    for page in range(5):
+        session.get(f"https://elpais.com/{page}")
+
+    assert [d.visited for d in factory.drivers] == [
+        ["https://elpais.com/0", "https://elpais.com/1"],
+        ["https://elpais.com/2", "https://elpais.com/3"],
+        ["https://elpais.com/4"],
+    ]
+    assert factory.drivers[0].quit_called and factory.drivers[1].quit_called
+    assert session.stats["recycles"] == 2
+    assert session.stats["pages"] == 5
+
+
+def test_clears_state_in_place():
+    factory = Factory()
+    session = ManagedSession(max_pages=None, max_rss_mb=None, clear_every=2, factory=factory)
+    for page in range(5):
+        session.get(f"https://elpais.com/{page}")
+
+    assert len(factory.drivers) == 1
+    assert session.stats["clears"] == 2
+    assert len(factory.drivers[0].scripts) == 2
+
+
+def test_recycles_when_rss_exceeds_limit(monkeypatch):
+    factory = Factory()
+    monkeypatch.setattr(ManagedSession, "rss", lambda self: 200 * 1024 * 1024)
+    session = ManagedSession(max_pages=None, max_rss_mb=100, clear_every=None, check_every=1, factory=factory)
+    session.get("https://elpais.com/0")
+    session.get("https://elpais.com/1")
+
+    assert len(factory.drivers) == 2
+    assert session.stats["last_rss"] == 200 * 1024 * 1024
+
+
+def test_delegates_attributes_to_driver():
+    session = ManagedSession(factory=Factory())
+    assert session.title == "El País"
+
+
+def test_process_tree_rss_of_current_process():
+    assert process_tree_rss(os.getpid()) > 0
+
+
+def test_process_tree_rss_without_psutil(monkeypatch):
+    if not os.path.isdir("/proc"):
+        return
+    monkeypatch.setattr(session_module, "psutil", None)
+    assert process_tree_rss(os.getpid()) > 0
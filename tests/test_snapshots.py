@@ -0,0 +1,62 @@
+import gzip
+import logging
+import os
+from benchmarks.fixture_server import article_title, render_article
+from scraper.snapshots import SnapshotArchive, replay_extract
+
+logger = logging.getLogger("test")
+
+
+def url(idx: int) -> str:
+    return f"https://elpais.com/opinion/{idx}.html"
+
+
+def filled_archive(root, count: int = 3) -> SnapshotArchive:
+    archive = SnapshotArchive(str(root))
+    for idx in range(count):
+        archive.add(url(idx), render_article(idx), {"final_url": url(idx), "status": 200})
+    return archive
+
+
+def test_snapshots_round_trip_and_latest_wins(tmp_path):
+    archive = filled_archive(tmp_path)
+    archive.add(url(1), "<html>nueva</html>")
+    metadata, html = archive.get(url(1))
+    assert html == "<html>nueva</html>" and metadata["url"] == url(1)
+    assert len(archive) == 3 and archive.get("https://elpais.com/missing") is None
+    archive.close()
+    # The data file is a valid multi-member gzip stream
+    with gzip.open(os.path.join(str(tmp_path), "pages.gz"), "rb") as f:
+        assert f.read().count(b'"url"') == 4
+
+
+def test_index_is_rebuilt_from_the_data_file(tmp_path):
+    filled_archive(tmp_path).close()
+    os.remove(os.path.join(str(tmp_path), "index.jsonl"))
+    archive = SnapshotArchive(str(tmp_path))
+    assert sorted(archive.urls()) == [url(idx) for idx in range(3)]
+    assert archive.get(url(2))[1] == render_article(2)
+    archive.close()
+
+
+def test_truncated_member_is_ignored_when_rebuilding(tmp_path):
+    filled_archive(tmp_path).close()
+    data_path = os.path.join(str(tmp_path), "pages.gz")
+    with open(data_path, "ab") as f:
+        f.write(b"\x1f\x8b\x08\x00partial")
+    os.remove(os.path.join(str(tmp_path), "index.jsonl"))
+    assert SnapshotArchive(str(tmp_path)).rebuild_index() == 3
+
+
+def test_replay_extracts_archived_pages(tmp_path):
+    archive = filled_archive(tmp_path)
+    results = replay_extract(archive, logger, [url(2), url(0), "https://elpais.com/missing"])
+    assert [result["url"] for result in results] == [url(2), url(0)]
+    assert results[0]["title"] == article_title(2)
+    archive.close()
+
+
+def test_replay_in_worker_processes_matches_in_process(tmp_path):
+    archive = filled_archive(tmp_path, count=5)
+    assert replay_extract(archive, logger, workers=2, chunk_size=2) == replay_extract(archive, logger)
+    archive.close()
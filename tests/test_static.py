@@ -0,0 +1,52 @@
+import logging
+from benchmarks.fixture_server import article_summary, article_title, render_article
+from scraper.static import extract_article_details_http, missing_fields, parse_article_html
+
+logger = logging.getLogger("test")
+
+URL = "https://elpais.com/opinion/2024-01-01/articulo.html"
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, text, url):
+        self.text = text
+        self.url = url
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, html):
+        self.html = html
+
+    def get(self, url, timeout=None):
+        return FakeResponse(self.html, url)
+
+
+def test_parses_the_article_header():
+    result = parse_article_html(render_article(3), URL)
+    assert result["title"] == article_title(3)
+    assert result["content"] == article_summary(3)
+    assert result["cover_image_url"].startswith("https://elpais.com/")
+
+
+def test_skips_markup_inside_scripts_and_resolves_relative_images():
+    html = """<html><head><script>var s = "<article><h1>Fake</h1></article>";</script></head>
+    <body><nav><h1>El País</h1></nav><article><header>
+    <h1> Título real </h1><h2>Resumen</h2><img src="/img/a.jpg"></header></article></body></html>"""
+    result = parse_article_html(html, URL)
+    assert (result["title"], result["content"]) == ("Título real", "Resumen")
+    assert result["cover_image_url"] == "https://elpais.com/img/a.jpg"
+
+
+def test_missing_fields():
+    assert missing_fields({"title": "T", "content": ""}) == ["content"]
+    assert missing_fields({"title": "T", "content": "C"}) == []
+
+
+def test_http_extraction_without_driver_returns_partial_result():
+    result = extract_article_details_http(URL, logger, session=FakeSession("<html><body><article><h1>Solo título</h1></article></body></html>"))
+    assert result["title"] == "Solo título" and result["content"] is None
@@ -0,0 +1,47 @@
+import logging
+from analyzer.text_analysis import TermCounter, count_terms_parallel, ngrams, print_repeated_words, tokenize
+
+logger = logging.getLogger("test")
+
+TITLES = [
+    "The housing crisis, again!",
+    "Housing prices and the crisis",
+    "¿Who pays for the housing crisis?",
+]
+
+
+def test_tokenize_strips_punctuation_and_stopwords():
+    assert list(tokenize("¿Quién paga la «crisis»?")) == ["quién", "paga", "la", "crisis"]
+    assert list(tokenize("The crisis of the housing", {"the", "of"})) == ["crisis", "housing"]
+
+
+def test_ngrams():
+    assert list(ngrams(iter(["a", "b", "c"]), 2)) == ["a b", "b c"]
+    assert list(ngrams(iter(["a"]), 2)) == []
+
+
+def test_counts_bigrams_without_stopwords():
+    counter = TermCounter(2, "en").update(TITLES)
+    assert counter.counts["housing crisis"] == 2
+    assert counter.texts == 3
+
+
+def test_merge_matches_a_single_pass():
+    merged = TermCounter().update(TITLES[:1]).merge(TermCounter().update(TITLES[1:]))
+    assert merged.counts == TermCounter().update(TITLES).counts and merged.texts == 3
+
+
+def test_max_terms_bounds_the_vocabulary():
+    counter = TermCounter(max_terms=2).update(f"common rare{idx}" for idx in range(10))
+    assert len(counter.counts) <= 4
+    assert counter.top_k(1) == [("common", 10)]
+
+
+def test_repeated_words_need_more_than_min_repeats():
+    assert print_repeated_words(TITLES, logger, 2) == [("the", 3), ("housing", 3), ("crisis", 3)]
+    assert print_repeated_words(TITLES, logger, 3) == []
+
+
+def test_parallel_counts_match_serial_counts():
+    texts = TITLES * 20
+    assert count_terms_parallel(texts, workers=2, chunk_size=7).counts == TermCounter().update(texts).counts
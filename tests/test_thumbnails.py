@@ -0,0 +1,36 @@
+import os
+import pytest
+from utils.thumbnails import START_METHOD, ThumbnailPool, make_thumbnail
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def cover(tmp_path):
+    path = str(tmp_path / "cover.jpg")
+    Image.new("RGB", (1600, 900), (200, 30, 30)).save(path, quality=90)
+    return path
+
+
+def test_make_thumbnail_resizes_and_reuses(tmp_path, cover):
+    out_dir = str(tmp_path / "thumbnails")
+    result = make_thumbnail(cover, out_dir, width=640)
+    assert result["status"] == "created"
+    assert (result["width"], result["height"]) == (640, 360)
+    assert result["bytes_out"] == os.path.getsize(result["path"]) < result["bytes_in"]
+    assert make_thumbnail(cover, out_dir, width=640)["status"] == "exists"
+
+
+def test_small_images_are_not_upscaled(tmp_path):
+    path = str(tmp_path / "small.png")
+    Image.new("RGB", (300, 200)).save(path)
+    result = make_thumbnail(path, str(tmp_path / "thumbnails"), width=640, image_format="JPEG")
+    assert (result["width"], result["height"]) == (300, 200)
+
+
+def test_pool_starts_workers_without_forking(tmp_path, cover):
+    assert START_METHOD in ("forkserver", "spawn")
+    with ThumbnailPool(1, str(tmp_path / "thumbnails")) as pool:
+        [result] = pool.map([cover])
+    assert result["width"] == 640
+    assert pool.stats["images"] == 1
@@ -0,0 +1,53 @@
+import logging
+from translator import client as client_module
+from translator.cache import TranslationCache, normalize_text, translate_text_cached
+
+logger = logging.getLogger("test")
+
+
+class FakeTranslate:
+    def __init__(self, result=None):
+        self.calls = []
+        self.result = result
+
+    def __call__(self, texts, logger, source, target):
+        self.calls.append(list(texts))
+        return self.result if self.result is not None else [text.upper() for text in texts]
+
+
+def test_normalize_text_collapses_whitespace():
+    assert normalize_text("  La   casa\n blanca ") == "La casa blanca"
+
+
+def test_only_misses_are_translated(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    translate = FakeTranslate()
+    assert translate_text_cached(["hola", "adiós"], logger, cache=cache, translate=translate) == ["HOLA", "ADIÓS"]
+    assert translate_text_cached(["hola ", "gracias", "hola"], logger, cache=cache, translate=translate) == ["HOLA", "GRACIAS", "HOLA"]
+    assert translate.calls == [["hola", "adiós"], ["gracias"]]
+    cache.close()
+
+
+def test_none_texts_translate_to_none(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    translate = FakeTranslate()
+    assert translate_text_cached(["Hola", None], logger, cache=cache, translate=translate) == ["HOLA", None]
+    assert translate.calls == [["Hola"]]
+    cache.close()
+
+
+def test_missing_translations_are_not_cached(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    # translate_text returns "" without a RAPIDAPI_KEY
+    assert translate_text_cached(["hola"], logger, cache=cache, translate=FakeTranslate("")) == [None]
+    assert cache.stats()["entries"] == 0
+    assert translate_text_cached(["hola"], logger, cache=cache, translate=FakeTranslate()) == ["HOLA"]
+    cache.close()
+
+
+def test_default_upstream_is_the_shared_client(tmp_path, monkeypatch):
+    translate = FakeTranslate()
+    monkeypatch.setattr(client_module, "_default_client", translate)
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    assert translate_text_cached(["hola"], logger, cache=cache) == ["HOLA"]
+    assert translate.calls == [["hola"]]
@@ -0,0 +1,60 @@
+import json
+import logging
+from translator.client import TranslationClient, chunk_texts, encode_json
+
+logger = logging.getLogger("test")
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, body):
+        self._body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._body
+
+
+class RecordingSession:
+    def __init__(self):
+        self.bodies = []
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        self.bodies.append(data)
+        return FakeResponse([text.upper() for text in json.loads(data)["q"]])
+
+
+def test_chunks_respect_item_and_byte_limits():
+    texts = ["opinión sobre la ñ y los acentos" for _ in range(40)]
+    chunks = chunk_texts(texts, max_items=25, max_bytes=300)
+    assert [text for chunk in chunks for text in chunk] == texts
+    for chunk in chunks:
+        assert len(chunk) <= 25
+        assert len(encode_json(chunk)) <= 300 + 2
+
+
+def test_oversized_text_gets_its_own_chunk():
+    assert chunk_texts(["a", "b" * 50, "c"], max_items=10, max_bytes=20) == [["a"], ["b" * 50], ["c"]]
+
+
+def test_request_body_matches_the_measured_size():
+    client = TranslationClient(api_key="key", max_bytes=300, rate=1000)
+    client.session = RecordingSession()
+    texts = ["¿Qué pasará con la educación pública?"] * 12
+    assert client.translate(texts, logger) == [text.upper() for text in texts]
+    for body in client.session.bodies:
+        texts_size = len(encode_json(json.loads(body)["q"]))
+        assert texts_size <= 300 + 2
+        assert "ó".encode("utf-8") in body
+
+
+def test_missing_key_returns_no_translations(monkeypatch):
+    monkeypatch.delenv("RAPIDAPI_KEY", raising=False)
+    client = TranslationClient()
+    client.session = RecordingSession()
+    assert client.translate(["hola"], logger) == []
+    assert client.session.bodies == []
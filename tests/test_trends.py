@@ -0,0 +1,54 @@
+import os
+import pytest
+from analyzer.trends import SECONDS_PER_DAY, STORE_FILES, TrendStore
+
+DAY = SECONDS_PER_DAY
+START = 1_700_000_000.0
+
+
+def test_runs_round_trip_after_reopening(tmp_path):
+    store = TrendStore(str(tmp_path))
+    store.add_run({"vivienda": 2, "alquiler": 1}, START)
+    store.add_run({"vivienda": 1, "elecciones": 4}, START + DAY)
+    store = TrendStore(str(tmp_path))
+    assert len(store) == 2 and store.terms == 3
+    assert store.term(store.term_id("elecciones")) == "elecciones"
+    times, counts = store.series("vivienda")
+    assert times.tolist() == [START, START + DAY] and counts.tolist() == [2, 1]
+    assert store.to_dict()["entries"] == 4
+
+
+def test_runs_must_be_in_time_order(tmp_path):
+    store = TrendStore(str(tmp_path))
+    store.add_run({"a": 1}, START)
+    with pytest.raises(ValueError):
+        store.add_run({"a": 1}, START - 1)
+
+
+def test_top_rising_ranks_rising_terms_first(tmp_path):
+    store = TrendStore(str(tmp_path))
+    for day in range(28):
+        store.add_run({"gobierno": 10, "vivienda": 1, "ruido": 1 if day == 27 else 0}, START + day * DAY)
+    for day in range(28, 35):
+        store.add_run({"gobierno": 10, "vivienda": 8, "ruido": 1}, START + day * DAY)
+    rising = store.top_rising(7, 28, k=2, now=START + 34 * DAY + 1)
+    assert rising[0]["term"] == "vivienda"
+    assert rising[0]["window_count"] == 56 and rising[0]["baseline_count"] == 28
+    assert "gobierno" not in [entry["term"] for entry in rising]
+
+
+def test_torn_appends_are_repaired(tmp_path):
+    store = TrendStore(str(tmp_path))
+    store.add_run({"vivienda": 2}, START)
+    # A crash in the middle of appending a run leaves partial elements
+    for name in ("run_times", "vocab_offsets", "run_ptr", "counts", "vocab"):
+        with open(os.path.join(str(tmp_path), STORE_FILES[name][0]), "ab") as f:
+            f.write(b"\x01\x02\x03")
+    store = TrendStore(str(tmp_path))
+    store.add_run({"vivienda": 1, "alquiler": 3}, START + DAY)
+    store.add_run({"alquiler": 1}, START + 2 * DAY)
+    store = TrendStore(str(tmp_path))
+    assert store.to_dict()["last_run"] == START + 2 * DAY
+    assert store.term_id("alquiler") == 1
+    assert store.series("alquiler")[1].tolist() == [0, 3, 1]
+    assert store.series("vivienda")[1].tolist() == [2, 1, 0]
@@ -0,0 +1,41 @@
+import pytest
+from types import SimpleNamespace
+from selenium.common.exceptions import TimeoutException
+from scraper.waits import wait_for_dom
+
+
+class FakeDriver:
+    def __init__(self, value=True, error=None):
+        self.timeouts = SimpleNamespace(script=30)
+        self.value = value
+        self.error = error
+        self.script_timeouts = []
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+        self.timeouts.script = seconds
+
+    def execute_async_script(self, script, *args):
+        if self.error:
+            raise self.error
+        return self.value
+
+
+def test_short_wait_keeps_script_timeout():
+    driver = FakeDriver()
+    assert wait_for_dom(driver, "return true;", timeout=5) is True
+    assert driver.script_timeouts == []
+
+
+def test_long_wait_restores_script_timeout():
+    driver = FakeDriver(value=None)
+    with pytest.raises(TimeoutException):
+        wait_for_dom(driver, "return false;", timeout=60)
+    assert driver.script_timeouts == [65, 30]
+
+
+def test_script_timeout_restored_when_script_fails():
+    driver = FakeDriver(error=RuntimeError("session lost"))
+    with pytest.raises(RuntimeError):
+        wait_for_dom(driver, "return true;", timeout=45)
+    assert driver.timeouts.script == 30
@@ -1,20 +1,35 @@
 import os
 import requests
 import logging
+from urllib.parse import urlparse
+from utils.metrics import timed
+from utils.resilience import AdaptiveCall
 
 logger = logging.getLogger(__name__)
 
+RAPIDAPI_TRANSLATE_URL = "https://rapid-translate-multi-traduction.p.rapidapi.com/t"
 
-def translate_text(texts: list, logger, source: str = "es", target: str = "en") -> list:
+# Bounds of the request timeout when no explicit timeout is given
+TRANSLATE_TIMEOUTS = {"default": 15, "floor": 3, "ceiling": 45}
+
+
+@timed("translator.translate_text")
+def translate_text(texts: list, logger, source: str = "es", target: str = "en", url: str = None, timeout: float = None) -> list:
     """
     Translate text using the Rapid Translate Multi Traduction API.
+
+    The endpoint can be overridden with the url argument or the
+    RAPIDAPI_TRANSLATE_URL environment variable, e.g. to use a local stand-in server.
+    Without an explicit timeout, the request timeout follows recent latencies
+    of the endpoint, and after repeated failures calls fail fast with
+    CircuitOpenError until the endpoint is tried again.
     """
     RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
     if not RAPIDAPI_KEY:
         logger.error("Missing RAPIDAPI_KEY. Please set it as an environment variable.")
         return ""
         
-    url = "https://rapid-translate-multi-traduction.p.rapidapi.com/t"
+    url = url or os.getenv("RAPIDAPI_TRANSLATE_URL", RAPIDAPI_TRANSLATE_URL)
     payload = {
         "from": source,
         "to": target,
@@ -27,8 +42,9 @@ def translate_text(texts: list, logger, source: str = "es", target: str = "en")
         "x-rapidapi-host": "rapid-translate-multi-traduction.p.rapidapi.com"
     }
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=15)
-        response.raise_for_status()
+        with AdaptiveCall("translator.request", urlparse(url).netloc, timeout, breaker=True, **TRANSLATE_TIMEOUTS) as call:
+            response = requests.post(url, json=payload, headers=headers, timeout=call.timeout)
+            response.raise_for_status()
         res_json = response.json()
         
         if isinstance(res_json, list):
@@ -37,5 +53,5 @@ def translate_text(texts: list, logger, source: str = "es", target: str = "en")
             raise RuntimeError(f"Unexpected API response format: {res_json}")
         
     except Exception as e:
-        logger.error(f"Translation failed for '{texts}'")
+        logger.error("Translation failed for '%s'", texts)
         raise
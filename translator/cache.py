@@ -0,0 +1,187 @@
+import os
+import time
+import atexit
+import sqlite3
+import logging
+import threading
+import unicodedata
+from translator.client import default_client
+from utils.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+# Default location of the on-disk translation cache
+TRANSLATION_CACHE_PATH = "output/translations.sqlite3"
+
+# Shared cache used when translate_text_cached is called without one
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalizes text for use as a cache key: NFC form with collapsed whitespace.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class TranslationCache:
+    """
+    Persistent SQLite cache of translations keyed by (source, target, normalized text).
+
+    Entries older than max_age seconds are evicted, and once the cache holds
+    more than max_entries the least recently used entries are dropped.
+
+    Args:
+        path (str): SQLite database file (default 'output/translations.sqlite3')
+        max_entries (int): Maximum number of cached translations
+        max_age (float): Maximum age of an entry in seconds (None keeps entries forever)
+    """
+
+    def __init__(self, path: str = TRANSLATION_CACHE_PATH, max_entries: int = 100_000, max_age: float = 90 * 86400):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                text TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (source, target, text)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, source: str, target: str, keys: list) -> dict:
+        """
+        Looks up normalized texts and returns the cached ones as {key: translation}.
+        """
+        if not keys:
+            return {}
+        now = time.time()
+        min_created = now - self.max_age if self.max_age else 0
+        found = {}
+        with self._lock:
+            # SQLite limits the number of bound parameters per statement
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text, translation FROM translations "
+                    f"WHERE source = ? AND target = ? AND created_at >= ? AND text IN ({placeholders})",
+                    (source, target, min_created, *chunk),
+                ).fetchall()
+                found.update(rows)
+            if found:
+                self._conn.executemany(
+                    "UPDATE translations SET last_used = ? WHERE source = ? AND target = ? AND text = ?",
+                    [(now, source, target, key) for key in found],
+                )
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, source: str, target: str, translations: dict):
+        """
+        Stores {normalized text: translation} pairs and applies eviction.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                [(source, target, key, value, now, now) for key, value in translations.items()],
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float):
+        if self.max_age:
+            self._conn.execute("DELETE FROM translations WHERE created_at < ?", (now - self.max_age,))
+        excess = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM translations WHERE (source, target, text) IN "
+                "(SELECT source, target, text FROM translations ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+
+    def stats(self) -> dict:
+        """
+        Returns hit/miss counters and the number of cached entries.
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def default_cache() -> TranslationCache:
+    """
+    Returns the process-wide cache in TRANSLATION_CACHE_PATH, opening it on first use.
+
+    The connection is shared by all callers and closed when the interpreter exits.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TranslationCache()
+            atexit.register(_default_cache.close)
+        return _default_cache
+
+
+@timed("translator.translate_text_cached")
+def translate_text_cached(texts: list, logger, source: str = "es", target: str = "en", cache: TranslationCache = None, translate=None) -> list:
+    """
+    Translates texts, sending only cache misses to the translation API.
+
+    None texts translate to None. When the API gives no translations (e.g.
+    without a RAPIDAPI_KEY), the missed texts translate to None and nothing
+    is cached for them.
+
+    Args:
+        texts (list): Texts to translate
+        cache (TranslationCache): Cache to use (default: default_cache())
+        translate (callable): Upstream function with the translate_text signature
+            (default: default_client(), the chunked TranslationClient)
+
+    Returns:
+        list: Translations in the same order as texts.
+    """
+    cache = cache or default_cache()
+    translate = translate or default_client()
+    keys = [normalize_text(text) if text is not None else None for text in texts]
+    unique_keys = [key for key in dict.fromkeys(keys) if key is not None]
+    found = cache.get_many(source, target, unique_keys)
+    misses = [key for key in unique_keys if key not in found]
+
+    if misses:
+        translated = translate(misses, logger, source, target)
+        if not translated:
+            logger.warning("No translations returned for %d texts, leaving them untranslated.", len(misses))
+        elif not isinstance(translated, list) or len(translated) != len(misses):
+            raise RuntimeError(f"Translation returned {translated!r} for {len(misses)} texts.")
+        else:
+            new_entries = dict(zip(misses, translated))
+            cache.put_many(source, target, new_entries)
+            found.update(new_entries)
+
+    missed = set(misses)
+    logger.info("Translation cache: %d of %d texts served from cache.",
+                sum(key is not None and key not in missed for key in keys), len(keys))
+    return [found.get(key) for key in keys]
@@ -0,0 +1,224 @@
+import os
+import json
+import time
+import random
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from translator.api import RAPIDAPI_TRANSLATE_URL
+from utils.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+# Shared client used when translate_text_cached is called without a translate function
+_default_client = None
+_default_client_lock = threading.Lock()
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how many requests start per second.
+
+    Args:
+        rate (float): Tokens added per second
+        capacity (float): Maximum burst size
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a token is available and takes it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def encode_json(value) -> bytes:
+    """
+    Serializes a request body as compact UTF-8 JSON, keeping non-ASCII
+    characters unescaped so that accented text costs its UTF-8 size on the wire.
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def chunk_texts(texts: list, max_items: int, max_bytes: int) -> list:
+    """
+    Splits texts into consecutive chunks bounded by item count and JSON payload size.
+
+    Sizes are measured with encode_json, the serialization the client sends.
+    A single text larger than max_bytes is sent in a chunk of its own.
+    """
+    chunks, current, size = [], [], 0
+    for text in texts:
+        text_size = len(encode_json(text)) + 1
+        if current and (len(current) >= max_items or size + text_size > max_bytes):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(text)
+        size += text_size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class TranslationClient:
+    """
+    Chunked, concurrent and rate-limited client for the Rapid Translate API.
+
+    Input is split into chunks bounded by item count and payload bytes, which
+    are posted concurrently over one pooled session. Request starts are paced
+    by a token bucket, 429/5xx responses are retried with jittered exponential
+    backoff (honouring Retry-After), and identical chunks requested at the same
+    time by concurrent callers share a single upstream request.
+
+    default_client() is the upstream translator of translate_text_cached,
+    and so of the scrape pipeline and 'cli.py translate'.
+
+    Args:
+        api_key (str): RapidAPI key (default RAPIDAPI_KEY environment variable)
+        url (str): Endpoint (default RAPIDAPI_TRANSLATE_URL environment variable or the public API)
+        max_items (int): Maximum texts per request
+        max_bytes (int): Maximum JSON bytes of texts per request
+        max_workers (int): Concurrent requests per translate call
+        rate (float): Requests per second allowed by the token bucket
+        burst (float): Token bucket capacity
+        retries (int): Retries per chunk for 429/5xx and connection errors
+        backoff (float): Base backoff in seconds
+        timeout (float): Seconds to wait for each response
+    """
+
+    def __init__(self, api_key: str = None, url: str = None, max_items: int = 50, max_bytes: int = 8_000,
+                 max_workers: int = 4, rate: float = 5.0, burst: float = None, retries: int = 4,
+                 backoff: float = 0.5, timeout: float = 15):
+        self.api_key = api_key or os.getenv("RAPIDAPI_KEY")
+        self.url = url or os.getenv("RAPIDAPI_TRANSLATE_URL", RAPIDAPI_TRANSLATE_URL)
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate, burst)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.stats = {"requests": 0, "retries": 0, "merged": 0}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    @timed("translator.TranslationClient.translate")
+    def translate(self, texts: list, logger, source: str = "es", target: str = "en") -> list:
+        """
+        Translates texts and returns the translations in input order.
+
+        Returns an empty list when no RAPIDAPI_KEY is configured.
+        """
+        if not self.api_key:
+            # Same contract as translate_text: no translations, not an exception
+            logger.error("Missing RAPIDAPI_KEY. Please set it as an environment variable.")
+            return []
+        if not texts:
+            return []
+        chunks = chunk_texts(list(texts), self.max_items, self.max_bytes)
+        workers = min(self.max_workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda chunk: self._translate_chunk(chunk, logger, source, target), chunks))
+        logger.info("Translated %d texts in %d requests.", len(texts), len(chunks))
+        return [translation for chunk in results for translation in chunk]
+
+    __call__ = translate
+
+    def _translate_chunk(self, chunk: list, logger, source: str, target: str) -> list:
+        key = (source, target, tuple(chunk))
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+            else:
+                self.stats["merged"] += 1
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(self._post(chunk, logger, source, target))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result()
+
+    @timed("translator.request")
+    def _post(self, chunk: list, logger, source: str, target: str) -> list:
+        # Sent pre-encoded: requests' json= would escape every non-ASCII character
+        # to 6 bytes and overrun the max_bytes budget of chunk_texts
+        body = encode_json({"from": source, "to": target, "q": chunk, "e": ""})
+        headers = {
+            "content-type": "application/json; charset=utf-8",
+            "x-rapidapi-key": self.api_key,
+            "x-rapidapi-host": "rapid-translate-multi-traduction.p.rapidapi.com",
+        }
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            with self._lock:
+                self.stats["requests"] += 1
+            retry_after = None
+            try:
+                response = self.session.post(self.url, data=body, headers=headers, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    res_json = response.json()
+                    if not isinstance(res_json, list) or len(res_json) != len(chunk):
+                        raise RuntimeError(f"Unexpected API response format: {res_json}")
+                    return res_json
+                error = f"HTTP {response.status_code}"
+                retry_after = response.headers.get("Retry-After")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = f"{type(e).__name__}: {e}"
+
+            if attempt == self.retries:
+                logger.error("Translation failed for a chunk of %d texts after %d attempts: %s", len(chunk), attempt + 1, error)
+                raise RuntimeError(f"Translation failed: {error}")
+            # Full jitter keeps concurrent retries from hitting the API in lockstep
+            delay = random.uniform(0, self.backoff * 2 ** attempt)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            with self._lock:
+                self.stats["retries"] += 1
+            logger.warning("Translation request got %s, retrying in %.2fs.", error, delay)
+            time.sleep(delay)
+
+
+def default_client() -> TranslationClient:
+    """
+    Returns the process-wide TranslationClient, creating it on first use.
+
+    Created lazily so that RAPIDAPI_KEY is read after load_dotenv, and shared
+    so that concurrent callers share its session, rate limit and in-flight requests.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = TranslationClient()
+        return _default_client
@@ -1,25 +1,227 @@
 import requests
 import os
+import json
+import hashlib
 import logging
+import mimetypes
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from utils.metrics import timed
+from utils.resilience import AdaptiveCall, is_failure_status
 
 logger = logging.getLogger(__name__)
 
-def download_image(image_url: str, save_path: str, logger) -> bool:
+# Bytes read from the socket and written to disk per chunk
+CHUNK_SIZE = 256 * 1024
+
+# Default directory of the content-addressed image store
+IMAGE_STORE_DIR = "output/images"
+
+# Bounds of the per-host request timeout when no explicit timeout is given
+IMAGE_TIMEOUTS = {"default": 10, "floor": 2, "ceiling": 30}
+
+@timed("downloader.download_image")
+def download_image(image_url: str, save_path: str, logger, session=None, timeout: float = None) -> bool:
     """
     Downloads image from img tag and saves locally
     """
     try:
-        r = requests.get(image_url, stream=True, timeout=10)
+        with AdaptiveCall("downloader.request", urlparse(image_url).netloc, timeout, breaker=True, **IMAGE_TIMEOUTS) as call:
+            r = (session or requests).get(image_url, stream=True, timeout=call.timeout)
+            if is_failure_status(r.status_code):
+                call.failed()
         if r.status_code == 200:
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
             with open(save_path, 'wb') as f:
-                for chunk in r.iter_content(1024):
+                for chunk in r.iter_content(CHUNK_SIZE):
                     f.write(chunk)
-            logger.info(f"Image downloaded: {save_path}")
+            logger.info("Image downloaded: %s", save_path)
             return True
         else:
-            logger.warning(f"Image URL {image_url} could not be fetched, status: {r.status_code}")
+            logger.warning("Image URL %s could not be fetched, status: %s", image_url, r.status_code)
             return False
     except Exception as e:
-        logger.error(f"Failed to download image {image_url}")
-        raise
\ No newline at end of file
+        logger.error("Failed to download image %s", image_url)
+        raise
+
+
+def create_image_session(pool_size: int = 8) -> requests.Session:
+    """
+    Creates a keep-alive session whose connection pool matches the download concurrency.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class ImageStore:
+    """
+    Content-addressed image store.
+
+    Images are saved as '<root>/<sha256[:2]>/<sha256><ext>', so identical images
+    are stored once and files are never overwritten by later runs. An index
+    maps each image URL to its file and the ETag/Last-Modified validators of
+    the last response, which are sent back as conditional request headers.
+
+    Args:
+        root (str): Directory of the store (default 'output/images')
+    """
+
+    def __init__(self, root: str = IMAGE_STORE_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        self._index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                self._index = json.load(f)
+
+    def lookup(self, image_url: str) -> dict:
+        """
+        Returns the index entry for a URL if its file is still on disk.
+        """
+        with self._lock:
+            entry = self._index.get(image_url)
+        if entry and os.path.exists(entry["path"]):
+            return entry
+        return None
+
+    def conditional_headers(self, image_url: str) -> dict:
+        """
+        Builds If-None-Match/If-Modified-Since headers for a previously stored URL.
+        """
+        entry = self.lookup(image_url)
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, image_url: str, response) -> dict:
+        """
+        Streams a 200 response into the store and records it in the index.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb", buffering=CHUNK_SIZE) as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+            sha256 = digest.hexdigest()
+            path = os.path.join(self.root, sha256[:2], sha256 + _image_extension(image_url, response))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if os.path.exists(path):
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        entry = {
+            "path": path,
+            "sha256": sha256,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        with self._lock:
+            self._index[image_url] = entry
+        return entry
+
+    def save(self):
+        """
+        Writes the index to disk atomically.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock:
+            data = json.dumps(self._index, indent=1)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.index_path)
+
+
+def _image_extension(image_url: str, response) -> str:
+    content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+    ext = mimetypes.guess_extension(content_type) if content_type else None
+    if not ext:
+        ext = os.path.splitext(urlparse(image_url).path)[1]
+    return ".jpg" if ext in (None, "", ".jpe", ".jpeg") else ext
+
+
+def _store_request(image_url: str, session: requests.Session, headers: dict, timeout: int):
+    with AdaptiveCall("downloader.request", urlparse(image_url).netloc, timeout, breaker=True, **IMAGE_TIMEOUTS) as call:
+        r = session.get(image_url, headers=headers, stream=True, timeout=call.timeout)
+        if is_failure_status(r.status_code):
+            call.failed()
+    return r
+
+
+@timed("downloader.fetch_into_store")
+def fetch_into_store(image_url: str, store: ImageStore, session: requests.Session, logger, timeout: int = None) -> dict:
+    """
+    Downloads one image into the store with a conditional request.
+
+    A 304 for an image whose stored file is gone by then is fetched again
+    without validators.
+
+    Returns:
+        dict: The store entry, with 'status' set to 'downloaded' or 'not_modified'.
+    """
+    headers = store.conditional_headers(image_url)
+    r = _store_request(image_url, session, headers, timeout)
+    if r.status_code == 304 and headers:
+        r.close()
+        entry = store.lookup(image_url)
+        if entry is not None:
+            logger.info("Image not modified: %s", image_url)
+            return {**entry, "status": "not_modified"}
+        # The stored file went away after the validators were sent
+        r = _store_request(image_url, session, {}, timeout)
+    with r:
+        r.raise_for_status()
+        entry = store.put(image_url, r)
+    logger.info("Image downloaded: %s", entry['path'])
+    return {**entry, "status": "downloaded"}
+
+
+def download_images(image_urls: list, logger, store: ImageStore = None, session=None, max_workers: int = 8, timeout: int = None) -> list:
+    """
+    Downloads many images concurrently into a content-addressed store.
+
+    Args:
+        image_urls (list): Image URLs; None entries are skipped
+        store (ImageStore): Target store (default store under 'output/images')
+        session (requests.Session): Optional shared session
+        max_workers (int): Maximum concurrent downloads (default 8)
+        timeout (int): Seconds to wait for each response (default: adaptive per host)
+
+    Returns:
+        list: Store entries ({ 'path', 'sha256', 'etag', 'last_modified', 'status' })
+        in the same order as image_urls, or None for skipped and failed images.
+    """
+    store = store or ImageStore()
+    session = session or create_image_session(max_workers)
+    unique_urls = list(dict.fromkeys(url for url in image_urls if url))
+
+    def fetch(image_url):
+        try:
+            return fetch_into_store(image_url, store, session, logger, timeout)
+        except Exception as e:
+            logger.warning("Image download failed for %s: %s: %s", image_url, type(e).__name__, e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        entries = dict(zip(unique_urls, executor.map(fetch, unique_urls)))
+    store.save()
+    return [entries.get(url) if url else None for url in image_urls]
@@ -1,8 +1,32 @@
-import logging
 import os
-from selenium.webdriver.remote.webdriver import WebDriver
+import gzip
+import json
+import queue
+import atexit
+import shutil
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# Size at which a session log is rotated, and how many compressed backups are kept
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
 
-def get_bs_logfile_name(driver: WebDriver) -> str:
+TEXT_FORMAT = "%(asctime)s [%(levelname)s]: %(message)s"
+CONSOLE_FORMAT = "%(asctime)s %(levelname)s:%(name)s: %(message)s"
+
+# Attributes every LogRecord has; anything else was passed through 'extra'
+_RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+# Queue listeners of the session loggers, by logger name
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+def get_bs_logfile_name(driver: "WebDriver") -> str:
     """
     Generate a unique logfile name per session using capabilities/session info.
     Assumes BrowserStack SDK injects session details.
@@ -20,27 +44,136 @@ def get_bs_logfile_name(driver: WebDriver) -> str:
         fname = f"logs/session_bstack_{platform}_{browser}_{browser_version}.log"
     return fname
 
-def setup_session_logger(driver) -> logging.Logger:
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats each record as one JSON object per line.
+
+    Fields passed through 'extra' (e.g. extra={"article": 3}) are kept as
+    top-level keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+class GzipRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that compresses rotated files to '<name>.<n>.gz'.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = LOG_MAX_BYTES, backup_count: int = LOG_BACKUP_COUNT):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.namer = lambda name: name + ".gz"
+        self.rotator = _gzip_rotator
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread.
+
+    The stock handler merges msg and args before enqueueing, which would
+    build every message on the scraping thread. Only tracebacks, which refer
+    to live frames, are rendered before the record is handed over.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def _session_handler(path: str, formatter: logging.Formatter, max_bytes: int, backup_count: int):
+    handler = GzipRotatingFileHandler(path, max_bytes, backup_count)
+    # Each run starts a fresh log; the previous one becomes the first backup
+    if os.path.exists(path) and os.path.getsize(path):
+        handler.doRollover()
+    handler.setFormatter(formatter)
+    return handler
+
+def setup_session_logger(driver, max_bytes: int = LOG_MAX_BYTES, backup_count: int = LOG_BACKUP_COUNT,
+                         console: bool = True) -> logging.Logger:
     """
     Sets up a logger that writes to a unique file for this session.
+
+    Calls only put the record on a queue; a listener thread formats it and
+    writes the text log, a JSON Lines log next to it ('.jsonl') and, if
+    console is set, the console. Both files are rotated at max_bytes and
+    the rotated copies gzip-compressed. Call close_session_logger when the
+    session ends to flush the queue.
+
+    Args:
+        driver (WebDriver): Session whose capabilities name the log file
+        max_bytes (int): Size at which a log file is rotated
+        backup_count (int): Number of compressed backups kept
+        console (bool): Also print the records to stderr
     """
     logfile = get_bs_logfile_name(driver)
     os.makedirs(os.path.dirname(logfile), exist_ok=True)
     logger = logging.getLogger(logfile)
+    close_session_logger(logger)
     logger.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s]: %(message)s")
-    fh = logging.FileHandler(logfile, mode='w')
-    fh.setFormatter(formatter)
-    if logger.hasHandlers():
-        logger.handlers.clear()
-    logger.addHandler(fh)
+    handlers = [
+        _session_handler(logfile, logging.Formatter(TEXT_FORMAT), max_bytes, backup_count),
+        _session_handler(os.path.splitext(logfile)[0] + ".jsonl", JsonLinesFormatter(), max_bytes, backup_count),
+    ]
+    if console:
+        stream = logging.StreamHandler()
+        stream.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(stream)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    with _listeners_lock:
+        _listeners[logger.name] = listener
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    # The console copy is written by the listener instead of the root logger
+    logger.propagate = not console
     return logger
 
+def close_session_logger(logger: logging.Logger):
+    """
+    Flushes and closes a logger created by setup_session_logger.
+
+    Blocks until the listener has written every queued record.
+    """
+    with _listeners_lock:
+        listener = _listeners.pop(logger.name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+@atexit.register
+def _close_session_loggers():
+    for name in list(_listeners):
+        close_session_logger(logging.getLogger(name))
+
 def setup_basic_logger():
     """
     Setup basic logging for the entire script
     """
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s %(levelname)s:%(name)s: %(message)s"
+        format=CONSOLE_FORMAT
     )
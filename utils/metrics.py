@@ -0,0 +1,244 @@
+import os
+import json
+import time
+import threading
+import functools
+from scraper.commands import CommandCounter
+
+# Set to a non-empty value other than '0' to collect metrics in local.py and bs_test.py
+METRICS_ENV = "SCRAPER_METRICS"
+
+# Metrics collected by span, timed and watch_driver; None while metrics are off
+_active = None
+
+
+class _Span:
+    """
+    Times one block and records it under its path of enclosing spans.
+    """
+    __slots__ = ("metrics", "name", "path", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        stack = self.metrics._stack()
+        self.path = f"{stack[-1]}/{self.name}" if stack else self.name
+        stack.append(self.path)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        self.metrics._stack().pop()
+        self.metrics.record(self.path, elapsed, exc_type is not None)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Metrics:
+    """
+    Collects timing spans and WebDriver command metrics for one session.
+
+    Spans nest within a thread: a span opened inside another is recorded
+    under the path 'outer/inner'. Each path keeps its call count, error
+    count, total and maximum seconds. Drivers registered with watch have
+    their commands counted and timed by command name.
+    """
+
+    def __init__(self):
+        self.spans = {}
+        self.started = time.time()
+        self._commands = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> list:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def span(self, name: str) -> _Span:
+        """
+        Returns a context manager timing a block as span 'name'.
+        """
+        return _Span(self, name)
+
+    def record(self, path: str, seconds: float, error: bool = False):
+        with self._lock:
+            stats = self.spans.get(path)
+            if stats is None:
+                stats = self.spans[path] = {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            stats["count"] += 1
+            stats["errors"] += error
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    def watch(self, driver) -> CommandCounter:
+        """
+        Counts and times every command the driver sends from now on.
+        """
+        counter = CommandCounter(driver).__enter__()
+        with self._lock:
+            self._commands.append(counter)
+        return counter
+
+    def commands(self) -> dict:
+        """
+        Returns {command: {'count', 'total_seconds'}} summed over all watched drivers.
+        """
+        totals = {}
+        with self._lock:
+            counters = list(self._commands)
+        for counter in counters:
+            for name, count in counter.counts.items():
+                stats = totals.setdefault(name, {"count": 0, "total_seconds": 0.0})
+                stats["count"] += count
+                stats["total_seconds"] += counter.seconds[name]
+        return totals
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = {path: dict(stats) for path, stats in sorted(self.spans.items())}
+        commands = self.commands()
+        for stats in list(spans.values()) + list(commands.values()):
+            stats["mean_seconds"] = stats["total_seconds"] / stats["count"] if stats["count"] else 0.0
+        return {
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(self.started)),
+            "elapsed_seconds": time.time() - self.started,
+            "spans": spans,
+            "webdriver_commands": dict(sorted(commands.items(), key=lambda kv: -kv[1]["count"])),
+            "webdriver_commands_total": sum(stats["count"] for stats in commands.values()),
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Formats the metrics in the Prometheus text exposition format.
+        """
+        data = self.to_dict()
+        lines = []
+
+        def family(name, kind, help_text, label, values):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in values:
+                lines.append(f'{name}{{{label}="{_label_value(key)}"}} {value}')
+
+        spans = data["spans"].items()
+        commands = data["webdriver_commands"].items()
+        family("scraper_span_calls_total", "counter", "Calls of each timing span.", "span",
+               [(path, stats["count"]) for path, stats in spans])
+        family("scraper_span_errors_total", "counter", "Calls of each timing span that raised.", "span",
+               [(path, stats["errors"]) for path, stats in spans])
+        family("scraper_span_seconds_total", "counter", "Seconds spent in each timing span.", "span",
+               [(path, round(stats["total_seconds"], 6)) for path, stats in spans])
+        family("scraper_span_max_seconds", "gauge", "Longest single call of each timing span.", "span",
+               [(path, round(stats["max_seconds"], 6)) for path, stats in spans])
+        family("scraper_webdriver_commands_total", "counter", "WebDriver commands sent, by command.", "command",
+               [(name, stats["count"]) for name, stats in commands])
+        family("scraper_webdriver_command_seconds_total", "counter", "Round-trip seconds of WebDriver commands, by command.", "command",
+               [(name, round(stats["total_seconds"], 6)) for name, stats in commands])
+        return "\n".join(lines) + "\n"
+
+    def export(self, logfile: str) -> tuple:
+        """
+        Writes the metrics next to a session log file.
+
+        Args:
+            logfile (str): Session log path, e.g. from get_bs_logfile_name
+
+        Returns:
+            (str, str): Paths of the JSON and Prometheus text files.
+        """
+        base = os.path.splitext(logfile)[0]
+        json_path, prom_path = f"{base}.metrics.json", f"{base}.prom"
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        with open(prom_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        return json_path, prom_path
+
+
+def _label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def enable_metrics(metrics: Metrics = None) -> Metrics:
+    """
+    Starts collecting metrics process-wide and returns the collector.
+    """
+    global _active
+    _active = metrics or Metrics()
+    return _active
+
+
+def enable_metrics_from_env() -> Metrics:
+    """
+    Enables metrics when the SCRAPER_METRICS environment variable is set.
+
+    Returns:
+        Metrics: The collector, or None when metrics stay off.
+    """
+    if os.getenv(METRICS_ENV, "") not in ("", "0"):
+        return enable_metrics()
+    return None
+
+
+def disable_metrics():
+    global _active
+    _active = None
+
+
+def active_metrics() -> Metrics:
+    return _active
+
+
+def span(name: str):
+    """
+    Times a block as span 'name' when metrics are on; a shared no-op otherwise.
+    """
+    metrics = _active
+    return _NULL_SPAN if metrics is None else metrics.span(name)
+
+
+def timed(name: str):
+    """
+    Decorator recording every call of a function as span 'name'.
+
+    With metrics off the wrapper costs one global lookup per call.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            metrics = _active
+            if metrics is None:
+                return fn(*args, **kwargs)
+            with metrics.span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def watch_driver(driver):
+    """
+    Registers a driver with the active metrics, if any.
+    """
+    metrics = _active
+    if metrics is not None:
+        metrics.watch(driver)
+    return driver
@@ -0,0 +1,270 @@
+import sys
+import math
+import time
+import logging
+import threading
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of calling a dependency whose circuit breaker is open.
+    """
+
+
+class LatencyHistogram:
+    """
+    Streaming histogram of latencies in exponentially sized buckets.
+
+    Bucket bounds grow by 'growth' from min_seconds, so percentiles are
+    accurate to within that factor with a fixed number of counters. Once
+    'window' samples are counted, all counts are halved, so recent samples
+    outweigh old ones and the percentiles follow changing conditions.
+    """
+
+    def __init__(self, min_seconds: float = 0.001, growth: float = 1.15, buckets: int = 96, window: int = 200):
+        self.min_seconds = min_seconds
+        self.growth = growth
+        self.window = window
+        self.counts = [0.0] * buckets
+        self.total = 0.0
+        self._log_growth = math.log(growth)
+
+    def record(self, seconds: float):
+        if seconds <= self.min_seconds:
+            idx = 0
+        else:
+            idx = min(len(self.counts) - 1, math.ceil(math.log(seconds / self.min_seconds) / self._log_growth))
+        self.counts[idx] += 1
+        self.total += 1
+        if self.total >= self.window:
+            self.counts = [count / 2 for count in self.counts]
+            self.total /= 2
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q-th quantile (0 < q <= 1), or None when empty.
+        """
+        if not self.total:
+            return None
+        rank = q * self.total
+        seen = 0.0
+        for idx, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.min_seconds * self.growth ** idx
+        return self.min_seconds * self.growth ** (len(self.counts) - 1)
+
+
+class LatencyTracker:
+    """
+    Keeps a LatencyHistogram per (operation, target) and derives timeouts from it.
+
+    A target is whatever the latency depends on, such as a host name or a
+    browser/platform label, so a slow mobile grid does not stretch the
+    timeouts of a fast desktop browser.
+    """
+
+    def __init__(self, percentile: float = 0.99, headroom: float = 2.0, min_samples: int = 5):
+        self.percentile = percentile
+        self.headroom = headroom
+        self.min_samples = min_samples
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, target: str, seconds: float):
+        with self._lock:
+            histogram = self._histograms.get((operation, target))
+            if histogram is None:
+                histogram = self._histograms[(operation, target)] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def timeout(self, operation: str, target: str, default: float, floor: float, ceiling: float) -> float:
+        """
+        Returns headroom times the recent percentile latency, clamped to [floor, ceiling].
+
+        Until min_samples latencies were recorded, default is returned.
+        """
+        with self._lock:
+            histogram = self._histograms.get((operation, target))
+            if histogram is None or histogram.total < self.min_samples:
+                return default
+            observed = histogram.percentile(self.percentile)
+        return min(ceiling, max(floor, observed * self.headroom))
+
+    def snapshot(self) -> dict:
+        """
+        Returns {'operation target': {'samples', 'p50', 'p90', 'p99'}} for reporting.
+        """
+        with self._lock:
+            return {
+                f"{operation} {target}": {
+                    "samples": round(histogram.total, 1),
+                    "p50": histogram.percentile(0.5),
+                    "p90": histogram.percentile(0.9),
+                    "p99": histogram.percentile(0.99),
+                }
+                for (operation, target), histogram in self._histograms.items()
+            }
+
+
+class CircuitBreaker:
+    """
+    Stops calling a dependency after consecutive failures.
+
+    After failure_threshold failures in a row the circuit opens and calls are
+    refused for reset_after seconds. Then a single trial call is let through:
+    success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_after: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.state = "closed"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_after:
+                self.state = "half_open"
+                return True
+            return False
+
+    def success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning("Circuit for %s opened after %d failures.", self.name, self.failures)
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+# Shared by every AdaptiveCall unless another tracker is passed
+latency = LatencyTracker()
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(name: str, failure_threshold: int = 5, reset_after: float = 30.0) -> CircuitBreaker:
+    """
+    Returns the shared circuit breaker for a dependency, creating it on first use.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, failure_threshold, reset_after)
+        return breaker
+
+
+def driver_target(driver) -> str:
+    """
+    Labels a WebDriver session by platform, device and browser for latency tracking.
+    """
+    caps = getattr(driver, "capabilities", None) or {}
+    parts = (caps.get("platformName") or caps.get("platform"), caps.get("deviceName"), caps.get("browserName"))
+    return "/".join(str(part) for part in parts if part) or "unknown"
+
+
+def _is_timeout(exc) -> bool:
+    if isinstance(exc, requests.Timeout):
+        return True
+    # Selenium is not imported here, so HTTP-only callers start without it; an
+    # exception can only be a Selenium timeout once Selenium has been loaded
+    selenium_exceptions = sys.modules.get("selenium.common.exceptions")
+    return selenium_exceptions is not None and isinstance(exc, selenium_exceptions.TimeoutException)
+
+
+def is_failure_status(status: int) -> bool:
+    """
+    True for HTTP statuses that mean the dependency is failing or rate limiting: 5xx and 429.
+    """
+    return status >= 500 or status == 429
+
+
+def _is_dependency_failure(exc) -> bool:
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return is_failure_status(exc.response.status_code)
+    # RetryError: a session's urllib3 Retry gave up on repeated 5xx/429 responses
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError))
+
+
+class AdaptiveCall:
+    """
+    Context manager giving a call its timeout and recording how it went.
+
+    On entry the circuit breaker of the target is checked (raising
+    CircuitOpenError when open) and 'timeout' is set: the explicit timeout
+    if one was given, otherwise one derived from recent latencies. On exit
+    the elapsed time is recorded; a timed-out call records its timeout, so
+    timeouts that are too tight grow. Timeouts, connection errors, 5xx and
+    429 responses count as breaker failures; use failed() to report a
+    failure that did not raise (e.g. a 429 response checked with
+    is_failure_status). Failed calls record no latency sample, so fast
+    error responses do not shrink the timeout; use skip_sample() for a call
+    whose elapsed time is not one request's latency (e.g. retried with
+    backoff by the session).
+
+    Usage:
+        with AdaptiveCall("translator.request", host, None, **TRANSLATE_TIMEOUTS) as call:
+            response = requests.post(url, json=payload, timeout=call.timeout)
+
+    Args:
+        operation (str): Operation name, e.g. 'wait.article_header'
+        target (str): What the latency depends on, e.g. a host name
+        timeout (float): Explicit timeout; None derives it from latencies
+        default (float): Timeout used until enough latencies were seen
+        floor (float): Smallest derived timeout
+        ceiling (float): Largest derived timeout
+        breaker (bool): Guard the target with a circuit breaker
+        tracker (LatencyTracker): Tracker to use (default: shared tracker)
+    """
+
+    def __init__(self, operation: str, target: str, timeout: float = None, default: float = 10,
+                 floor: float = 1, ceiling: float = 30, breaker: bool = False, tracker: LatencyTracker = None):
+        self.operation = operation
+        self.target = target
+        self.tracker = tracker or latency
+        self.breaker = breaker_for(f"{operation} {target}") if breaker else None
+        self.timeout = timeout if timeout is not None else self.tracker.timeout(operation, target, default, floor, ceiling)
+        self._failed = False
+        self._skip_sample = False
+
+    def failed(self):
+        self._failed = True
+
+    def skip_sample(self):
+        self._skip_sample = True
+
+    def __enter__(self):
+        if self.breaker is not None and not self.breaker.allow():
+            raise CircuitOpenError(f"Circuit for {self.breaker.name} is open, skipping the call.")
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._start
+        if exc is None and not self._failed:
+            if not self._skip_sample:
+                self.tracker.record(self.operation, self.target, elapsed)
+        elif _is_timeout(exc):
+            self.tracker.record(self.operation, self.target, max(elapsed, self.timeout))
+        if self.breaker is not None:
+            if self._failed or (exc is not None and _is_dependency_failure(exc)):
+                self.breaker.failure()
+            else:
+                self.breaker.success()
+        return None
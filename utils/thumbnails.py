@@ -0,0 +1,174 @@
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from scraper.images import COVER_IMAGE_WIDTH
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Default directory of the generated thumbnails
+THUMBNAIL_DIR = "output/thumbnails"
+
+# Encoder settings per output format
+ENCODER_OPTIONS = {
+    "WEBP": {"method": 4},
+    "JPEG": {"optimize": True, "progressive": True},
+}
+
+FORMAT_EXTENSIONS = {"WEBP": ".webp", "JPEG": ".jpg"}
+
+# Worker processes are started fresh instead of forked: the pool is created
+# while logging, browser and HTTP threads run, and a child forked while one
+# of them holds a lock (logging, imports) can deadlock
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def thumbnails_supported() -> bool:
+    """
+    True when Pillow is installed, so thumbnails can be made.
+    """
+    return Image is not None
+
+
+def make_thumbnail(source_path: str, out_dir: str = THUMBNAIL_DIR, width: int = COVER_IMAGE_WIDTH,
+                   image_format: str = "WEBP", quality: int = 75) -> dict:
+    """
+    Resizes an image to at most width pixels wide and re-encodes it.
+
+    Images are never upscaled. JPEG sources are decoded at a reduced scale
+    when possible, which is much cheaper than decoding the full image and
+    downsampling it. The output is named after the source file (image store
+    files are named by their SHA-256), so an existing thumbnail is reused.
+
+    Args:
+        source_path (str): Image to resize
+        out_dir (str): Directory the thumbnail is written to
+        width (int): Maximum width of the thumbnail in pixels
+        image_format (str): 'WEBP' or 'JPEG'
+        quality (int): Encoder quality, 1-100
+
+    Returns:
+        dict: { 'source', 'path', 'status' ('created' or 'exists'), 'width',
+        'height', 'bytes_in', 'bytes_out', 'cpu_seconds' }
+    """
+    if Image is None:
+        raise ImportError("Pillow is required for thumbnails: pip install Pillow")
+    image_format = image_format.upper()
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    path = os.path.join(out_dir, f"{name}-{width}q{quality}{FORMAT_EXTENSIONS[image_format]}")
+    result = {"source": source_path, "path": path, "bytes_in": os.path.getsize(source_path)}
+    if os.path.exists(path):
+        with Image.open(path) as thumbnail:
+            result.update(status="exists", width=thumbnail.width, height=thumbnail.height,
+                          bytes_out=os.path.getsize(path), cpu_seconds=0.0)
+        return result
+
+    start = time.process_time()
+    with Image.open(source_path) as image:
+        if image.width > width:
+            image.draft("RGB", (width, image.height * width // image.width))
+        image.thumbnail((width, image.height), Image.LANCZOS, reducing_gap=2.0)
+        if image_format == "JPEG" and image.mode != "RGB":
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+        os.makedirs(out_dir, exist_ok=True)
+        tmp_path = path + ".part"
+        image.save(tmp_path, image_format, quality=quality, **ENCODER_OPTIONS[image_format])
+        os.replace(tmp_path, path)
+        result.update(status="created", width=image.width, height=image.height)
+    result["bytes_out"] = os.path.getsize(path)
+    result["cpu_seconds"] = time.process_time() - start
+    return result
+
+
+class ThumbnailPool:
+    """
+    Makes thumbnails in a pool of worker processes.
+
+    Decoding, resizing and encoding images is CPU-bound and holds the GIL,
+    so it runs in separate processes instead of the scraping threads; a
+    thread calling make only waits for its result. Workers are started
+    with START_METHOD, never forked. Totals of the bytes and CPU time of
+    every thumbnail made are kept in 'stats'.
+
+    Usage:
+        with ThumbnailPool(workers=2) as thumbnails:
+            entry = thumbnails.make("output/images/ab/ab12....jpg")
+
+    Args:
+        workers (int): Worker processes (default: number of CPUs)
+        out_dir (str): Directory the thumbnails are written to
+        width (int): Maximum thumbnail width in pixels
+        image_format (str): 'WEBP' or 'JPEG'
+        quality (int): Encoder quality, 1-100
+    """
+
+    def __init__(self, workers: int = None, out_dir: str = THUMBNAIL_DIR, width: int = COVER_IMAGE_WIDTH,
+                 image_format: str = "WEBP", quality: int = 75):
+        if Image is None:
+            raise ImportError("Pillow is required for thumbnails: pip install Pillow")
+        if image_format.upper() not in FORMAT_EXTENSIONS:
+            raise ValueError(f"Unsupported thumbnail format '{image_format}', use one of {', '.join(FORMAT_EXTENSIONS)}.")
+        self.workers = workers or os.cpu_count() or 1
+        self.options = {"out_dir": out_dir, "width": width, "image_format": image_format, "quality": quality}
+        self.stats = {"images": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0}
+        self._lock = threading.Lock()
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(START_METHOD))
+
+    def submit(self, source_path: str):
+        """
+        Queues a thumbnail and returns its Future.
+        """
+        future = self._executor.submit(make_thumbnail, source_path, **self.options)
+        future.add_done_callback(self._count)
+        return future
+
+    def make(self, source_path: str) -> dict:
+        """
+        Makes one thumbnail, blocking until a worker process has finished it.
+        """
+        return self.submit(source_path).result()
+
+    def map(self, source_paths: list) -> list:
+        """
+        Makes thumbnails for many images in parallel.
+
+        Returns:
+            list: make_thumbnail results in the order of source_paths, or None
+            for images that could not be processed.
+        """
+        results = []
+        for source_path, future in [(path, self.submit(path)) for path in source_paths]:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning("Thumbnail failed for %s: %s: %s", source_path, type(e).__name__, e)
+                results.append(None)
+        return results
+
+    def _count(self, future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        with self._lock:
+            self.stats["images"] += 1
+            self.stats["bytes_in"] += result["bytes_in"]
+            self.stats["bytes_out"] += result["bytes_out"]
+            self.stats["cpu_seconds"] += result["cpu_seconds"]
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ThumbnailPool":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()